@@ -1,10 +1,21 @@
 from __future__ import annotations
+from typing import Optional
 from pydantic_settings import BaseSettings
 from pydantic import Field
 
 class Settings(BaseSettings):
-    database_url: str = Field("sqlite:///franchise.db", alias="DATABASE_URL")
+    # unset -> app/data/franchise.db (see app/models/database.py)
+    database_url: Optional[str] = Field(None, alias="DATABASE_URL")
+    # SQLite performance profile: serve | bulk-load | test | default
+    db_profile: str = Field("serve", alias="DB_PROFILE")
+    db_pool_size: Optional[int] = Field(None, alias="DB_POOL_SIZE")
+    db_max_overflow: Optional[int] = Field(None, alias="DB_MAX_OVERFLOW")
+    db_pool_timeout: Optional[float] = Field(None, alias="DB_POOL_TIMEOUT")
     log_level: str = Field("INFO", alias="LOG_LEVEL")
+    # log API requests slower than this (with their slowest SQL); unset = off
+    slow_request_ms: Optional[float] = Field(None, alias="SLOW_REQUEST_MS")
+    # how long an API worker reuses the data_versions it read for ETags
+    etag_ttl_ms: float = Field(1000, alias="ETAG_TTL_MS")
     default_seed: int = Field(2025, alias="DEFAULT_SEED")
     gdd_version: str = Field("2.15", alias="GDD_VERSION")
 
@@ -6,3 +6,7 @@ def configure_logging() -> None:
         level=getattr(logging, settings.log_level.upper(), logging.INFO),
         format="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
     )
+
+def get_logger(name: str) -> logging.Logger:
+    """App loggers live under "franchise." so one level/handler covers them all."""
+    return logging.getLogger(f"franchise.{name}")
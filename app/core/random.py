@@ -1,29 +1,103 @@
 from __future__ import annotations
+import hashlib
 import random
-from typing import Optional
+from typing import Optional, Tuple, Union
+
+import numpy as np
+
 from .config import settings
 
+# A child stream name: an int (team number, week, ...) or a label ("kickoff")
+StreamName = Union[int, str]
+
+_ENTROPY_MASK = (1 << 128) - 1
+
+
+def _name_key(name: StreamName) -> int:
+    if isinstance(name, str):
+        # stable across processes and runs, unlike hash()
+        return int.from_bytes(hashlib.blake2b(name.encode(), digest_size=8).digest(), "little")
+    if name < 0:
+        raise ValueError(f"stream names must be non-negative ints or strings, got {name}")
+    return int(name)
+
+
 class SeededRNG:
     """
     Deterministic RNG helper. Use one instance per simulation run
     to guarantee reproducibility given the same seed.
+
+    Streams form a tree: child("team", 7) is fixed by the seed and its path
+    of names alone, never by how much the parent (or a sibling) has drawn,
+    so workers can rebuild any stream independently.
+
+    - scalar draws (random/randint/choice/shuffle): random.Random; the root
+      stream is random.Random(seed), as before
+    - array draws (uniform/normal/integers): a NumPy Generator on Philox,
+      a counter-based bit generator. generator(block) opens the stream at
+      counter block * 2**64 without drawing anything before it
     """
-    def __init__(self, seed: Optional[int] = None) -> None:
+    def __init__(self, seed: Optional[int] = None, key: Tuple[int, ...] = ()) -> None:
         self._seed = settings.default_seed if seed is None else seed
-        self._rng = random.Random(self._seed)
+        self._key = tuple(key)
+        if self._key:
+            words = self._state(4)
+            self._rng = random.Random(int(words[0]) << 64 | int(words[1]))
+        else:
+            self._rng = random.Random(self._seed)
+        # the generator's own method, not a wrapper: simulation loops call it per play
+        self.random = self._rng.random
+        self._arrays: Optional[np.random.Generator] = None
 
     @property
     def seed(self) -> int:
         return self._seed
 
+    @property
+    def key(self) -> Tuple[int, ...]:
+        return self._key
+
+    def _state(self, words: int) -> np.ndarray:
+        sequence = np.random.SeedSequence(self._seed & _ENTROPY_MASK, spawn_key=self._key)
+        return sequence.generate_state(words, np.uint64)
+
+    # --- child streams ---
+
+    def child(self, *names: StreamName) -> "SeededRNG":
+        """The stream at this stream's path plus `names`, e.g. rng.child("game", week, home_id)."""
+        return SeededRNG(self._seed, self._key + tuple(_name_key(n) for n in names))
+
+    # --- scalar draws ---
+
     def randint(self, a: int, b: int) -> int:
         return self._rng.randint(a, b)
 
-    def random(self) -> float:
-        return self._rng.random()
-
     def choice(self, seq):
         return self._rng.choice(seq)
 
     def shuffle(self, x) -> None:
         self._rng.shuffle(x)
+
+    # --- array draws ---
+
+    def generator(self, block: int = 0) -> np.random.Generator:
+        """A fresh Generator at counter block `block` of this stream's Philox sequence."""
+        # words 0-1 seed the scalar stream; 2-3 are the Philox key
+        return np.random.Generator(np.random.Philox(key=self._state(4)[2:], counter=block << 64))
+
+    @property
+    def arrays(self) -> np.random.Generator:
+        """The stream's own array Generator (block 0), created on first use."""
+        if self._arrays is None:
+            self._arrays = self.generator()
+        return self._arrays
+
+    def uniform(self, size, low: float = 0.0, high: float = 1.0) -> np.ndarray:
+        return self.arrays.uniform(low, high, size)
+
+    def normal(self, size, loc: float = 0.0, scale: float = 1.0) -> np.ndarray:
+        return self.arrays.normal(loc, scale, size)
+
+    def integers(self, low, high, size) -> np.ndarray:
+        """Integers in [low, high); low/high may be arrays that broadcast against size."""
+        return self.arrays.integers(low, high, size)
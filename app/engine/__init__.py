@@ -1 +1,14 @@
-# package marker
+"""Game engine: team sheets and strengths, the play-by-play simulator, the weekly runner and season odds."""
+from .sheet import TeamSheet, SLOTS, build_sheet, load_team_sheets
+from .game import GameOutcome, GameState, STAT_FIELDS, simulate_game
+from .strength import TeamStrength, invalidate_strengths, strength_of, team_strengths
+from .week import LeagueWeek, WeekGame, game_seed, play_games, run_week, run_weeks, write_week
+from .season import SeasonInputs, SeasonOdds, load_season_inputs, round_robin, simulate_seasons
+
+__all__ = [
+    "TeamSheet", "SLOTS", "build_sheet", "load_team_sheets",
+    "GameOutcome", "GameState", "STAT_FIELDS", "simulate_game",
+    "TeamStrength", "invalidate_strengths", "strength_of", "team_strengths",
+    "LeagueWeek", "WeekGame", "game_seed", "play_games", "run_week", "run_weeks", "write_week",
+    "SeasonInputs", "SeasonOdds", "load_season_inputs", "round_robin", "simulate_seasons",
+]
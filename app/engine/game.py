@@ -0,0 +1,405 @@
+"""
+Play-by-play game simulation.
+
+    sheets = load_team_sheets(session, [home_id, away_id])
+    outcome = simulate_game(sheets[home_id], sheets[away_id], SeededRNG(seed))
+    outcome.home_score, outcome.away_score, outcome.box_score()
+
+Before kickoff the two TeamSheets are reduced to one Matchup per offense
+(completion, sack, interception, run and kicking numbers), so the play loop
+only reads __slots__ attributes, flat stat arrays and the RNG. Same sheets
+and same seed give the same game, play for play.
+
+Model, per scrimmage play: run or pass (by down, distance and score), then
+one outcome draw (sack / interception / completion / incompletion, or
+fumble / carry / breakaway) and one draw for yards, clock and who gets the
+credit. Fourth downs go for it, kick a field goal or punt. Four 15-minute
+quarters, a 10-minute sudden-death overtime, ties allowed.
+
+Stats are kept per depth-chart slot in STAT_FIELDS order, which matches
+the PlayerSeasonStats counters; see scripts/bench_sim.py for throughput.
+"""
+
+from __future__ import annotations
+
+from array import array
+from statistics import NormalDist
+from typing import Dict, Iterator, Optional, Tuple
+
+from app.core.random import SeededRNG
+from .sheet import N_RATINGS, N_SLOTS, R, SLOT, TeamSheet
+
+STAT_FIELDS: Tuple[str, ...] = (
+    "games", "snaps",
+    "pass_att", "pass_cmp", "pass_yds", "pass_td", "pass_int",
+    "rush_att", "rush_yds", "rush_td",
+    "rec_tgt", "rec_rec", "rec_yds", "rec_td",
+    "def_tkl", "def_sack", "def_int", "st_tkl",
+)
+N_STATS = len(STAT_FIELDS)
+(GAMES, SNAPS, PASS_ATT, PASS_CMP, PASS_YDS, PASS_TD, PASS_INT, RUSH_ATT, RUSH_YDS, RUSH_TD,
+ REC_TGT, REC_REC, REC_YDS, REC_TD, DEF_TKL, DEF_SACK, DEF_INT, ST_TKL) = range(N_STATS)
+
+QUARTER_SECONDS = 900
+OVERTIME_SECONDS = 600
+TOUCHBACK_YARDLINE = 25
+
+OFFENSE_SLOTS = ("QB1", "RB1", "WR1", "WR2", "TE1", "OL1", "OL2")
+DEFENSE_SLOTS = ("DL1", "DL2", "LB1", "LB2", "CB1", "CB2", "S1", "S2")
+KICKING_SLOTS = ("K1", "P1", "LS1")
+
+# Share of pass targets, cumulative: WR1, WR2, TE1, rest to RB1
+TARGETS = ((0.36, "WR1"), (0.58, "WR2"), (0.80, "TE1"), (1.01, "RB1"))
+# Who makes the tackle (4 equally likely), after runs and after catches
+RUN_TACKLERS = ("LB1", "LB2", "DL1", "S1")
+PASS_TACKLERS = ("CB1", "CB2", "S1", "LB1")
+
+# Standard normal quantiles: one uniform draw -> one normal deviate, no extra RNG calls
+_NORMAL_STEPS = 1024
+NORMAL = tuple(NormalDist().inv_cdf((i + 0.5) / _NORMAL_STEPS) for i in range(_NORMAL_STEPS))
+
+
+def _base(slot: str) -> int:
+    """Offset of `slot`'s row in a stat array."""
+    return SLOT[slot] * N_STATS
+
+
+class GameState:
+    """Everything that changes between plays; offense is 0 (home) or 1 (away)."""
+    __slots__ = ("quarter", "clock", "down", "distance", "yardline", "offense", "score", "plays", "receives_2nd_half")
+
+    def __init__(self) -> None:
+        self.quarter = 1
+        self.clock = QUARTER_SECONDS
+        self.down = 1
+        self.distance = 10
+        self.yardline = TOUCHBACK_YARDLINE   # yards from the offense's own goal line
+        self.offense = 0
+        self.score = [0, 0]
+        self.plays = [0, 0]                  # offensive snaps per side
+        self.receives_2nd_half = 1
+
+
+class Matchup:
+    """One offense against one defense, reduced to the numbers the play loop reads."""
+    __slots__ = (
+        "pass_rate", "sack", "intercept", "complete", "pass_mean", "pass_sd",
+        "run_mean", "run_sd", "fumble", "breakaway", "rb2_share",
+        "fg_range", "fg_decay", "punt_net", "extra_point", "touchback",
+        # cumulative cut-offs on the outcome draw, so the loop only compares
+        "intercept_cut", "complete_cut", "breakaway_cut", "fumble_cut",
+    )
+
+    def __init__(self, off: TeamSheet, deff: TeamSheet) -> None:
+        o, d = off.ratings, deff.ratings
+        qb, receivers, rusher, line = (_unit(o, u) for u in ("qb", "receivers", "rusher", "line"))
+        pass_rush, backers, coverage = (_unit(d, u) for u in ("pass_rush", "backers", "coverage"))
+
+        def r(slot: str, name: str) -> float:
+            return o[SLOT[slot] * N_RATINGS + R[name]]
+
+        self.pass_rate = 0.57
+        self.sack = _clamp(0.065 - 0.10 * (line - pass_rush) / 100, 0.02, 0.14)
+        self.intercept = _clamp(0.025 - 0.04 * (qb - coverage) / 100, 0.008, 0.06)
+        self.complete = _clamp(0.62 + 0.35 * ((qb + receivers) / 2 - coverage) / 100, 0.45, 0.78)
+        self.pass_mean = 10.5 + 6 * (receivers - coverage) / 100 + 3 * (r("QB1", "throw_power") - 50) / 100
+        self.pass_sd = 7.0
+        self.run_mean = 4.2 + 4 * ((rusher + line) / 2 - (pass_rush + backers) / 2) / 100
+        self.run_sd = 3.5
+        self.fumble = _clamp(0.012 - 0.008 * (r("RB1", "strength") - 50) / 50, 0.004, 0.02)
+        self.breakaway = 0.03
+        # the backup back spells a starter with little stamina
+        self.rb2_share = 0.0 if off.player_ids[SLOT["RB2"]] is None else \
+            _clamp((100 - r("RB1", "stamina")) / 250, 0.05, 0.3)
+        # longest field goal tried, and how fast the make rate drops past 25 yards
+        self.fg_range = 45 + 0.12 * r("K1", "throw_power")
+        self.fg_decay = 0.015 - 0.0001 * (r("K1", "throw_accuracy") - 50)
+        self.punt_net = 38 + 0.12 * (r("P1", "throw_power") - 50)
+        self.extra_point = _clamp(0.94 + 0.001 * (r("K1", "throw_accuracy") - 50), 0.85, 0.99)
+        self.touchback = _clamp(0.5 + 0.006 * (r("K1", "throw_power") - 50), 0.3, 0.8)
+
+        self.intercept_cut = self.sack + self.intercept
+        self.complete_cut = self.intercept_cut + self.complete * (1.0 - self.intercept_cut)
+        self.fumble_cut = 1.0 - self.fumble
+        self.breakaway_cut = self.fumble_cut - self.breakaway
+
+
+# Unit strengths: weighted ratings averaged over the unit's slots
+UNITS: Dict[str, Tuple[Tuple[str, ...], Tuple[Tuple[str, float], ...]]] = {
+    "qb": (("QB1",), (("throw_accuracy", .45), ("throw_power", .25), ("awareness", .30))),
+    "receivers": (("WR1", "WR2", "TE1"), (("catching", .6), ("speed", .4))),
+    "rusher": (("RB1",), (("speed", .4), ("agility", .3), ("strength", .3))),
+    "line": (("OL1", "OL2"), (("strength", .6), ("awareness", .4))),
+    "pass_rush": (("DL1", "DL2"), (("strength", .5), ("tackling", .3), ("speed", .2))),
+    "backers": (("LB1", "LB2"), (("tackling", .5), ("awareness", .3), ("speed", .2))),
+    "coverage": (("CB1", "CB2", "S1", "S2"), (("speed", .5), ("agility", .2), ("awareness", .3))),
+}
+# ... compiled to (index into TeamSheet.ratings, weight) pairs
+_UNIT_TERMS = {
+    unit: tuple((SLOT[slot] * N_RATINGS + R[name], w / len(slots)) for slot in slots for name, w in weights)
+    for unit, (slots, weights) in UNITS.items()
+}
+
+
+def _unit(ratings: array, unit: str) -> float:
+    return sum(ratings[i] * w for i, w in _UNIT_TERMS[unit])
+
+
+def unit_strengths(sheet: TeamSheet) -> Dict[str, float]:
+    """UNITS strengths (0-100) of one team."""
+    return {unit: _unit(sheet.ratings, unit) for unit in UNITS}
+
+
+def _clamp(x: float, lo: float, hi: float) -> float:
+    return lo if x < lo else hi if x > hi else x
+
+
+class GameOutcome:
+    __slots__ = ("home", "away", "home_score", "away_score", "plays", "stats")
+
+    def __init__(self, home: TeamSheet, away: TeamSheet, home_score: int, away_score: int, plays: int,
+                 stats: Tuple[array, array]):
+        self.home, self.away = home, away
+        self.home_score, self.away_score = home_score, away_score
+        self.plays = plays
+        self.stats = stats        # (home, away): slot * N_STATS + stat
+
+    @property
+    def winner_team_id(self) -> Optional[int]:
+        if self.home_score == self.away_score:
+            return None
+        return self.home.team_id if self.home_score > self.away_score else self.away.team_id
+
+    def player_lines(self) -> Iterator[Tuple[int, int, array]]:
+        """(team_id, player_id, stats in STAT_FIELDS order) for every player who appeared."""
+        for sheet, stats in ((self.home, self.stats[0]), (self.away, self.stats[1])):
+            for slot, pid in enumerate(sheet.player_ids):
+                if pid is None:
+                    continue
+                line = stats[slot * N_STATS:(slot + 1) * N_STATS]
+                if line[GAMES]:
+                    yield sheet.team_id, pid, line
+
+    def box_score(self) -> Dict[int, Dict[str, int]]:
+        """player id -> non-zero stats."""
+        return {pid: {f: v for f, v in zip(STAT_FIELDS, line) if v}
+                for _, pid, line in self.player_lines()}
+
+    def __repr__(self) -> str:
+        return f"<GameOutcome {self.home.team_id} {self.home_score}-{self.away_score} {self.away.team_id}>"
+
+
+# Stat-array offsets of the slots the loop credits
+_QB1, _RB1, _RB2 = _base("QB1"), _base("RB1"), _base("RB2")
+_DL1, _LB1, _LB2 = _base("DL1"), _base("LB1"), _base("LB2")
+_TARGETS = tuple((share, _base(slot)) for share, slot in TARGETS)
+_RUN_TACKLERS = tuple(_base(s) for s in RUN_TACKLERS)
+_PASS_TACKLERS = tuple(_base(s) for s in PASS_TACKLERS)
+_INTERCEPTORS = (_base("CB1"), _base("S1"), _base("CB2"), _base("S2"))
+_OFFENSE_BASES = tuple(_base(s) for s in OFFENSE_SLOTS)
+_DEFENSE_BASES = tuple(_base(s) for s in DEFENSE_SLOTS)
+_STARTERS = frozenset(SLOT[s] for s in OFFENSE_SLOTS + DEFENSE_SLOTS + KICKING_SLOTS)
+
+
+def simulate_game(home: TeamSheet, away: TeamSheet, rng: SeededRNG) -> GameOutcome:
+    rand = rng.random
+    normal = NORMAL
+    matchups = (Matchup(home, away), Matchup(away, home))
+    stats = (array("i", bytes(4 * N_SLOTS * N_STATS)), array("i", bytes(4 * N_SLOTS * N_STATS)))
+    # stat-array indexes the loop hits on most plays, as locals
+    qb_att, qb_cmp, qb_yds, qb_td, qb_int = (_QB1 + c for c in (PASS_ATT, PASS_CMP, PASS_YDS, PASS_TD, PASS_INT))
+    run_tacklers = tuple(t + DEF_TKL for t in _RUN_TACKLERS)
+    pass_tacklers = tuple(t + DEF_TKL for t in _PASS_TACKLERS)
+    targets, rb1, rb2 = _TARGETS, _RB1, _RB2
+
+    s = GameState()
+    score, plays = s.score, s.plays
+    kicker = 0 if rand() < 0.5 else 1          # coin toss; the kicker receives after half time
+    s.receives_2nd_half = kicker
+    _kickoff(s, kicker, matchups[kicker], stats[kicker], rand)
+
+    side = -1
+    while True:
+        if s.clock <= 0:
+            if not _next_period(s, matchups, stats, rand):
+                break
+            continue
+        if s.offense != side:
+            side = s.offense
+            m, ost, dst = matchups[side], stats[side], stats[side ^ 1]
+
+        down, distance, yardline = s.down, s.distance, s.yardline
+        # trailing late in the game: go for it on fourth down, throw more
+        chasing = s.clock < 300 and s.quarter >= 4 and score[side ^ 1] > score[side]
+
+        if down == 4 and not chasing and not (distance <= 1 and 40 <= yardline < 80):
+            if 117 - yardline <= m.fg_range:
+                _field_goal(s, side, m, ost, rand)
+            else:
+                _punt(s, m, ost, rand)
+            if s.quarter == 5 and score[0] != score[1]:
+                break                               # sudden death
+            continue
+
+        plays[side] += 1
+        pass_rate = m.pass_rate + (0.18 if distance >= 8 else -0.2 if distance <= 2 else 0.0)
+        if chasing:
+            pass_rate += 0.2
+        # u: run or pass and its outcome. w: yards from its top 10 bits; lower
+        # bits pick the tackler, the clock runoff and the pass target
+        u, w = rand(), rand()
+
+        if u < pass_rate:
+            v = u / pass_rate
+            if v < m.sack:
+                yards = -4 - int(w * 6)
+                dst[(_DL1 if w < 0.7 else _LB1) + DEF_SACK] += 1
+                s.clock -= 35
+            elif v < m.intercept_cut:
+                ost[qb_att] += 1
+                ost[qb_int] += 1
+                dst[_INTERCEPTORS[int(w * 4)] + DEF_INT] += 1
+                spot = yardline + 8 + int(w * 20)
+                s.clock -= 8
+                _change_possession(s, 20 if spot >= 100 else 100 - spot)
+                continue
+            else:
+                pick = (w * 0x1000000) % 1.0
+                for share, target in targets:
+                    if pick < share:
+                        break
+                ost[qb_att] += 1
+                ost[target + REC_TGT] += 1
+                if v < m.complete_cut:
+                    yards = int(m.pass_mean + m.pass_sd * normal[int(w * _NORMAL_STEPS)])
+                    if yards < -2:
+                        yards = -2
+                    elif yards >= 100 - yardline:
+                        yards = 100 - yardline
+                        ost[qb_td] += 1
+                        ost[target + REC_TD] += 1
+                    else:
+                        dst[pass_tacklers[int(w * 0x400000) & 3]] += 1
+                    ost[qb_cmp] += 1
+                    ost[qb_yds] += yards
+                    ost[target + REC_REC] += 1
+                    ost[target + REC_YDS] += yards
+                    s.clock -= 28 + (int(w * 0x10000) & 15)
+                else:
+                    yards = 0
+                    s.clock -= 6
+        else:
+            v = (u - pass_rate) / (1.0 - pass_rate)
+            carrier = rb2 if v < m.rb2_share else rb1
+            ost[carrier + RUSH_ATT] += 1
+            s.clock -= 32 + (int(w * 0x10000) & 15)
+            if v > m.fumble_cut:
+                dst[run_tacklers[int(w * 0x400000) & 3]] += 1
+                _change_possession(s, 100 - yardline)      # fumble lost at the spot
+                continue
+            if v > m.breakaway_cut:
+                yards = 12 + int(w * 60)
+            else:
+                yards = int(m.run_mean + m.run_sd * normal[int(w * _NORMAL_STEPS)] + 0.5)
+            if yards >= 100 - yardline:
+                yards = 100 - yardline
+                ost[carrier + RUSH_TD] += 1
+            else:
+                dst[run_tacklers[int(w * 0x400000) & 3]] += 1
+            ost[carrier + RUSH_YDS] += yards
+
+        yardline += yards
+        if yards >= distance and yardline < 100:
+            s.yardline, s.down = yardline, 1
+            s.distance = 10 if yardline <= 90 else 100 - yardline
+        elif down < 4 and 0 < yardline < 100:
+            s.yardline, s.down, s.distance = yardline, down + 1, distance - yards
+        elif yardline >= 100:
+            score[side] += 6
+            if rand() < m.extra_point:
+                score[side] += 1
+            if s.quarter == 5:
+                break                                   # sudden death
+            _kickoff(s, side, m, ost, rand)
+        elif yardline <= 0:
+            score[side ^ 1] += 2                        # safety; the offense kicks
+            if s.quarter == 5:
+                break
+            _kickoff(s, side, m, ost, rand)
+        else:
+            _change_possession(s, 100 - yardline)        # turnover on downs
+
+    for i, sheet in enumerate((home, away)):
+        _credit_appearances(stats[i], sheet, plays[i], plays[i ^ 1])
+    return GameOutcome(home, away, score[0], score[1], plays[0] + plays[1], stats)
+
+
+def _change_possession(s: GameState, yardline: int) -> None:
+    s.offense ^= 1
+    s.yardline, s.down, s.distance = yardline, 1, 10 if yardline <= 90 else 100 - yardline
+
+
+def _kickoff(s: GameState, kicker: int, m: Matchup, kicker_stats: array, rand) -> None:
+    """`kicker` (0/1, with its Matchup and stats) kicks off; the other side gets the ball."""
+    u = rand()
+    if u < m.touchback:
+        start = TOUCHBACK_YARDLINE
+    else:
+        start = 15 + int((u - m.touchback) / (1.0 - m.touchback) * 25)
+        kicker_stats[_LB2 + ST_TKL] += 1
+    s.clock -= 6
+    s.offense = kicker
+    _change_possession(s, start)
+
+
+def _field_goal(s: GameState, side: int, m: Matchup, ost: array, rand) -> None:
+    distance = 117 - s.yardline
+    s.clock -= 5
+    if rand() < 0.99 - max(0, distance - 25) * m.fg_decay:
+        s.score[side] += 3
+        _kickoff(s, side, m, ost, rand)
+    else:
+        _change_possession(s, max(100 - (s.yardline - 7), 20))   # ball at the spot of the kick
+
+
+def _punt(s: GameState, m: Matchup, ost: array, rand) -> None:
+    landing = s.yardline + int(m.punt_net + 8 * NORMAL[int(rand() * _NORMAL_STEPS)])
+    s.clock -= 8
+    if landing >= 100:
+        _change_possession(s, 20)                            # touchback
+    else:
+        ost[_LB2 + ST_TKL] += 1
+        _change_possession(s, 100 - landing)
+
+
+def _next_period(s: GameState, matchups: Tuple[Matchup, Matchup], stats: Tuple[array, array], rand) -> bool:
+    """Start the next quarter (or overtime); False when the game is over."""
+    if s.quarter == 4:
+        if s.score[0] != s.score[1]:
+            return False
+        s.quarter, s.clock = 5, OVERTIME_SECONDS
+        kicker = 0 if rand() < 0.5 else 1
+        _kickoff(s, kicker, matchups[kicker], stats[kicker], rand)
+        return True
+    if s.quarter == 5:
+        return False
+    s.quarter += 1
+    s.clock = QUARTER_SECONDS
+    if s.quarter == 3:
+        kicker = s.receives_2nd_half ^ 1
+        _kickoff(s, kicker, matchups[kicker], stats[kicker], rand)
+    return True
+
+
+def _credit_appearances(st: array, sheet: TeamSheet, offense_plays: int, defense_plays: int) -> None:
+    """Snaps for the starters on each unit; a game played for starters and anyone with a stat."""
+    for base in _OFFENSE_BASES:
+        st[base + SNAPS] += offense_plays
+    for base in _DEFENSE_BASES:
+        st[base + SNAPS] += defense_plays
+    for slot, pid in enumerate(sheet.player_ids):
+        if pid is None:
+            continue
+        base = slot * N_STATS
+        if slot in _STARTERS or any(st[base + 1:base + N_STATS]):
+            st[base + GAMES] = 1
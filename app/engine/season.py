@@ -0,0 +1,233 @@
+"""
+Monte Carlo season odds: playoff, division and seed probabilities.
+
+    inputs = load_season_inputs(session, season=2025, remaining=schedule_left)
+    odds = simulate_seasons(inputs, seasons=100_000, seed=7)
+    odds.by_team()[team_id]["playoffs"]
+
+Every remaining game is a weighted coin: the home side wins with a logistic
+probability of its strength edge (plus home field), strength being the mean
+of Team.power_rating and the roster's unit strengths (strength.team_strengths,
+cached per team).
+No play-by-play here; see game.simulate_game for single games.
+
+All seasons of a chunk are simulated at once as NumPy arrays:
+- outcomes: one (seasons, games) uniform draw against the per-game odds
+- standings: wins and division wins via a matrix product with the
+  (games, teams) home-minus-away incidence matrix
+- tiebreak (simplified): wins, then division wins, then a coin flip
+- playoffs: per conference, division winners take the top seeds by record,
+  then the best remaining records, PLAYOFF_SEEDS teams in all
+
+Chunks of CHUNK_SEASONS draw from their own SeedSequence substream, so the
+odds depend on the seed and the season count only, never on `workers`
+(process pool) or on which process ran which chunk.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models import GameResult, Team
+from .strength import TeamStrength, team_strengths
+
+PLAYOFF_SEEDS = 7
+CHUNK_SEASONS = 10_000
+HOME_FIELD = 2.0          # strength points
+STRENGTH_SCALE = 8.0      # strength edge that multiplies the win odds by e
+
+# Sort key: wins dominate, division wins break ties, a uniform draw breaks the rest
+_WIN_WEIGHT = 64.0
+# Added to division winners' keys so they seed above every wild card
+_DIVISION_BONUS = 1.0e4
+
+
+@dataclass
+class SeasonInputs:
+    """Team and schedule arrays; team columns are in team_ids order."""
+    team_ids: np.ndarray          # (T,)
+    conference: np.ndarray        # (T,) conference number
+    division: np.ndarray          # (T,) division number, unique across conferences
+    strength: np.ndarray          # (T,) 0-100
+    wins: np.ndarray              # (T,) games won so far (ties count half)
+    division_wins: np.ndarray     # (T,)
+    home: np.ndarray              # (G,) team column of each remaining game's home side
+    away: np.ndarray              # (G,)
+
+    def home_win_prob(self) -> np.ndarray:
+        edge = self.strength[self.home] + HOME_FIELD - self.strength[self.away]
+        return 1.0 / (1.0 + np.exp(-edge / STRENGTH_SCALE))
+
+
+@dataclass
+class SeasonOdds:
+    team_ids: List[int]
+    seasons: int
+    playoffs: np.ndarray          # (T,) probability of any seed
+    division: np.ndarray          # (T,) probability of winning the division
+    seeds: np.ndarray             # (T, PLAYOFF_SEEDS) probability of each seed
+    mean_wins: np.ndarray         # (T,) final wins, averaged
+
+    def by_team(self) -> Dict[int, Dict[str, object]]:
+        return {
+            tid: {
+                "playoffs": float(self.playoffs[i]),
+                "division": float(self.division[i]),
+                "seeds": [float(p) for p in self.seeds[i]],
+                "mean_wins": float(self.mean_wins[i]),
+            }
+            for i, tid in enumerate(self.team_ids)
+        }
+
+
+def team_strength(power_rating: float, roster: Optional[TeamStrength]) -> float:
+    """Mean of the front-office power rating and the roster's average unit strength."""
+    if roster is None:
+        return float(power_rating)
+    return (power_rating + roster.overall) / 2
+
+
+def build_inputs(
+    teams: Sequence[Tuple[int, str, str, float]],
+    remaining: Iterable[Tuple[int, int]],
+    played: Iterable[Tuple[int, int, int, int]] = (),
+) -> SeasonInputs:
+    """
+    teams: (team_id, conference, division, strength); remaining: (home_id, away_id);
+    played: (home_id, away_id, home_score, away_score) of games already final.
+    """
+    team_ids = np.array([t[0] for t in teams], dtype=np.int64)
+    col = {int(tid): i for i, tid in enumerate(team_ids)}
+    conferences = sorted({t[1] for t in teams})
+    divisions = sorted({(t[1], t[2]) for t in teams})
+    conference = np.array([conferences.index(t[1]) for t in teams], dtype=np.int64)
+    division = np.array([divisions.index((t[1], t[2])) for t in teams], dtype=np.int64)
+
+    wins = np.zeros(len(teams))
+    division_wins = np.zeros(len(teams))
+    for home_id, away_id, home_score, away_score in played:
+        h, a = col[home_id], col[away_id]
+        result = 1.0 if home_score > away_score else 0.0 if home_score < away_score else 0.5
+        wins[h] += result
+        wins[a] += 1.0 - result
+        if division[h] == division[a]:
+            division_wins[h] += result
+            division_wins[a] += 1.0 - result
+
+    games = [(col[h], col[a]) for h, a in remaining]
+    home = np.array([g[0] for g in games], dtype=np.int64)
+    away = np.array([g[1] for g in games], dtype=np.int64)
+    return SeasonInputs(team_ids, conference, division, np.array([t[3] for t in teams], dtype=np.float64),
+                        wins, division_wins, home, away)
+
+
+def load_season_inputs(session: Session, season: int, remaining: Iterable[Tuple[int, int]]) -> SeasonInputs:
+    """SeasonInputs for every team: ratings from the roster, records from the season's GameResults."""
+    teams = session.execute(
+        select(Team.id, Team.conference, Team.division, Team.power_rating).order_by(Team.id)
+    ).all()
+    rosters = team_strengths(session, [t.id for t in teams])
+    played = session.execute(
+        select(GameResult.home_team_id, GameResult.away_team_id, GameResult.home_score, GameResult.away_score)
+        .where(GameResult.season == season)
+    ).all()
+    return build_inputs(
+        [(t.id, _value(t.conference), _value(t.division), team_strength(t.power_rating, rosters.get(t.id)))
+         for t in teams],
+        remaining, played,
+    )
+
+
+def _value(enum_or_str) -> str:
+    return getattr(enum_or_str, "value", enum_or_str)
+
+
+def simulate_seasons(inputs: SeasonInputs, seasons: int, seed: int, workers: int = 1,
+                     chunk_seasons: int = CHUNK_SEASONS) -> SeasonOdds:
+    """Playoff/division/seed odds over `seasons` simulated seasons; workers > 1 uses a process pool."""
+    chunks = [(i, min(chunk_seasons, seasons - lo)) for i, lo in enumerate(range(0, seasons, chunk_seasons))]
+    args = [(inputs, n, seed, i) for i, n in chunks]
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 and len(chunks) > 1 else None
+    try:
+        results = list(pool.map(_simulate_chunk, *zip(*args))) if pool else [_simulate_chunk(*a) for a in args]
+    finally:
+        if pool:
+            pool.shutdown(cancel_futures=True)
+
+    seed_counts = sum(r[0] for r in results)
+    division_counts = sum(r[1] for r in results)
+    win_sums = sum(r[2] for r in results)
+    return SeasonOdds(
+        team_ids=[int(t) for t in inputs.team_ids],
+        seasons=seasons,
+        playoffs=seed_counts.sum(axis=1) / seasons,
+        division=division_counts / seasons,
+        seeds=seed_counts / seasons,
+        mean_wins=win_sums / seasons,
+    )
+
+
+def _simulate_chunk(inputs: SeasonInputs, n: int, seed: int, chunk: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(seed counts (T, PLAYOFF_SEEDS), division titles (T,), summed wins (T,)) for n seasons."""
+    rng = np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(chunk,)))
+    n_teams, n_games = len(inputs.team_ids), len(inputs.home)
+
+    # (G, T): +1 in the home team's column, -1 in the away team's; a season's wins
+    # are home_won @ swing + (away games per team)
+    swing = np.zeros((n_games, n_teams), dtype=np.float32)
+    swing[np.arange(n_games), inputs.home] += 1
+    swing[np.arange(n_games), inputs.away] -= 1
+    away_games = np.bincount(inputs.away, minlength=n_teams).astype(np.float32)
+    in_division = inputs.division[inputs.home] == inputs.division[inputs.away]
+    away_division_games = np.bincount(inputs.away[in_division], minlength=n_teams).astype(np.float32)
+
+    home_won = (rng.random((n, n_games), dtype=np.float32) < inputs.home_win_prob().astype(np.float32))
+    home_won = home_won.astype(np.float32)
+    wins = home_won @ swing + away_games + inputs.wins.astype(np.float32)
+    division_wins = home_won[:, in_division] @ swing[in_division] + away_division_games \
+        + inputs.division_wins.astype(np.float32)
+    key = wins * _WIN_WEIGHT + division_wins + rng.random((n, n_teams), dtype=np.float32)
+
+    rows = np.arange(n)
+    division_winner = np.zeros((n, n_teams), dtype=bool)
+    for d in np.unique(inputs.division):
+        members = np.flatnonzero(inputs.division == d)
+        division_winner[rows, members[np.argmax(key[:, members], axis=1)]] = True
+    key += division_winner * np.float32(_DIVISION_BONUS)
+
+    seed_counts = np.zeros((n_teams, PLAYOFF_SEEDS), dtype=np.int64)
+    for c in np.unique(inputs.conference):
+        members = np.flatnonzero(inputs.conference == c)
+        spots = min(PLAYOFF_SEEDS, len(members))
+        order = np.argsort(-key[:, members], axis=1, kind="stable")[:, :spots]   # (n, spots) best first
+        flat = members[order] * PLAYOFF_SEEDS + np.arange(spots)
+        seed_counts += np.bincount(flat.ravel(), minlength=n_teams * PLAYOFF_SEEDS).reshape(n_teams, PLAYOFF_SEEDS)
+
+    return seed_counts, division_winner.sum(axis=0), wins.sum(axis=0, dtype=np.float64)
+
+
+def round_robin(team_ids: Sequence[int], weeks: int) -> List[List[Tuple[int, int]]]:
+    """
+    A simple schedule: `weeks` rounds of the circle method, (home_id, away_id)
+    per game, home and away alternating. Nobody meets the same opponent twice
+    while weeks < len(team_ids). With an odd team count one team rests each week.
+    """
+    ids: List[Optional[int]] = list(team_ids) + ([None] if len(team_ids) % 2 else [])
+    half = len(ids) // 2
+    schedule = []
+    for week in range(weeks):
+        games = []
+        for i in range(half):
+            a, b = ids[i], ids[-1 - i]
+            if a is None or b is None:
+                continue
+            games.append((a, b) if (week + i) % 2 == 0 else (b, a))
+        schedule.append(games)
+        ids = [ids[0], ids[-1]] + ids[1:-1]     # rotate all but the first
+    return schedule
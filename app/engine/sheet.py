@@ -0,0 +1,92 @@
+"""
+Team sheets: a team's depth chart and ratings snapshotted into flat arrays
+before kickoff, so the game loop never touches an ORM object.
+
+- SLOTS: "QB1", "QB2", "RB1", ... (starter and backup for every position)
+- TeamSheet: player ids per slot + an array('f') of ratings per slot
+- load_team_sheets(session, team_ids): two column SELECTs for any number of teams
+- build_sheet(team_id, depth_rows, ratings): same, from plain rows (tests, benches)
+
+An empty slot (no depth-chart row, or a NULL starter/backup) plays with
+REPLACEMENT_RATING in every rating and earns no stats.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import Dict, Iterable, Mapping, Optional, Sequence, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models import DepthChart, Player
+from app.services.importer.schemas import POSITIONS
+
+# Ratings the engine reads, in array order
+RATINGS: Tuple[str, ...] = (
+    "speed", "strength", "agility", "throw_power", "throw_accuracy",
+    "catching", "tackling", "awareness", "stamina",
+)
+R = {name: i for i, name in enumerate(RATINGS)}
+N_RATINGS = len(RATINGS)
+
+SLOTS: Tuple[str, ...] = tuple(f"{pos}{depth}" for pos in POSITIONS for depth in (1, 2))
+SLOT = {name: i for i, name in enumerate(SLOTS)}
+N_SLOTS = len(SLOTS)
+
+REPLACEMENT_RATING = 35.0
+
+
+class TeamSheet:
+    __slots__ = ("team_id", "player_ids", "ratings")
+
+    def __init__(self, team_id: int, player_ids: Sequence[Optional[int]], ratings: array):
+        self.team_id = team_id
+        self.player_ids: Tuple[Optional[int], ...] = tuple(player_ids)   # per slot
+        self.ratings = ratings                                           # slot * N_RATINGS + rating
+
+    def rating(self, slot: str, name: str) -> float:
+        return self.ratings[SLOT[slot] * N_RATINGS + R[name]]
+
+    def __repr__(self) -> str:
+        filled = sum(pid is not None for pid in self.player_ids)
+        return f"<TeamSheet team={self.team_id} {filled}/{N_SLOTS} slots>"
+
+
+def build_sheet(team_id: int, depth_rows: Iterable[Tuple[str, Optional[int], Optional[int]]],
+                ratings: Mapping[int, Sequence[float]]) -> TeamSheet:
+    """
+    depth_rows: (position, starter_player_id, backup_player_id);
+    ratings: player id -> values in RATINGS order.
+    """
+    player_ids: list = [None] * N_SLOTS
+    flat = array("f", [REPLACEMENT_RATING]) * (N_SLOTS * N_RATINGS)
+    for position, starter, backup in depth_rows:
+        for depth, pid in ((1, starter), (2, backup)):
+            slot = SLOT.get(f"{position}{depth}")
+            if slot is None or pid is None or pid not in ratings:
+                continue
+            player_ids[slot] = pid
+            flat[slot * N_RATINGS:(slot + 1) * N_RATINGS] = array("f", ratings[pid])
+    return TeamSheet(team_id, player_ids, flat)
+
+
+def load_team_sheets(session: Session, team_ids: Iterable[int]) -> Dict[int, TeamSheet]:
+    """TeamSheet per team id: one query for the depth charts, one per 500 players on them."""
+    ids = sorted(set(team_ids))
+    depth = session.execute(
+        select(DepthChart.team_id, DepthChart.position, DepthChart.starter_player_id, DepthChart.backup_player_id)
+        .where(DepthChart.team_id.in_(ids))
+    ).all()
+    player_ids = sorted({pid for row in depth for pid in row[2:] if pid is not None})
+    cols = [getattr(Player, name) for name in RATINGS]
+    ratings: Dict[int, Tuple[float, ...]] = {}
+    for i in range(0, len(player_ids), 500):
+        chunk = player_ids[i:i + 500]
+        for pid, *values in session.execute(select(Player.id, *cols).where(Player.id.in_(chunk))):
+            ratings[pid] = tuple(values)
+
+    by_team: Dict[int, list] = {tid: [] for tid in ids}
+    for team_id, position, starter, backup in depth:
+        by_team[team_id].append((position, starter, backup))
+    return {tid: build_sheet(tid, rows, ratings) for tid, rows in by_team.items()}
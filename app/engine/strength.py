@@ -0,0 +1,214 @@
+"""
+Team unit strengths, cached per team and kept current by session events.
+
+    strengths = team_strengths(session, [1, 2])    # {team_id: TeamStrength}
+    strengths[1].units["pass_rush"], strengths[1].overall
+
+- TeamStrength: the game.UNITS ratings (0-100) of one team, plus their mean
+- strength_of(sheet): computed from a TeamSheet, no database
+- team_strengths(session, team_ids=None): cache hits are dict lookups; the
+  misses are loaded together (load_team_sheets: two column SELECTs)
+- invalidate_strengths(bind, team_ids=None): manual eviction, for writes
+  that bypass the Session (raw connections)
+
+A unit is its starters (the slots game.UNITS lists) with DEPTH_WEIGHT of it
+taken from the backups of the unit's positions that do not start there
+(QB2, RB2, TE2). Positions whose two depth slots both start (OL, DL, WR, ...)
+have no depth term.
+
+Eviction is per team: a flush evicts the teams of every new, dirty or
+deleted DepthChart, every Player whose ratings or team_id changed (its
+old and new team, and any cached team with it on the depth chart) and
+every deleted Team. Bulk DML on players/depth_charts through
+session.execute evicts the whole database. Whatever the transaction
+touched is evicted again on commit and rollback, since a team read
+mid-transaction was computed from uncommitted rows.
+
+The cache lives in this process and is keyed by Engine, so two databases
+never share entries. It only sees this process's writes: after another
+process writes the database (an import CLI, generate_and_load, a week run
+elsewhere), call invalidate_strengths(bind) or start a fresh process.
+data_version(session, "players", "depth_charts") (app/models/versions.py)
+tells a long-lived process when that has happened.
+
+Misses are computed outside the lock. Every eviction bumps the engine's
+generation, and a load whose generation moved meanwhile returns its
+strengths without caching them, so an eviction is never undone by a
+load that started before it. A session whose transaction has written
+players or depth charts never caches either: its loads see uncommitted
+rows, which no other session may be served.
+"""
+
+from __future__ import annotations
+
+import threading
+import weakref
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import event, inspect, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.models import DepthChart, Player, Team
+from .game import UNITS, _UNIT_TERMS
+from .sheet import N_RATINGS, RATINGS, R, SLOT, SLOTS, TeamSheet, build_sheet, load_team_sheets
+
+DEPTH_WEIGHT = 0.15
+
+
+def _depth_slots(slots: Tuple[str, ...]) -> List[str]:
+    positions = {slot[:-1] for slot in slots}
+    return [s for s in SLOTS if s[:-1] in positions and s.endswith("2") and s not in slots]
+
+
+def _strength_terms(unit: str) -> Tuple[Tuple[int, float], ...]:
+    slots, weights = UNITS[unit]
+    depth = _depth_slots(slots)
+    if not depth:
+        return _UNIT_TERMS[unit]
+    starters = tuple((i, w * (1 - DEPTH_WEIGHT)) for i, w in _UNIT_TERMS[unit])
+    return starters + tuple((SLOT[slot] * N_RATINGS + R[name], w * DEPTH_WEIGHT / len(depth))
+                            for slot in depth for name, w in weights)
+
+
+# unit -> (index into TeamSheet.ratings, weight) pairs, weights summing to 1
+_STRENGTH_TERMS = {unit: _strength_terms(unit) for unit in UNITS}
+
+# Player columns that move a strength (anything else, e.g. morale, doesn't)
+_PLAYER_FIELDS = RATINGS + ("team_id",)
+
+
+class TeamStrength:
+    __slots__ = ("team_id", "units", "overall", "player_ids")
+
+    def __init__(self, team_id: int, units: Dict[str, float], player_ids: Iterable[Optional[int]]):
+        self.team_id = team_id
+        self.units = units
+        self.overall = sum(units.values()) / len(units)
+        self.player_ids = frozenset(pid for pid in player_ids if pid is not None)
+
+    def __repr__(self) -> str:
+        return f"<TeamStrength team={self.team_id} overall={self.overall:.1f}>"
+
+
+def strength_of(sheet: TeamSheet) -> TeamStrength:
+    ratings = sheet.ratings
+    units = {unit: sum(ratings[i] * w for i, w in terms) for unit, terms in _STRENGTH_TERMS.items()}
+    return TeamStrength(sheet.team_id, units, sheet.player_ids)
+
+
+# --- cache ---
+
+_cache: "weakref.WeakKeyDictionary[Engine, Dict[int, TeamStrength]]" = weakref.WeakKeyDictionary()
+# engine -> eviction count, see team_strengths
+_generations: "weakref.WeakKeyDictionary[Engine, int]" = weakref.WeakKeyDictionary()
+_lock = threading.Lock()
+
+# session.info key: engine -> team ids to evict at transaction end (None = all)
+_TOUCHED_KEY = "team_strength_touched"
+
+
+def _engine_of(bind) -> Engine:
+    return getattr(bind, "engine", bind)
+
+
+def team_strengths(session: Session, team_ids: Optional[Iterable[int]] = None) -> Dict[int, TeamStrength]:
+    """TeamStrength per team id (every team when team_ids is None), from the cache where possible."""
+    engine = _engine_of(session.get_bind())
+    ids = sorted(set(team_ids)) if team_ids is not None else list(session.scalars(select(Team.id).order_by(Team.id)))
+    with _lock:
+        cached = _cache.setdefault(engine, {})
+        found = {tid: cached[tid] for tid in ids if tid in cached}
+        generation = _generations.get(engine, 0)
+    missing = [tid for tid in ids if tid not in found]
+    if missing:
+        sheets = load_team_sheets(session, missing)
+        fresh = {tid: strength_of(sheets.get(tid) or build_sheet(tid, (), {})) for tid in missing}
+        # uncommitted changes of this transaction: visible to this session only
+        dirty = engine in session.info.get(_TOUCHED_KEY, {})
+        with _lock:
+            if not dirty and _generations.get(engine, 0) == generation:
+                _cache.setdefault(engine, {}).update(fresh)
+        found.update(fresh)
+    return {tid: found[tid] for tid in ids}
+
+
+def invalidate_strengths(bind, team_ids: Optional[Iterable[int]] = None) -> None:
+    """Evict `team_ids` (or every team) of the database behind `bind` (Engine, Connection or Session)."""
+    if isinstance(bind, Session):
+        bind = bind.get_bind()
+    _evict(_engine_of(bind), None if team_ids is None else set(team_ids))
+
+
+def _evict(engine: Engine, team_ids: Optional[Set[int]], player_ids: Set[int] = frozenset()) -> Optional[Set[int]]:
+    """Drop team_ids (None = all) plus any cached team with one of player_ids; returns what was targeted."""
+    with _lock:
+        _generations[engine] = _generations.get(engine, 0) + 1
+        cached = _cache.get(engine, {})
+        if team_ids is None:
+            cached.clear()
+            return None
+        if player_ids:
+            team_ids = team_ids | {tid for tid, s in cached.items() if not player_ids.isdisjoint(s.player_ids)}
+        for tid in team_ids:
+            cached.pop(tid, None)
+        return team_ids
+
+
+def _record(session: Session, team_ids: Optional[Set[int]], player_ids: Set[int] = frozenset()) -> None:
+    """Evict now (the session reads its own changes) and again when the transaction ends."""
+    engine = _engine_of(session.get_bind())
+    team_ids = _evict(engine, team_ids, player_ids)
+    touched: Dict[Engine, Optional[Set[int]]] = session.info.setdefault(_TOUCHED_KEY, {})
+    if team_ids is None or (engine in touched and touched[engine] is None):
+        touched[engine] = None
+    else:
+        touched.setdefault(engine, set()).update(team_ids)
+
+
+def _history_values(obj, key: str) -> Set[int]:
+    history = inspect(obj).attrs[key].history
+    return {v for v in (*history.added, *history.unchanged, *history.deleted) if v is not None}
+
+
+def _player_changed(obj) -> bool:
+    attrs = inspect(obj).attrs
+    return any(attrs[key].history.has_changes() for key in _PLAYER_FIELDS)
+
+
+@event.listens_for(Session, "after_flush")
+def _record_flush(session: Session, flush_context):
+    teams: Set[int] = set()
+    players: Set[int] = set()
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, DepthChart):
+            teams |= _history_values(obj, "team_id")
+        elif isinstance(obj, Player):
+            if obj in session.dirty and not _player_changed(obj):
+                continue
+            teams |= _history_values(obj, "team_id")
+            if obj.id is not None:
+                players.add(obj.id)
+        elif isinstance(obj, Team) and obj in session.deleted:
+            teams.add(obj.id)
+    if teams or players:
+        _record(session, teams, players)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _record_dml(orm_execute_state):
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        table = getattr(orm_execute_state.statement, "table", None)
+        if table is None:
+            return
+        if table.name in (Player.__tablename__, DepthChart.__tablename__) \
+                or (table.name == Team.__tablename__ and orm_execute_state.is_delete):
+            _record(orm_execute_state.session, None)
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _evict_on_end(session: Session):
+    touched = session.info.pop(_TOUCHED_KEY, None)
+    for engine, team_ids in (touched or {}).items():
+        _evict(engine, team_ids)
@@ -0,0 +1,188 @@
+"""
+Weekly game runner: a week's games (of one league or many) across a process
+pool, written back in one transaction per league.
+
+    run_week(session, league_seed=2025, season=2025, week=3, schedule=[(1, 2), (3, 4), ...], workers=8)
+
+- game_seed(league_seed, season, week, home_id, away_id): every game's own
+  SeededRNG seed, so a game's result never depends on the worker count,
+  the chunking or the order games finish in
+- play_games(games, workers): WeekGames from any number of leagues ->
+  GameOutcomes in input order. Workers get TeamSheets (a few hundred bytes
+  of ids and ratings per team), never a Session
+- write_week(session, season, week, outcomes): GameResult rows plus
+  PlayerSeasonStats accumulated per (season, team, player), all set-based
+- run_week / run_weeks: load sheets, play, write back
+
+A game is identified by its home and away team: a team plays once a week.
+A week is written once: write_week (and run_weeks, before playing anything)
+raises ValueError if any scheduled team already has a result that week, so
+a retried run cannot double the results and season stats.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import struct
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, NamedTuple, Sequence, Tuple
+
+from sqlalchemy import insert, or_, select, update
+from sqlalchemy.orm import Session
+
+from app.core.random import SeededRNG
+from app.models import GameResult, PlayerSeasonStats
+from .game import STAT_FIELDS, GameOutcome, simulate_game
+from .sheet import TeamSheet, load_team_sheets
+
+_IN_CHUNK = 500
+
+
+class WeekGame(NamedTuple):
+    league_seed: int
+    season: int
+    week: int
+    home: TeamSheet
+    away: TeamSheet
+
+
+class LeagueWeek(NamedTuple):
+    """One league's week for run_weeks: its session and (home_id, away_id) games."""
+    session: Session
+    league_seed: int
+    season: int
+    week: int
+    schedule: Sequence[Tuple[int, int]]
+
+
+def game_seed(league_seed: int, season: int, week: int, home_id: int, away_id: int) -> int:
+    """64-bit seed from the game's identity (blake2b, so it is stable across processes and runs)."""
+    key = struct.pack("<5q", league_seed, season, week, home_id, away_id)
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little")
+
+
+def _play(game: WeekGame) -> Tuple[int, int, int, tuple]:
+    rng = SeededRNG(game_seed(game.league_seed, game.season, game.week, game.home.team_id, game.away.team_id))
+    o = simulate_game(game.home, game.away, rng)
+    return o.home_score, o.away_score, o.plays, o.stats
+
+
+def _play_chunk(games: Sequence[WeekGame]) -> List[Tuple[int, int, int, tuple]]:
+    # only scores and stat arrays go back; the parent still has the sheets
+    return [_play(g) for g in games]
+
+
+def play_games(games: Sequence[WeekGame], workers: int = 1, chunk_games: int = 0) -> List[GameOutcome]:
+    """
+    Simulate `games` (any mix of leagues and weeks); outcomes come back in
+    input order. chunk_games: games per pool task (0 = about 4 tasks per worker).
+    """
+    games = list(games)
+    size = chunk_games or max(1, -(-len(games) // (workers * 4)))
+    chunks = [games[i:i + size] for i in range(0, len(games), size)]
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 and len(chunks) > 1 else None
+    try:
+        results = pool.map(_play_chunk, chunks) if pool else map(_play_chunk, chunks)
+        played = [r for chunk in results for r in chunk]
+    finally:
+        if pool:
+            pool.shutdown(cancel_futures=True)
+    return [GameOutcome(g.home, g.away, *r) for g, r in zip(games, played)]
+
+
+def _check_unplayed(session: Session, season: int, week: int, team_ids: Iterable[int]) -> None:
+    """ValueError if any of team_ids already has a GameResult in (season, week)."""
+    team_ids = sorted(set(team_ids))
+    played = set()
+    for i in range(0, len(team_ids), _IN_CHUNK):
+        chunk = team_ids[i:i + _IN_CHUNK]
+        for home, away in session.execute(
+                select(GameResult.home_team_id, GameResult.away_team_id)
+                .where(GameResult.season == season, GameResult.week == week,
+                       or_(GameResult.home_team_id.in_(chunk), GameResult.away_team_id.in_(chunk)))):
+            played.update({home, away})
+    played &= set(team_ids)
+    if played:
+        raise ValueError(f"season {season} week {week} already has results for teams {sorted(played)}")
+
+
+def write_week(session: Session, season: int, week: int, outcomes: Iterable[GameOutcome]) -> Dict[str, int]:
+    """
+    Insert the week's GameResults and add every player's lines to their
+    PlayerSeasonStats row (created on first appearance). Executemany
+    statements only; the caller owns the transaction. ValueError, before
+    writing anything, if a team in `outcomes` already played that week.
+    """
+    outcomes = list(outcomes)
+    _check_unplayed(session, season, week, (tid for o in outcomes for tid in (o.home.team_id, o.away.team_id)))
+    results = [dict(season=season, week=week, home_team_id=o.home.team_id, away_team_id=o.away.team_id,
+                    winner_team_id=o.winner_team_id, home_score=o.home_score, away_score=o.away_score)
+               for o in outcomes]
+    if results:
+        session.execute(insert(GameResult.__table__), results)
+
+    lines: Dict[Tuple[int, int], List[int]] = {}
+    for o in outcomes:
+        for team_id, player_id, line in o.player_lines():
+            total = lines.setdefault((team_id, player_id), [0] * len(STAT_FIELDS))
+            for i, v in enumerate(line):
+                total[i] += v
+
+    existing: Dict[Tuple[int, int], Tuple[int, ...]] = {}
+    player_ids = sorted({pid for _, pid in lines})
+    cols = [getattr(PlayerSeasonStats, f) for f in STAT_FIELDS]
+    for i in range(0, len(player_ids), _IN_CHUNK):
+        rows = session.execute(
+            select(PlayerSeasonStats.id, PlayerSeasonStats.team_id, PlayerSeasonStats.player_id, *cols)
+            .where(PlayerSeasonStats.season == season,
+                   PlayerSeasonStats.player_id.in_(player_ids[i:i + _IN_CHUNK]))
+        ).all()
+        for row in rows:
+            existing.setdefault((row[1], row[2]), (row[0], *row[3:]))
+
+    new_rows, updates = [], []
+    for (team_id, player_id), total in lines.items():
+        row = existing.get((team_id, player_id))
+        if row is None:
+            new_rows.append(dict(season=season, team_id=team_id, player_id=player_id, **dict(zip(STAT_FIELDS, total))))
+        else:
+            updates.append(dict(id=row[0], **{f: old + v for f, old, v in zip(STAT_FIELDS, row[1:], total)}))
+    if new_rows:
+        session.execute(insert(PlayerSeasonStats.__table__), new_rows)
+    if updates:
+        session.execute(update(PlayerSeasonStats), updates)     # ORM bulk UPDATE by primary key
+    return {"games": len(results), "stats_created": len(new_rows), "stats_updated": len(updates)}
+
+
+def run_weeks(leagues: Sequence[LeagueWeek], workers: int = 1) -> List[Dict[str, int]]:
+    """
+    Every league's week in one pool: load each league's sheets, play all the
+    games together, then write each league back and commit (one transaction
+    per league; a league that fails to write is rolled back and re-raised).
+    """
+    games: List[WeekGame] = []
+    spans = []
+    for lw in leagues:
+        # fail before the pool runs; write_week checks again in the write transaction
+        _check_unplayed(lw.session, lw.season, lw.week, (tid for game in lw.schedule for tid in game))
+        sheets = load_team_sheets(lw.session, {tid for game in lw.schedule for tid in game})
+        lo = len(games)
+        games += [WeekGame(lw.league_seed, lw.season, lw.week, sheets[h], sheets[a]) for h, a in lw.schedule]
+        spans.append((lo, len(games)))
+
+    outcomes = play_games(games, workers=workers)
+    summaries = []
+    for lw, (lo, hi) in zip(leagues, spans):
+        try:
+            summaries.append(write_week(lw.session, lw.season, lw.week, outcomes[lo:hi]))
+            lw.session.commit()
+        except Exception:
+            lw.session.rollback()
+            raise
+    return summaries
+
+
+def run_week(session: Session, *, league_seed: int, season: int, week: int,
+             schedule: Sequence[Tuple[int, int]], workers: int = 1) -> Dict[str, int]:
+    """One league's week: simulate `schedule` and commit the results."""
+    return run_weeks([LeagueWeek(session, league_seed, season, week, schedule)], workers=workers)[0]
@@ -4,6 +4,8 @@ from .depth_chart import DepthChart
 from .game_result import GameResult
 from .player_stats import PlayerSeasonStats
 from .user_profile import UserProfile
+from .import_manifest import ImportManifest, ImportFingerprint
+from .versions import DataVersion  # also installs the session hooks that bump it
 
 __all__ = [
     "Team",
@@ -14,4 +16,7 @@ __all__ = [
     "GameResult",
     "PlayerSeasonStats",
     "UserProfile",
+    "ImportManifest",
+    "ImportFingerprint",
+    "DataVersion",
 ]
@@ -0,0 +1,145 @@
+"""
+Async database helpers (SQLAlchemy 2.x asyncio + aiosqlite).
+
+The same databases and profiles as app/models/database.py, behind an
+AsyncEngine, for the async API endpoints. Scripts and the importer keep
+using the sync helpers.
+
+- async_url(url): sqlite:///x.db -> sqlite+aiosqlite:///x.db
+- make_async_engine(url, profile): AsyncEngine with the profile's PRAGMAs
+- get_async_engine(url, profile): cached AsyncEngine (default: the app database)
+- get_async_session(): FastAPI dependency yielding an AsyncSession
+- get_async_session_scope(): FastAPI dependency returning a session factory,
+  for work that outlives the handler (streaming response bodies)
+- async_session_scope(url, profile): same, as 'async with' for any database/profile
+
+Engines are created on first use, so importing this module does not need
+aiosqlite to be installed.
+"""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from typing import AsyncContextManager, AsyncIterator, Callable, Dict, Optional, Tuple
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.core.config import settings
+from .database import DATABASE_URL, DEFAULT_DATABASE_URL, _apply_pragmas, _resolve_profile, ensure_data_dir
+
+# Async driver per backend, used when the URL names none (or a sync one)
+ASYNC_DRIVERS: Dict[str, str] = {
+    "sqlite": "aiosqlite",
+    "postgresql": "asyncpg",
+}
+
+ASYNC_MEMORY_URL = "sqlite+aiosqlite:///:memory:"
+
+_async_engines: Dict[Tuple[Optional[str], Optional[str]], AsyncEngine] = {}
+_async_sessionmakers: Dict[AsyncEngine, async_sessionmaker] = {}
+
+
+def async_url(url: str) -> str:
+    """Swap the URL's driver for its async counterpart (no-op if already async)."""
+    u = make_url(url)
+    backend = u.get_backend_name()
+    driver = ASYNC_DRIVERS.get(backend)
+    if driver is None or u.get_driver_name() == driver:
+        return url
+    return f"{backend}+{driver}" + url[url.index(":"):]
+
+
+def make_async_engine(url: Optional[str] = None, profile: Optional[str] = None, **engine_kwargs) -> AsyncEngine:
+    """
+    Async twin of database.make_engine: same URL defaults, profiles and
+    Settings pool sizing, with the driver swapped by async_url().
+    """
+    prof = _resolve_profile(profile)
+    if not prof.in_memory and (url or DATABASE_URL) == DEFAULT_DATABASE_URL:
+        ensure_data_dir()
+    url = ASYNC_MEMORY_URL if prof.in_memory else async_url(url or DATABASE_URL)
+    sqlite = make_url(url).get_backend_name() == "sqlite"
+
+    kwargs: Dict[str, object] = {}
+    if prof.in_memory:
+        kwargs["poolclass"] = StaticPool
+    else:
+        for key in ("pool_size", "max_overflow", "pool_timeout"):
+            value = getattr(settings, f"db_{key}")
+            if value is not None:
+                kwargs[key] = value
+    kwargs.update(engine_kwargs)
+
+    new_engine = create_async_engine(url, **kwargs)
+    if sqlite:
+        # connect events fire on the sync facade; the adapted cursor runs the PRAGMAs
+        _apply_pragmas(new_engine.sync_engine, prof.pragmas)
+    return new_engine
+
+
+def get_async_engine(url: Optional[str] = None, profile: Optional[str] = None) -> AsyncEngine:
+    """Return the AsyncEngine for `url`/`profile` (created once, then reused)."""
+    key = (url, profile)
+    if key not in _async_engines:
+        _async_engines[key] = make_async_engine(url, profile)
+    return _async_engines[key]
+
+
+def get_async_sessionmaker(url: Optional[str] = None, profile: Optional[str] = None) -> async_sessionmaker:
+    """Session factory bound to get_async_engine(url, profile), same options as SessionLocal."""
+    bind = get_async_engine(url, profile)
+    if bind not in _async_sessionmakers:
+        _async_sessionmakers[bind] = async_sessionmaker(
+            bind=bind, autoflush=False, expire_on_commit=False, class_=AsyncSession,
+        )
+    return _async_sessionmakers[bind]
+
+
+async def dispose_async_engines() -> None:
+    """Close every cached async engine's pool (e.g. on app shutdown)."""
+    for eng in list(_async_engines.values()):
+        await eng.dispose()
+    _async_engines.clear()
+    _async_sessionmakers.clear()
+
+
+@asynccontextmanager
+async def async_session_scope(url: Optional[str] = None, profile: Optional[str] = None) -> AsyncIterator[AsyncSession]:
+    """
+    Async session for any database/profile:
+
+        async with async_session_scope() as session:
+            teams = (await session.scalars(select(Team))).all()
+
+    Commits if the block succeeds, rolls back on error, always closes.
+    """
+    session = get_async_sessionmaker(url, profile)()
+    try:
+        yield session
+        await session.commit()
+    except Exception:
+        await session.rollback()
+        raise
+    finally:
+        await session.close()
+
+
+async def get_async_session() -> AsyncIterator[AsyncSession]:
+    """FastAPI dependency: one AsyncSession per request on the app database."""
+    async with async_session_scope() as session:
+        yield session
+
+
+SessionScope = Callable[[], AsyncContextManager[AsyncSession]]
+
+
+def get_async_session_scope() -> SessionScope:
+    """
+    FastAPI dependency: async_session_scope itself, for the app database. A
+    streaming body opens its session with it when it starts and closes it
+    when the last chunk is out; a yield dependency's teardown is not tied to
+    the body (it runs before it on some FastAPI versions).
+    """
+    return async_session_scope
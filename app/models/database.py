@@ -1,12 +1,31 @@
 """
 Database helpers for Franchise Football (SQLAlchemy 2.x).
 
-- engine: low-level connector to SQLite
+- engine: low-level connector to SQLite (Settings.database_url, Settings.db_profile),
+  created on first use
 - Base: declarative base class for ORM models
-- SessionLocal: factory that makes DB sessions
-- get_engine(): return the configured engine
-- create_db_and_tables(): import model modules safely, then create tables
-- get_session(): context manager for sessions (use 'with')
+- SessionLocal: factory that makes DB sessions (bound to the app engine on first use)
+- make_engine(url, profile): build an engine with a performance profile
+- get_engine(url, profile): cached engine (default: the app engine)
+- create_db_and_tables(url): import model modules safely, then create tables
+  (skipped when the database already carries the current schema_version())
+- upgrade_schema(bind): add indexes that an existing database is missing
+- get_session(): context manager for sessions on the app engine (use 'with')
+- session_scope(url, profile): same, for any database/profile
+- import_profile(fast): profile for importer CLIs (bulk-load only when fast=True)
+
+Profiles (SQLite PRAGMAs applied on every new connection):
+- "serve":     WAL, synchronous=NORMAL, 256 MB mmap, 64 MB page cache.
+               Many readers alongside one writer; the API default.
+- "bulk-load": journal in memory, synchronous=OFF. Fast imports, but a crash
+               or power loss mid-import can corrupt the file; rebuild it.
+               Opt-in: importer CLIs use it only with --fast (or
+               DB_PROFILE=bulk-load).
+- "test":      in-memory database shared through a StaticPool.
+- "default":   SQLite's own settings.
+
+Importing this module opens nothing: no directories, engines or connections
+until something asks for the database.
 
 Notes (plain language):
 - A "context manager" lets you write 'with get_session() as session:'.
@@ -16,35 +35,142 @@ Notes (plain language):
 from __future__ import annotations
 
 import os
+import zlib
 from contextlib import contextmanager
+from dataclasses import dataclass, field
 from importlib import import_module
-from sqlalchemy import create_engine
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import Index, create_engine, event, func, inspect, select, text
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.pool import StaticPool
+
+from app.core.config import settings
 
 # --- Paths & Engine -------------------------------------------------------
 
-# Ensure the data directory exists (so SQLite file can be created there)
+# Created by make_engine the first time the default database is used
 DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data")
-os.makedirs(DATA_DIR, exist_ok=True)
 
-# SQLite file lives under app/data/franchise.db
-DATABASE_URL = f"sqlite:///{os.path.join(DATA_DIR, 'franchise.db')}"
+# SQLite file lives under app/data/franchise.db unless DATABASE_URL says otherwise
+DEFAULT_DATABASE_URL = f"sqlite:///{os.path.join(DATA_DIR, 'franchise.db')}"
+DATABASE_URL = settings.database_url or DEFAULT_DATABASE_URL
+MEMORY_URL = "sqlite+pysqlite:///:memory:"
 
-# The engine is the low-level connector to SQLite
-engine = create_engine(
-    DATABASE_URL,
-    connect_args={"check_same_thread": False},  # needed for SQLite on Windows with threads
-    future=True,
-)
+
+@dataclass(frozen=True)
+class SQLiteProfile:
+    name: str
+    pragmas: Dict[str, object] = field(default_factory=dict)
+    # True: ignore the URL's file and use one in-memory DB behind a StaticPool
+    in_memory: bool = False
+
+
+PROFILES: Dict[str, SQLiteProfile] = {p.name: p for p in (
+    SQLiteProfile("default"),
+    SQLiteProfile("serve", {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "mmap_size": 256 * 1024 * 1024,
+        "cache_size": -64 * 1024,   # negative = KiB
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+    }),
+    SQLiteProfile("bulk-load", {
+        "journal_mode": "MEMORY",
+        "synchronous": "OFF",
+        "cache_size": -256 * 1024,
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+    }),
+    SQLiteProfile("test", {"synchronous": "OFF"}, in_memory=True),
+)}
+
+
+def _resolve_profile(profile: Optional[str]) -> SQLiteProfile:
+    """The named profile (default: Settings.db_profile); ValueError for a name not in PROFILES."""
+    name = profile or settings.db_profile
+    try:
+        return PROFILES[name]
+    except KeyError:
+        raise ValueError(f"unknown database profile {name!r} (DB_PROFILE); "
+                         f"expected one of {', '.join(sorted(PROFILES))}") from None
+
+
+def import_profile(fast: bool = False) -> Optional[str]:
+    """"bulk-load" when the caller asked for a fast import, else None (= Settings.db_profile)."""
+    return "bulk-load" if fast else None
+
+
+def _apply_pragmas(engine: Engine, pragmas: Dict[str, object]) -> None:
+    """Run the profile's PRAGMAs on every new DBAPI connection."""
+    if not pragmas:
+        return
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+
+def make_engine(url: Optional[str] = None, profile: Optional[str] = None, **engine_kwargs) -> Engine:
+    """
+    Build an engine for `url` (default: Settings.database_url) with a named
+    profile (default: Settings.db_profile). Pool sizing comes from Settings
+    (db_pool_size, db_max_overflow, db_pool_timeout) unless given here.
+    Non-SQLite URLs get the pool settings but no PRAGMAs.
+    """
+    prof = _resolve_profile(profile)
+    url = MEMORY_URL if prof.in_memory else (url or DATABASE_URL)
+    sqlite = make_url(url).get_backend_name() == "sqlite"
+    if url == DEFAULT_DATABASE_URL:
+        ensure_data_dir()
+
+    kwargs: Dict[str, object] = {"future": True}
+    if sqlite:
+        kwargs["connect_args"] = {"check_same_thread": False}  # needed for SQLite on Windows with threads
+    if prof.in_memory:
+        kwargs["poolclass"] = StaticPool
+    else:
+        for key in ("pool_size", "max_overflow", "pool_timeout"):
+            value = getattr(settings, f"db_{key}")
+            if value is not None:
+                kwargs[key] = value
+    kwargs.update(engine_kwargs)
+
+    new_engine = create_engine(url, **kwargs)
+    if sqlite:
+        _apply_pragmas(new_engine, prof.pragmas)
+    return new_engine
+
+
+def ensure_data_dir() -> None:
+    """Make sure app/data exists, so the default SQLite file can be created there."""
+    os.makedirs(DATA_DIR, exist_ok=True)
+
+
+_engines: Dict[Tuple[Optional[str], Optional[str]], Engine] = {}
+
+
+def __getattr__(name: str):
+    # `database.engine` stays available, but is only built when first asked for
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # --- Declarative Base & Session factory -----------------------------------
 
 # Base class for all ORM models (your models should subclass this)
 Base = declarative_base()
 
-# Session factory (creates new DB sessions)
+# Session factory (creates new DB sessions); get_engine() binds it to the app engine
 SessionLocal = sessionmaker(
-    bind=engine,
     autoflush=False,
     autocommit=False,
     expire_on_commit=False,
@@ -65,6 +191,8 @@ def _import_model_modules() -> None:
         "app.models.game_result",
         "app.models.player_season_stats",  # may not exist yet in your repo
         "app.models.user_profile",
+        "app.models.import_manifest",
+        "app.models.versions",
     ]
     for mod in candidates:
         try:
@@ -78,17 +206,100 @@ def _import_model_modules() -> None:
 
 # --- Public Helpers --------------------------------------------------------
 
-def get_engine():
-    """Return the SQLAlchemy engine."""
-    return engine
+def get_engine(url: Optional[str] = None, profile: Optional[str] = None) -> Engine:
+    """
+    Return the engine for `url`/`profile` (created once, then reused).
+    With no arguments this is the app engine.
+    """
+    key = (url, profile)
+    if key not in _engines:
+        _engines[key] = make_engine(url, profile)
+        if key == (None, None):
+            SessionLocal.configure(bind=_engines[key])
+    return _engines[key]
+
+@lru_cache(maxsize=None)
+def schema_version() -> int:
+    """
+    Fingerprint of the declared schema (tables, columns, indexes) as a
+    positive 31-bit int, stored in SQLite's PRAGMA user_version once a
+    database has been brought up to date. Changes whenever a model does.
+    """
+    _import_model_modules()
+    parts = []
+    for table in Base.metadata.sorted_tables:
+        parts.append(table.name)
+        parts += [f"{c.name}:{c.type}:{c.nullable}" for c in table.columns]
+        parts += [f"{ix.name}:{ix.unique}:{','.join(c.name for c in ix.columns)}"
+                  for ix in sorted(table.indexes, key=lambda ix: ix.name)]
+    return (zlib.crc32("\n".join(parts).encode()) & 0x7FFFFFFF) or 1
+
+def _stored_schema_version(conn) -> Optional[int]:
+    """PRAGMA user_version on SQLite; None elsewhere (no marker, always check)."""
+    if conn.dialect.name != "sqlite":
+        return None
+    return conn.execute(text("PRAGMA user_version")).scalar()
 
-def create_db_and_tables() -> None:
+def create_db_and_tables(url: Optional[str] = None, force: bool = False) -> bool:
     """
-    Create all tables if they don't exist.
+    Create all tables if they don't exist (in the app database, or at `url`),
+    then add any indexes that older databases are missing (upgrade_schema).
     Important: we import model modules FIRST so their tables are registered.
+
+    A SQLite database stamped with the current schema_version() is left
+    alone (one PRAGMA read instead of a full inspection); force=True checks
+    anyway. Returns True if the schema was checked, False if skipped.
+    """
+    target = get_engine(url)
+    version = schema_version()
+    with target.connect() as conn:
+        if not force and _stored_schema_version(conn) == version:
+            return False
+    Base.metadata.create_all(target)
+    upgrade_schema(target)
+    if target.dialect.name == "sqlite":
+        with target.begin() as conn:
+            conn.execute(text(f"PRAGMA user_version = {version}"))
+    return True
+
+def upgrade_schema(bind: Optional[Engine] = None) -> List[str]:
+    """
+    Create indexes declared on the models but missing from an existing
+    database (create_all only creates indexes together with new tables).
+    Returns the names of the indexes created.
+
+    A unique index is not created over duplicate rows: ValueError lists the
+    offending keys so the data can be fixed first.
     """
     _import_model_modules()
-    Base.metadata.create_all(engine)
+    created: List[str] = []
+    with (bind or get_engine()).begin() as conn:
+        inspector = inspect(conn)
+        for table in Base.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+            existing = {ix["name"] for ix in inspector.get_indexes(table.name)}
+            for index in sorted(table.indexes, key=lambda ix: ix.name):
+                if index.name in existing:
+                    continue
+                if index.unique:
+                    _check_no_duplicates(conn, index)
+                index.create(conn)
+                created.append(index.name)
+    return created
+
+def _check_no_duplicates(conn, index: Index) -> None:
+    cols = list(index.columns)
+    dupes = conn.execute(
+        select(*cols, func.count()).where(*(c.isnot(None) for c in cols))
+        .group_by(*cols).having(func.count() > 1).limit(5)
+    ).all()
+    if dupes:
+        keys = ", ".join(str(tuple(row[:-1])) for row in dupes)
+        raise ValueError(
+            f"Cannot create unique index {index.name}: duplicate "
+            f"({', '.join(c.name for c in cols)}) values in {index.table.name}, e.g. {keys}"
+        )
 
 @contextmanager
 def get_session():
@@ -103,6 +314,7 @@ def get_session():
     It will COMMIT if all goes well, or ROLLBACK if there is an error,
     and always CLOSE the session at the end.
     """
+    get_engine()  # binds SessionLocal on first use
     session = SessionLocal()
     try:
         yield session
@@ -112,3 +324,21 @@ def get_session():
         raise
     finally:
         session.close()
+
+@contextmanager
+def session_scope(url: Optional[str] = None, profile: Optional[str] = None):
+    """
+    Like get_session(), but for any database/profile, e.g.
+    session_scope(profile=import_profile(fast)) for imports.
+    """
+    factory = sessionmaker(bind=get_engine(url, profile), autoflush=False,
+                           expire_on_commit=False, future=True)
+    session = factory()
+    try:
+        yield session
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
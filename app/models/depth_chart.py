@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-from typing import Optional
+from typing import Dict, List, Optional, Set
 
-from sqlalchemy import CheckConstraint, ForeignKey, Integer, String, UniqueConstraint, event
+from sqlalchemy import CheckConstraint, ForeignKey, Integer, String, UniqueConstraint, inspect, select
 from sqlalchemy.orm import Mapped, mapped_column, relationship, Session
 
 from .database import Base
+from .validation import flush_validator
 
 
 class DepthChart(Base):
@@ -38,29 +39,40 @@ class DepthChart(Base):
         return f"<DepthChart team={self.team_id} pos={self.position} starter={self.starter_player_id} backup={self.backup_player_id}>"
 
 
-def _validate_depth_chart(dc: DepthChart, session: Session) -> None:
-    """Enforce that starter/backup belong to the same team as this DepthChart row."""
-    if dc.starter_player_id is None and dc.backup_player_id is None:
-        return
-
-    if dc.starter_player_id and dc.backup_player_id and dc.starter_player_id == dc.backup_player_id:
-        raise ValueError("starter and backup cannot be the same player")
-
+def _player_team_ids(session: Session, player_ids: Set[int]) -> Dict[int, Optional[int]]:
+    """
+    player id -> team_id for the given ids, in one query per 500 ids. Players
+    already loaded in the session answer from memory (unflushed changes included).
+    """
     from .player import Player
 
-    if dc.starter_player_id is not None:
-        starter = session.get(Player, dc.starter_player_id)
-        if starter is None or starter.team_id != dc.team_id:
-            raise ValueError("starter_player must belong to the same team as the depth chart row")
+    out: Dict[int, Optional[int]] = {}
+    to_query: List[int] = []
+    for pid in player_ids:
+        obj = session.identity_map.get(session.identity_key(Player, pid))
+        if obj is not None and "team_id" in inspect(obj).dict:
+            out[pid] = obj.team_id
+        else:
+            to_query.append(pid)
+    for i in range(0, len(to_query), 500):
+        chunk = to_query[i:i + 500]
+        out.update(session.execute(select(Player.id, Player.team_id).where(Player.id.in_(chunk))).all())
+    return out
+
+
+@flush_validator(DepthChart)
+def _validate_depth_charts(session: Session, rows: List[DepthChart]) -> None:
+    """Enforce that starter/backup belong to the same team as their DepthChart row."""
+    referenced = {pid for dc in rows for pid in (dc.starter_player_id, dc.backup_player_id) if pid is not None}
+    if not referenced:
+        return
+    team_of = _player_team_ids(session, referenced)
+    missing = object()
 
-    if dc.backup_player_id is not None:
-        backup = session.get(Player, dc.backup_player_id)
-        if backup is None or backup.team_id != dc.team_id:
+    for dc in rows:
+        if dc.starter_player_id and dc.backup_player_id and dc.starter_player_id == dc.backup_player_id:
+            raise ValueError("starter and backup cannot be the same player")
+        if dc.starter_player_id is not None and team_of.get(dc.starter_player_id, missing) != dc.team_id:
+            raise ValueError("starter_player must belong to the same team as the depth chart row")
+        if dc.backup_player_id is not None and team_of.get(dc.backup_player_id, missing) != dc.team_id:
             raise ValueError("backup_player must belong to the same team as the depth chart row")
-
-
-@event.listens_for(Session, "before_flush")
-def _depth_chart_before_flush(session: Session, flush_context, instances):
-    for obj in list(session.new) + list(session.dirty):
-        if isinstance(obj, DepthChart):
-            _validate_depth_chart(obj, session)
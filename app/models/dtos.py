@@ -1,6 +1,8 @@
 from __future__ import annotations
-from typing import Optional
-from pydantic import BaseModel, ConfigDict
+from functools import lru_cache
+from typing import List, Optional, Tuple, Type
+from typing_extensions import TypedDict
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 # --- Team DTO ---
 class TeamDTO(BaseModel):
@@ -59,9 +61,103 @@ class GameResultDTO(BaseModel):
     home_score: int
     away_score: int
 
+# --- Team bundle (team page in one response) ---
+class PlayerSummaryDTO(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+    id: int
+    first_name: str
+    last_name: str
+    position: str
+    jersey: int
+
+class DepthChartEntryDTO(BaseModel):
+    position: str
+    starter: Optional[PlayerSummaryDTO]
+    backup: Optional[PlayerSummaryDTO]
+
+class TeamBundleDTO(BaseModel):
+    team: TeamDTO
+    players: List[PlayerDTO]
+    depth_chart: List[DepthChartEntryDTO]
+
+# --- Player Season Stats DTO ---
+class PlayerSeasonStatsDTO(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+    id: int
+    season: int
+    team_id: int
+    player_id: int
+    games: int
+    snaps: int
+    pass_att: int
+    pass_cmp: int
+    pass_yds: int
+    pass_td: int
+    pass_int: int
+    rush_att: int
+    rush_yds: int
+    rush_td: int
+    rec_tgt: int
+    rec_rec: int
+    rec_yds: int
+    rec_td: int
+    def_tkl: int
+    def_sack: int
+    def_int: int
+    st_tkl: int
+
 # --- User Profile DTO ---
 class UserProfileDTO(BaseModel):
     model_config = ConfigDict(from_attributes=True)
     id: int
     display_name: str
     preferred_team_id: Optional[int]
+
+# --- Sparse fieldsets ---
+def parse_fields(dto: Type[BaseModel], raw: str) -> Tuple[str, ...]:
+    """
+    'jersey, id,last_name' -> ('id', 'last_name', 'jersey'): known fields only, in
+    the DTO's own order (so equivalent requests share one cached adapter).
+    ValueError names any unknown field.
+    """
+    wanted = {f.strip() for f in raw.split(",") if f.strip()}
+    unknown = wanted - dto.model_fields.keys()
+    if unknown or not wanted:
+        raise ValueError(f"unknown field(s) {sorted(unknown)}; choose from {', '.join(dto.model_fields)}")
+    return tuple(f for f in dto.model_fields if f in wanted)
+
+
+@lru_cache(maxsize=256)
+def _row_type(dto: Type[BaseModel], fields: Tuple[str, ...]) -> type:
+    return TypedDict(f"{dto.__name__}_" + "_".join(fields),
+                     {f: dto.model_fields[f].annotation for f in fields})
+
+
+@lru_cache(maxsize=256)
+def projection_adapter(dto: Type[BaseModel], fields: Tuple[str, ...]) -> TypeAdapter:
+    """
+    TypeAdapter for a list of plain dicts carrying only `fields` of `dto`, typed
+    like the DTO. Built once per field set; dump_json() serializes the dicts
+    directly, without creating a model instance per row.
+    """
+    return TypeAdapter(List[_row_type(dto, fields)])
+
+
+@lru_cache(maxsize=256)
+def row_adapter(dto: Type[BaseModel], fields: Tuple[str, ...]) -> TypeAdapter:
+    """Same as projection_adapter, for one dict at a time (NDJSON)."""
+    return TypeAdapter(_row_type(dto, fields))
+
+
+def dump_rows(dto: Type[BaseModel], fields: Tuple[str, ...], rows) -> bytes:
+    """
+    JSON array of objects from row tuples whose first len(fields) items are
+    `fields` (extra trailing items are ignored), in one dump_json call.
+    """
+    return projection_adapter(dto, fields).dump_json([dict(zip(fields, row)) for row in rows])
+
+
+def dump_ndjson(dto: Type[BaseModel], fields: Tuple[str, ...], rows) -> bytes:
+    """Like dump_rows, but one JSON object per line (newline-terminated)."""
+    dump = row_adapter(dto, fields).dump_json
+    return b"".join([dump(dict(zip(fields, row))) + b"\n" for row in rows])
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-from typing import Optional
+from typing import List, Optional
 
-from sqlalchemy import CheckConstraint, ForeignKey, Integer, event
+from sqlalchemy import CheckConstraint, ForeignKey, Index, Integer
 from sqlalchemy.orm import Mapped, mapped_column, relationship, Session
 
 from .database import Base
+from .validation import flush_validator
 
 
 class GameResult(Base):
@@ -29,6 +30,7 @@ class GameResult(Base):
     winner_team: Mapped[Optional["Team"]] = relationship(foreign_keys=[winner_team_id])
 
     __table_args__ = (
+        Index("ix_game_results_season_week", "season", "week"),
         CheckConstraint("week >= 1", name="chk_week"),
         CheckConstraint("season >= 1900", name="chk_season"),
         CheckConstraint("home_team_id != away_team_id", name="chk_teams_distinct"),
@@ -39,15 +41,8 @@ class GameResult(Base):
         return f"<GameResult {self.season}-W{self.week} {self.home_team_id} vs {self.away_team_id} winner={self.winner_team_id}>"
 
 
-def _validate_winner(gr: GameResult) -> None:
-    if gr.winner_team_id is None:
-        return
-    if gr.winner_team_id not in (gr.home_team_id, gr.away_team_id):
-        raise ValueError("winner_team_id must be either home_team_id or away_team_id (or NULL)")
-
-
-@event.listens_for(Session, "before_flush")
-def _game_result_before_flush(session: Session, flush_context, instances):
-    for obj in list(session.new) + list(session.dirty):
-        if isinstance(obj, GameResult):
-            _validate_winner(obj)
+@flush_validator(GameResult)
+def _validate_winners(session: Session, rows: List[GameResult]) -> None:
+    for gr in rows:
+        if gr.winner_team_id is not None and gr.winner_team_id not in (gr.home_team_id, gr.away_team_id):
+            raise ValueError("winner_team_id must be either home_team_id or away_team_id (or NULL)")
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import Integer, String, UniqueConstraint, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .database import Base
+
+
+class ImportManifest(Base):
+    """Digest of the last successfully imported version of each roster file."""
+    __tablename__ = "import_manifest"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    file_name: Mapped[str] = mapped_column(String(64), nullable=False, unique=True)  # e.g. players.csv
+    digest: Mapped[str] = mapped_column(String(64), nullable=False)                 # sha256 hex
+    row_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    imported_at: Mapped[datetime] = mapped_column(default=func.now(), onupdate=func.now(), nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<ImportManifest {self.file_name} {self.digest[:12]} rows={self.row_count}>"
+
+
+class ImportFingerprint(Base):
+    """
+    Content hash of one imported row, keyed by its natural key:
+      team   -> "Arlington|Arrows"
+      player -> "Arlington|Arrows#12" (rostered) or "FA|FA#John#Doe#QB#12#0" (free agent)
+      depth  -> "Arlington|Arrows#QB"
+    entity_id points at the row the key was written to (teams/players/depth_charts id).
+    """
+    __tablename__ = "import_fingerprints"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    kind: Mapped[str] = mapped_column(String(8), nullable=False)
+    natural_key: Mapped[str] = mapped_column(String(200), nullable=False)
+    row_hash: Mapped[str] = mapped_column(String(32), nullable=False)
+    entity_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+
+    __table_args__ = (
+        UniqueConstraint("kind", "natural_key", name="uq_fingerprint_key"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<ImportFingerprint {self.kind} {self.natural_key} {self.row_hash[:8]}>"
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Optional
 
-from sqlalchemy import CheckConstraint, ForeignKey, Integer, String
+from sqlalchemy import CheckConstraint, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
 from .database import Base
@@ -43,6 +43,12 @@ class Player(Base):
     team: Mapped[Optional["Team"]] = relationship(back_populates="players")
 
     __table_args__ = (
+        # One rostered player per jersey per team (free agents have team_id NULL,
+        # and NULLs never collide). Also serves every (team_id, jersey) lookup.
+        Index("uq_players_team_jersey", "team_id", "jersey", unique=True),
+        # /players?min_age=&max_age= (alone or with team_id=)
+        Index("ix_players_age", "age"),
+        Index("ix_players_team_age", "team_id", "age"),
         CheckConstraint("age >= 18", name="chk_player_age"),
         CheckConstraint("speed BETWEEN 0 AND 100", name="chk_speed"),
         CheckConstraint("strength BETWEEN 0 AND 100", name="chk_strength"),
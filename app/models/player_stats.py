@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from sqlalchemy import ForeignKey, Integer
+from sqlalchemy import ForeignKey, Index, Integer
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .database import Base
@@ -50,3 +50,11 @@ class PlayerSeasonStats(Base):
 
     team: Mapped["Team"] = relationship()
     player: Mapped["Player"] = relationship()
+
+    __table_args__ = (
+        Index("ix_player_season_stats_season_player", "season", "player_id"),
+        Index("ix_player_season_stats_season_team", "season", "team_id"),
+        # one line per player and team a season: the week runner's read-then-insert
+        # cannot create a second one
+        Index("uq_player_season_stats_season_team_player", "season", "team_id", "player_id", unique=True),
+    )
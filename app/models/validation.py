@@ -0,0 +1,76 @@
+"""
+Flush-time validation for rules that a column CHECK can't express
+(cross-row or cross-table), run by a single before_flush listener.
+
+- flush_validator(Model): register fn(session, rows) for pending rows of Model
+- skip_flush_validation(session, *models): switch validators off (trusted paths)
+
+The listener walks session.new and session.dirty once per flush, groups the
+objects by model and calls each validator with the whole batch, so a validator
+can check a thousand rows with one query instead of one query per row.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional, Set, Type
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+FlushValidator = Callable[[Session, List[object]], None]
+
+# session.info key: set of models whose validators are skipped (None = all)
+SKIP_KEY = "skip_flush_validation"
+
+_validators: Dict[type, List[FlushValidator]] = {}
+
+
+def flush_validator(model: type) -> Callable[[FlushValidator], FlushValidator]:
+    """Decorator: run fn(session, rows) on every flush that has new/dirty `model` rows."""
+    def register(fn: FlushValidator) -> FlushValidator:
+        _validators.setdefault(model, []).append(fn)
+        return fn
+    return register
+
+
+@contextmanager
+def skip_flush_validation(session: Session, *models: Type):
+    """
+    Skip the flush validators for `models` (all models if none are given) while
+    the block runs, including flushes triggered by a commit inside it. Only for
+    paths that guarantee the rules by construction, e.g. the roster importer.
+    """
+    previous = session.info.get(SKIP_KEY, set())
+    if not models or previous is None:
+        session.info[SKIP_KEY] = None
+    else:
+        session.info[SKIP_KEY] = set(previous) | set(models)
+    try:
+        yield session
+    finally:
+        session.info[SKIP_KEY] = previous
+
+
+def pending_by_model(session: Session) -> Dict[type, List[object]]:
+    """New and dirty objects of validated models, grouped by model (one pass)."""
+    skipped: Optional[Set[type]] = session.info.get(SKIP_KEY, set())
+    if skipped is None:
+        return {}
+    wanted = _validators.keys() - skipped
+    groups: Dict[type, List[object]] = {}
+    if not wanted:
+        return groups
+    for pending in (session.new, session.dirty):
+        for obj in pending:
+            cls = type(obj)
+            if cls in wanted:
+                groups.setdefault(cls, []).append(obj)
+    return groups
+
+
+@event.listens_for(Session, "before_flush")
+def _validate_before_flush(session: Session, flush_context, instances):
+    for model, rows in pending_by_model(session).items():
+        for validate in _validators[model]:
+            validate(session, rows)
@@ -0,0 +1,197 @@
+"""
+Per-table data versions: a counter per table in the data_versions table,
+bumped in the same transaction as the write, for ETags on read endpoints.
+
+- data_version(bind, *tables): current counters (one SELECT, uncached)
+- data_etag(session, *tables): quoted ETag from those counters, for the
+  async API; cached per database for settings.etag_ttl_ms
+- bump(bind, *tables): manual bump, for writes that bypass the Session
+  (raw connections)
+
+Tracked: ORM flushes (new/dirty/deleted objects) and DML run through
+session.execute (e.g. the bulk importer's insert()/update()). Each table
+is bumped once per transaction, on its first write, so the bump commits
+or rolls back with the data. Deletes also bump the tables whose foreign
+keys cascade from the deleted table.
+
+The counters live in the database, so every process writing it (import
+CLIs, generate_and_load, the week runner) moves the ETags every API
+worker serves. A commit in this process drops this process's cached copy
+at once; other processes' commits show up within etag_ttl_ms. The EPOCH_ROW
+is random per created database, so a rebuilt database never revalidates a
+stale response.
+"""
+
+from __future__ import annotations
+
+import os
+import secrets
+import threading
+import time
+from functools import lru_cache
+from typing import Dict, Hashable, Iterable, Set, Tuple
+
+from sqlalchemy import Integer, String, event, select
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Mapped, Session, mapped_column
+
+from app.core.config import settings
+from .database import Base
+
+# data_versions row holding the database's epoch instead of a counter
+EPOCH_ROW = "*"
+
+
+class DataVersion(Base):
+    """Write counter of one table (table_name = EPOCH_ROW: the database's epoch)."""
+    __tablename__ = "data_versions"
+
+    table_name: Mapped[str] = mapped_column(String(64), primary_key=True)
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+@event.listens_for(DataVersion.__table__, "after_create")
+def _seed_epoch(target, connection: Connection, **kw):
+    connection.execute(target.insert().values(table_name=EPOCH_ROW, version=secrets.randbits(31)))
+
+
+# session.info key: tables already bumped in the current transaction
+_BUMPED_KEY = "data_version_bumped"
+# session.info key: databases whose counters the current transaction moved
+_DIRTY_KEY = "data_version_dirty"
+
+# database -> (monotonic time read, {table_name: version})
+_cache: Dict[Hashable, Tuple[float, Dict[str, int]]] = {}
+_lock = threading.Lock()
+
+
+def _engine_of(bind) -> Engine:
+    if isinstance(bind, Session):
+        bind = bind.get_bind()
+    return getattr(bind, "engine", bind)
+
+
+def _database_key(engine: Engine) -> Hashable:
+    """Same key for every engine (sync or async, any process) on one database file."""
+    url = engine.url
+    if url.get_backend_name() == "sqlite":
+        if url.database in (None, "", ":memory:"):
+            return id(engine)
+        return os.path.abspath(url.database)
+    return url.render_as_string(hide_password=True)
+
+
+def _versions_of(rows) -> Dict[str, int]:
+    return {name: version for name, version in rows}
+
+
+def _tag(versions: Dict[str, int], tables: Tuple[str, ...]) -> str:
+    return ('"' + format(versions.get(EPOCH_ROW, 0), "x") + "-"
+            + ".".join(str(versions.get(t, 0)) for t in tables) + '"')
+
+
+def data_version(bind, *tables: str) -> Tuple[int, ...]:
+    """Counters of `tables` in the database behind `bind` (Engine, Connection or Session)."""
+    stmt = select(DataVersion.table_name, DataVersion.version)
+    if isinstance(bind, Engine):
+        with bind.connect() as conn:
+            versions = _versions_of(conn.execute(stmt))
+    else:
+        versions = _versions_of(bind.execute(stmt))
+    return tuple(versions.get(t, 0) for t in tables)
+
+
+async def data_etag(session: AsyncSession, *tables: str) -> str:
+    key = _database_key(session.sync_session.get_bind())
+    now = time.monotonic()
+    with _lock:
+        hit = _cache.get(key)
+    if hit is not None and now - hit[0] < settings.etag_ttl_ms / 1000:
+        return _tag(hit[1], tables)
+    versions = _versions_of(await session.execute(select(DataVersion.table_name, DataVersion.version)))
+    with _lock:
+        _cache[key] = (now, versions)
+    return _tag(versions, tables)
+
+
+def _bump_on(conn: Connection, tables: Iterable[str]) -> None:
+    if conn.dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    stmt = dialect_insert(DataVersion)
+    stmt = stmt.on_conflict_do_update(index_elements=["table_name"], set_={"version": DataVersion.version + 1})
+    conn.execute(stmt, [{"table_name": t, "version": 1} for t in sorted(tables)])
+
+
+def _forget(engine: Engine) -> None:
+    with _lock:
+        _cache.pop(_database_key(engine), None)
+
+
+def bump(bind, *tables: str) -> None:
+    """Bump `tables`: inside a Connection's or Session's transaction, or in its own on an Engine."""
+    if not tables:
+        return
+    if isinstance(bind, Engine):
+        with bind.begin() as conn:
+            _bump_on(conn, tables)
+    else:
+        _bump_on(bind.connection() if isinstance(bind, Session) else bind, tables)
+    _forget(_engine_of(bind))
+
+
+@lru_cache(maxsize=None)
+def _cascades_from(table: str) -> Tuple[str, ...]:
+    """Tables whose rows change (ON DELETE CASCADE / SET NULL) when `table` rows are deleted."""
+    return tuple(sorted({
+        t.name for t in Base.metadata.tables.values()
+        for fk in t.foreign_keys if fk.ondelete and fk.column.table.name == table
+    }))
+
+
+def _touch(session: Session, tables: Iterable[str], deleted: bool = False) -> None:
+    touched: Set[str] = set()
+    for t in tables:
+        touched.add(t)
+        if deleted:
+            touched.update(_cascades_from(t))
+    bumped: Set[str] = session.info.setdefault(_BUMPED_KEY, set())
+    fresh = touched - bumped - {DataVersion.__tablename__}
+    if fresh:
+        _bump_on(session.connection(), fresh)
+        bumped |= fresh
+        session.info.setdefault(_DIRTY_KEY, set()).add(_engine_of(session))
+
+
+def _table_name(obj) -> str:
+    return obj.__table__.name
+
+
+@event.listens_for(Session, "after_flush")
+def _record_flush(session: Session, flush_context):
+    _touch(session, {_table_name(o) for o in session.new} | {_table_name(o) for o in session.dirty})
+    if session.deleted:
+        _touch(session, {_table_name(o) for o in session.deleted}, deleted=True)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _record_dml(orm_execute_state):
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        table = getattr(orm_execute_state.statement, "table", None)
+        if table is not None:
+            _touch(orm_execute_state.session, (table.name,), deleted=orm_execute_state.is_delete)
+
+
+@event.listens_for(Session, "after_commit")
+def _forget_on_commit(session: Session):
+    session.info.pop(_BUMPED_KEY, None)
+    for engine in session.info.pop(_DIRTY_KEY, ()):
+        _forget(engine)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _reset_on_rollback(session: Session, previous_transaction):
+    # a savepoint rollback may undo a bump too: the next write bumps again
+    session.info.pop(_BUMPED_KEY, None)
@@ -1,4 +1,18 @@
 """Importer package: schemas, generator, and ingest helpers."""
 from .schemas import TeamIn, PlayerIn, DepthChartIn
 from .generator import make_league, DEFAULT_ROSTER_SIZES, POSITIONS
-from .ingest import import_roster
+from .ingest import import_roster, bulk_import
+from .stream import stream_import, ImportCheckpoint
+from .delta import import_roster_incremental
+from .snapshot import LeagueSnapshot, write_snapshot, import_snapshot
+from .bootstrap import generate_and_load
+
+__all__ = [
+    "TeamIn", "PlayerIn", "DepthChartIn",
+    "make_league", "DEFAULT_ROSTER_SIZES", "POSITIONS",
+    "import_roster", "bulk_import",
+    "stream_import", "ImportCheckpoint",
+    "import_roster_incremental",
+    "LeagueSnapshot", "write_snapshot", "import_snapshot",
+    "generate_and_load",
+]
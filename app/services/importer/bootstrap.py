@@ -0,0 +1,89 @@
+"""
+Generate-and-load: build a league with make_league's generator and write it
+straight into the database, without the CSV round trip.
+
+    generate_and_load(session, seed=2025, trusted=True)
+
+Blocks of teams go through the set-based bulk import path as they are
+generated, all in one transaction. trusted=True takes the generator at its word:
+rows are built as pre-validated tuples (no pydantic models) and the importer's
+per-player checks are skipped. Leave it off for anything not produced by
+the generator in this process.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+from typing import Dict, Optional, Sequence
+
+from sqlalchemy.orm import Session
+
+from app.models.database import create_db_and_tables, import_profile, session_scope
+from .generator import iter_league
+from .ingest import bulk_import
+
+DEFAULT_BLOCK_TEAMS = 64
+
+
+def generate_and_load(
+    session: Session,
+    *,
+    seed: int,
+    team_count: int = 32,
+    free_agents: int = 0,
+    trusted: bool = False,
+    block_teams: int = DEFAULT_BLOCK_TEAMS,
+    workers: int = 1,
+) -> Dict[str, int]:
+    """
+    Generate a league and import it block by block; commits once at the end.
+    Returns the import summary plus "teams"/"players" counts.
+    """
+    summary = {"created": 0, "updated": 0, "skipped": 0, "teams": 0, "players": 0}
+    try:
+        for teams, players, depth in iter_league(
+            seed, team_count, free_agents=free_agents, workers=workers,
+            rows=trusted, block_teams=block_teams,
+        ):
+            res = bulk_import(session, teams=teams, players=players, depth_chart=depth, validated=trusted)
+            for key in ("created", "updated", "skipped"):
+                summary[key] += res[key]
+            summary["teams"] += len(teams)
+            summary["players"] += len(players)
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    return summary
+
+
+def cli_generate_and_load(seed: int, team_count: int = 32, free_agents: int = 0,
+                          trusted: bool = False, workers: int = 1, fast: bool = False) -> Dict[str, int]:
+    create_db_and_tables()
+    with session_scope(profile=import_profile(fast)) as session:
+        return generate_and_load(session, seed=seed, team_count=team_count, free_agents=free_agents,
+                                 trusted=trusted, workers=workers)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Generate a league and load it directly into the database.")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed (default: DEFAULT_SEED or 2025)")
+    parser.add_argument("--teams", type=int, default=32)
+    parser.add_argument("--free-agents", type=int, default=100)
+    parser.add_argument("--trust", action="store_true",
+                        help="Skip validation of generated rows (they are in range by construction)")
+    parser.add_argument("--workers", type=int, default=1, help="Processes used to generate teams")
+    parser.add_argument("--fast", action="store_true",
+                        help="Use the bulk-load SQLite profile (synchronous=OFF): faster, but a crash "
+                             "mid-load can corrupt the database")
+    args = parser.parse_args(argv)
+
+    seed = args.seed if args.seed is not None else int(os.getenv("DEFAULT_SEED", "2025"))
+    res = cli_generate_and_load(seed, args.teams, args.free_agents, trusted=args.trust, workers=args.workers,
+                                fast=args.fast)
+    print(f"Generated and loaded league with seed={seed}: {res}")
+
+
+if __name__ == "__main__":
+    main()
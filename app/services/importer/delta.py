@@ -0,0 +1,304 @@
+"""
+Incremental (delta) roster import.
+
+Every imported row gets a content hash stored under its natural key in
+import_fingerprints; every imported file gets a sha256 in import_manifest.
+On the next run:
+
+  - a file whose digest matches the manifest is not even parsed;
+  - a row whose hash matches its fingerprint is not written;
+  - only new/changed rows go through the bulk import path.
+
+Free agents have no (team, jersey) key, so they are identified by
+first/last name, position and jersey (+ an occurrence counter for exact
+duplicates) and updated in place by player id instead of being re-inserted.
+
+Rows are never deleted: keys that have a fingerprint but are missing from the
+input are only reported in the diff.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import insert, select, update
+from sqlalchemy.orm import Session
+
+from app.models import ImportFingerprint, ImportManifest, Player
+from app.models.database import create_db_and_tables, import_profile, session_scope
+from .schemas import TeamIn, PlayerIn, DepthChartIn
+from .ingest import (
+    FA_KEY, PLAYER_UPDATE_FIELDS, _check_player_values, _load_csv_depth, _load_csv_players,
+    _load_csv_team, _upsert_many, bulk_import, depth_ids_by_team_position,
+    player_ids_by_team_jersey, split_team_key, team_ids_by_keys,
+)
+
+ROSTER_FILES: Tuple[Tuple[str, str], ...] = (
+    ("team", "teams.csv"),
+    ("player", "players.csv"),
+    ("depth", "depth_chart.csv"),
+)
+
+
+# --- Hashing -------------------------------------------------------------------
+def row_fingerprint(values: Sequence[object]) -> str:
+    """Stable 128-bit content hash of a row's values."""
+    raw = "\x1f".join("" if v is None else str(v) for v in values)
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def file_digest(path: str, block_size: int = 1 << 20) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def team_natural_key(t: TeamIn) -> str:
+    return "|".join(t.natural_key)
+
+
+def player_natural_keys(players: Iterable[PlayerIn]) -> List[str]:
+    """Natural key per player, in input order (see module docstring)."""
+    keys: List[str] = []
+    seen: Dict[str, int] = defaultdict(int)
+    for p in players:
+        team_key = split_team_key(p.team_key)
+        if team_key == FA_KEY:
+            base = f"FA|FA#{p.first_name}#{p.last_name}#{p.position}#{p.jersey}"
+            keys.append(f"{base}#{seen[base]}")
+            seen[base] += 1
+        else:
+            keys.append(f"{'|'.join(team_key)}#{p.jersey}")
+    return keys
+
+
+def depth_natural_key(d: DepthChartIn) -> str:
+    return f"{'|'.join(split_team_key(d.team_key))}#{d.position}"
+
+
+def _team_hash(t: TeamIn) -> str:
+    return row_fingerprint((t.conference, t.division, t.power_rating, t.cap_space))
+
+
+def _player_hash(p: PlayerIn) -> str:
+    return row_fingerprint([getattr(p, f) for f in PLAYER_UPDATE_FIELDS])
+
+
+def _depth_hash(d: DepthChartIn) -> str:
+    return row_fingerprint((d.starter_jersey, d.backup_jersey))
+
+
+# --- Fingerprint store ---------------------------------------------------------
+def load_fingerprints(session: Session, kinds: Iterable[str]) -> Dict[str, Dict[str, Tuple[str, Optional[int]]]]:
+    kinds = list(kinds)
+    out: Dict[str, Dict[str, Tuple[str, Optional[int]]]] = {k: {} for k in kinds}
+    if not kinds:
+        return out
+    rows = session.execute(
+        select(ImportFingerprint.kind, ImportFingerprint.natural_key,
+               ImportFingerprint.row_hash, ImportFingerprint.entity_id)
+        .where(ImportFingerprint.kind.in_(kinds))
+    ).all()
+    for kind, key, row_hash, entity_id in rows:
+        out[kind][key] = (row_hash, entity_id)
+    return out
+
+
+def _adoptable_free_agents(session: Session, claimed: Iterable[Optional[int]]) -> Dict[str, List[int]]:
+    """
+    FA rows already in the DB without a fingerprint (e.g. from a full import),
+    grouped by FA base identity, so the first incremental run updates them
+    instead of inserting duplicates.
+    """
+    claimed = {i for i in claimed if i is not None}
+    rows = session.execute(
+        select(Player.id, Player.first_name, Player.last_name, Player.position, Player.jersey)
+        .where(Player.team_id.is_(None))
+        .order_by(Player.id)
+    ).all()
+    out: Dict[str, List[int]] = defaultdict(list)
+    for pid, fn, ln, pos, jersey in rows:
+        if pid not in claimed:
+            out[f"FA|FA#{fn}#{ln}#{pos}#{jersey}"].append(pid)
+    return out
+
+
+# --- Incremental import --------------------------------------------------------
+def import_roster_incremental(
+    session: Session,
+    *,
+    teams: Optional[Iterable[TeamIn]] = None,
+    players: Optional[Iterable[PlayerIn]] = None,
+    depth_chart: Optional[Iterable[DepthChartIn]] = None,
+    manifest: Optional[Dict[str, Tuple[str, int]]] = None,
+) -> Dict[str, object]:
+    """
+    Write only rows whose content hash changed since the last import.
+
+    Pass None for an input that should be left alone entirely (e.g. its file
+    digest matched the manifest); an empty list means "the file is empty" and
+    every previously imported key of that kind is reported as missing.
+    manifest ({file_name: (digest, row_count)}) is written in the same transaction.
+
+    Returns the usual created/updated/skipped counts plus "unchanged" and a
+    per-kind "diff": {"new": [keys], "changed": [keys], "unchanged": n, "missing": [keys]}.
+    """
+    inputs = {
+        "team": None if teams is None else list(teams),
+        "player": None if players is None else list(players),
+        "depth": None if depth_chart is None else list(depth_chart),
+    }
+    given = [k for k, rows in inputs.items() if rows is not None]
+
+    try:
+        fingerprints = load_fingerprints(session, given)
+        diff: Dict[str, Dict[str, object]] = {}
+        changed: Dict[str, List[Tuple[object, str, str]]] = {}
+        keys_for = {
+            "team": lambda rows: [team_natural_key(t) for t in rows],
+            "player": player_natural_keys,
+            "depth": lambda rows: [depth_natural_key(d) for d in rows],
+        }
+        hash_for = {"team": _team_hash, "player": _player_hash, "depth": _depth_hash}
+
+        for kind in given:
+            rows = inputs[kind]
+            known = fingerprints[kind]
+            entry = {"new": [], "changed": [], "unchanged": 0, "missing": []}
+            changed[kind] = []
+            keys = keys_for[kind](rows)
+            for row, key in zip(rows, keys):
+                row_hash = hash_for[kind](row)
+                old = known.get(key)
+                if old is not None and old[0] == row_hash:
+                    entry["unchanged"] += 1
+                    continue
+                entry["changed" if old is not None else "new"].append(key)
+                changed[kind].append((row, key, row_hash))
+            entry["missing"] = sorted(set(known) - set(keys))
+            diff[kind] = entry
+
+        # Rostered players go through the bulk path; free agents are handled by id below
+        rostered, free_agents = [], []
+        for item in changed.get("player", []):
+            (free_agents if item[1].startswith("FA|FA#") else rostered).append(item)
+
+        result = bulk_import(
+            session,
+            teams=[row for row, _, _ in changed.get("team", [])],
+            players=[row for row, _, _ in rostered],
+            depth_chart=[row for row, _, _ in changed.get("depth", [])],
+            upsert=True,
+        )
+        created, updated = result["created"], result["updated"]
+
+        # -------------------- FREE AGENTS ----------------
+        fa_ids: Dict[str, int] = {}
+        if free_agents:
+            known = fingerprints["player"]
+            adoptable = _adoptable_free_agents(session, (e for _, e in known.values()))
+            fa_updates, fa_inserts, insert_keys = [], [], []
+            for p, key, _ in free_agents:
+                _check_player_values(p)
+                values = {name: getattr(p, name) for name in PLAYER_UPDATE_FIELDS}
+                pid = known[key][1] if key in known else None
+                if pid is None and adoptable[key.rsplit("#", 1)[0]]:
+                    pid = adoptable[key.rsplit("#", 1)[0]].pop(0)
+                if pid is None:
+                    fa_inserts.append(dict(values, team_id=None, jersey=p.jersey))
+                    insert_keys.append(key)
+                else:
+                    fa_updates.append(dict(values, id=pid))
+                    fa_ids[key] = pid
+            if fa_updates:
+                session.execute(update(Player), fa_updates)
+                updated += len(fa_updates)
+            if fa_inserts:
+                new_ids = session.execute(
+                    insert(Player.__table__).returning(Player.id, sort_by_parameter_order=True),
+                    fa_inserts,
+                ).scalars().all()
+                fa_ids.update(zip(insert_keys, new_ids))
+                created += len(fa_inserts)
+
+        # -------------------- FINGERPRINTS ---------------
+        _store_fingerprints(session, changed, fa_ids)
+        if manifest:
+            _upsert_many(
+                session, ImportManifest,
+                [{"file_name": name, "digest": digest, "row_count": count}
+                 for name, (digest, count) in manifest.items()],
+                ("file_name",), ("digest", "row_count"),
+            )
+
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+
+    unchanged = sum(d["unchanged"] for d in diff.values())
+    return {"created": created, "updated": updated, "skipped": 0, "unchanged": unchanged, "diff": diff}
+
+
+def _store_fingerprints(session: Session, changed: Dict[str, List[Tuple[object, str, str]]],
+                        fa_ids: Dict[str, int]) -> None:
+    teams = changed.get("team", [])
+    team_ids = team_ids_by_keys(session, [t.natural_key for t, _, _ in teams])
+    rows = [{"kind": "team", "natural_key": key, "row_hash": h, "entity_id": team_ids.get(t.natural_key)}
+            for t, key, h in teams]
+
+    players = changed.get("player", [])
+    roster_team_ids = team_ids_by_keys(
+        session, {split_team_key(p.team_key) for p, key, _ in players if key not in fa_ids}
+    )
+    player_ids = player_ids_by_team_jersey(session, roster_team_ids.values())
+    for p, key, h in players:
+        if key in fa_ids:
+            entity_id = fa_ids[key]
+        else:
+            entity_id = player_ids.get((roster_team_ids.get(split_team_key(p.team_key)), p.jersey))
+        rows.append({"kind": "player", "natural_key": key, "row_hash": h, "entity_id": entity_id})
+
+    depth = changed.get("depth", [])
+    depth_team_ids = team_ids_by_keys(session, {split_team_key(d.team_key) for d, _, _ in depth})
+    depth_ids = depth_ids_by_team_position(session, depth_team_ids.values())
+    for d, key, h in depth:
+        entity_id = depth_ids.get((depth_team_ids.get(split_team_key(d.team_key)), d.position))
+        rows.append({"kind": "depth", "natural_key": key, "row_hash": h, "entity_id": entity_id})
+
+    _upsert_many(session, ImportFingerprint, rows, ("kind", "natural_key"), ("row_hash", "entity_id"))
+
+
+# --- CLI entrypoint ------------------------------------------------------------
+def cli_import_incremental(path: str, fast: bool = False) -> Dict[str, object]:
+    """
+    Incremental import from a directory with teams.csv, players.csv, depth_chart.csv.
+    Files whose sha256 matches import_manifest are skipped without being parsed.
+    fast=True uses the bulk-load profile (see import_profile).
+    """
+    create_db_and_tables()
+    loaders = {"team": _load_csv_team, "player": _load_csv_players, "depth": _load_csv_depth}
+    with session_scope(profile=import_profile(fast)) as session:
+        previous = dict(session.execute(select(ImportManifest.file_name, ImportManifest.digest)).all())
+        inputs: Dict[str, Optional[list]] = {}
+        manifest: Dict[str, Tuple[str, int]] = {}
+        for kind, file_name in ROSTER_FILES:
+            file_path = os.path.join(path, file_name)
+            digest = file_digest(file_path)
+            if previous.get(file_name) == digest:
+                inputs[kind] = None
+                continue
+            inputs[kind] = loaders[kind](file_path)
+            manifest[file_name] = (digest, len(inputs[kind]))
+
+        res = import_roster_incremental(
+            session, teams=inputs["team"], players=inputs["player"], depth_chart=inputs["depth"],
+            manifest=manifest,
+        )
+        res["files_skipped"] = sorted(f for k, f in ROSTER_FILES if inputs[k] is None)
+        return res
@@ -1,10 +1,12 @@
 from __future__ import annotations
 import csv
 import json
-import random
-from dataclasses import dataclass
-from typing import Dict, Iterable, List, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Tuple
 
+import numpy as np
+
+from app.core.random import SeededRNG
 from .schemas import TeamIn, PlayerIn, DepthChartIn, POSITIONS
 
 # Default roster sizes -> 53 players per team
@@ -69,98 +71,239 @@ POS_RATING_MEANS = {
     "LS": dict(awareness=55, stamina=70),
 }
 
-def clamp(v: int) -> int:
-    return max(0, min(100, v))
-
-def rand_rating(rng: random.Random, pos: str, key: str, base: int = 50, spread: int = 25) -> int:
-    center = POS_RATING_MEANS.get(pos, {}).get(key, base)
-    sample = int(rng.gauss(center, spread/3))
-    return clamp(sample)
-
-def unique_jerseys_for_team(rng: random.Random, count: int) -> List[int]:
-    pool = list(range(1, 100))
-    rng.shuffle(pool)
-    return pool[:count]
-
-def make_team_tuple(seed_idx: int) -> TeamIn:
-    loc, nick, conf, div = DEFAULT_TEAMS[seed_idx]
-    return TeamIn(
-        location_name=loc, nickname=nick,
-        conference=conf, division=div,
-        power_rating=50, cap_space=20_000_000
-    )
-
-def make_player(rng: random.Random, team_key: str, pos: str, jersey: int) -> PlayerIn:
-    fn = rng.choice(FIRST_NAMES)
-    ln = rng.choice(LAST_NAMES)
-    age = rng.randint(21, 33)
-    salary = rng.randint(500_000, 5_000_000)
-    years = rng.randint(1, 4)
-
-    # base ratings
-    ratings = {
-        "speed": rand_rating(rng, pos, "speed"),
-        "strength": rand_rating(rng, pos, "strength"),
-        "agility": rand_rating(rng, pos, "agility"),
-        "throw_power": rand_rating(rng, pos, "throw_power"),
-        "throw_accuracy": rand_rating(rng, pos, "throw_accuracy"),
-        "catching": rand_rating(rng, pos, "catching"),
-        "tackling": rand_rating(rng, pos, "tackling"),
-        "awareness": rand_rating(rng, pos, "awareness"),
-        "potential": rand_rating(rng, pos, "potential", base=60),
-        "stamina": rand_rating(rng, pos, "stamina", base=70),
-        "injury_proneness": clamp(100 - rand_rating(rng, pos, "stamina", base=65)),
-        "morale": rng.randint(50, 80),
-    }
-
-    return PlayerIn(
-        first_name=fn, last_name=ln, position=pos, jersey=jersey,
-        age=age, salary=salary, contract_years=years, team_key=team_key, **ratings
-    )
+# Rating columns drawn from a normal around the position "center"; the last
+# column is the stamina-like draw that injury_proneness is derived from.
+RATING_KEYS: Tuple[str, ...] = (
+    "speed", "strength", "agility", "throw_power", "throw_accuracy",
+    "catching", "tackling", "awareness", "potential", "stamina",
+)
+RATING_BASES: Dict[str, int] = {"potential": 60, "stamina": 70}
+INJURY_BASE = 65
+RATING_SPREAD = 25
 
-def make_league(seed: int, team_count: int = 32,
+# (len(POSITIONS), len(RATING_KEYS) + 1) table of means, indexed by position number
+_RATING_MEANS = np.array(
+    [[POS_RATING_MEANS.get(pos, {}).get(key, RATING_BASES.get(key, 50)) for key in RATING_KEYS]
+     + [POS_RATING_MEANS.get(pos, {}).get("stamina", INJURY_BASE)]
+     for pos in POSITIONS],
+    dtype=np.float64,
+)
+
+# Substream ids: every team (and the free-agent pool) gets its own generator
+# derived from (seed, kind, index), so output never depends on how the teams
+# are split across worker processes.
+_TEAM_STREAM = 0
+_FREE_AGENT_STREAM = 1
+
+
+def substream(seed: int, *key: int) -> np.random.Generator:
+    """The array Generator of SeededRNG(seed).child(*key)."""
+    return SeededRNG(seed).child(*key).arrays
+
+
+def team_identity(index: int) -> Tuple[str, str, str, str]:
+    """
+    (location, nickname, conference, division) for team number `index`.
+    The 32 built-in identities are reused with a numbered location beyond
+    that ("Arlington 2", "Arlington 3", ...), so keys stay unique.
+    """
+    loc, nick, conf, div = DEFAULT_TEAMS[index % len(DEFAULT_TEAMS)]
+    generation = index // len(DEFAULT_TEAMS)
+    return (f"{loc} {generation + 1}" if generation else loc), nick, conf, div
+
+
+# Player columns produced by the generator (string columns hold indexes)
+_NAME_COLUMNS: Dict[str, List[str]] = {"first_name": FIRST_NAMES, "last_name": LAST_NAMES, "position": POSITIONS}
+
+
+# column -> [low, high) of the uniform integer draws
+_SCALAR_BOUNDS: Dict[str, Tuple[int, int]] = {
+    "first_name": (0, len(FIRST_NAMES)), "last_name": (0, len(LAST_NAMES)),
+    "age": (21, 34), "salary": (500_000, 5_000_001), "contract_years": (1, 5), "morale": (50, 81),
+}
+_SCALAR_COLUMNS = tuple(_SCALAR_BOUNDS)
+_SCALAR_LOW = np.array([lo for lo, _ in _SCALAR_BOUNDS.values()])
+_SCALAR_HIGH = np.array([hi for _, hi in _SCALAR_BOUNDS.values()])
+
+
+def draw_players(rng: np.random.Generator, pos_idx: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Draw everything but jersey/team for len(pos_idx) players in one go:
+    one normal() call for the whole rating block and one integers() call for
+    the scalar columns. first_name/last_name/position come back as indexes into
+    FIRST_NAMES/LAST_NAMES/POSITIONS.
+    """
+    n = len(pos_idx)
+    # one integers() call for all scalar columns (per-column bounds broadcast)
+    scalars = rng.integers(_SCALAR_LOW, _SCALAR_HIGH, size=(n, len(_SCALAR_COLUMNS)))
+    out: Dict[str, np.ndarray] = {name: scalars[:, i] for i, name in enumerate(_SCALAR_COLUMNS)}
+    out["position"] = pos_idx
+    # truncate like int() then clamp to 0..100
+    ratings = np.clip(np.trunc(rng.normal(_RATING_MEANS[pos_idx], RATING_SPREAD / 3)), 0, 100).astype(np.int64)
+    for col, key in enumerate(RATING_KEYS):
+        out[key] = ratings[:, col]
+    out["injury_proneness"] = 100 - ratings[:, -1]
+    return out
+
+
+def _roster_layout(roster_sizes: Dict[str, int]) -> np.ndarray:
+    if sum(roster_sizes.values()) > 99:
+        raise ValueError("roster_sizes needs more than 99 unique jerseys per team")
+    return np.repeat([POSITIONS.index(p) for p in roster_sizes], list(roster_sizes.values()))
+
+
+def generate_team_block(seed: int, start: int, stop: int, roster_sizes: Dict[str, int]):
+    """
+    Teams start..stop-1 as (player columns, depth jerseys). Each team draws
+    only from its own substream. Everything is a NumPy array, so shards are
+    cheap to send back from a worker process.
+
+    players: draw_players() columns + "jersey" + "team" (team number)
+    depth:   (n_teams * len(roster_sizes), 2) starter/backup jerseys, -1 = none
+    """
+    layout = _roster_layout(roster_sizes)
+    first_of_block = np.cumsum([0] + list(roster_sizes.values())[:-1])
+    has_backup = np.array(list(roster_sizes.values())) > 1
+    blocks, depth = [], []
+    for i in range(start, stop):
+        rng = substream(seed, _TEAM_STREAM, i)
+        jerseys = rng.permutation(99)[:len(layout)] + 1
+        cols = draw_players(rng, layout)
+        cols["jersey"] = jerseys
+        cols["team"] = np.full(len(layout), i)
+        blocks.append(cols)
+        # depth chart: starter/backup = first two jerseys of each position block
+        depth.append(np.column_stack([
+            jerseys[first_of_block],
+            np.where(has_backup, jerseys[np.minimum(first_of_block + 1, len(layout) - 1)], -1),
+        ]))
+    players = {name: np.concatenate([b[name] for b in blocks]) for name in blocks[0]} if blocks else {}
+    return players, (np.concatenate(depth) if depth else np.empty((0, 2), dtype=np.int64))
+
+
+def generate_free_agents(seed: int, count: int) -> Dict[str, np.ndarray]:
+    rng = substream(seed, _FREE_AGENT_STREAM)
+    pos_idx = rng.integers(0, len(POSITIONS), count)
+    players = draw_players(rng, pos_idx)
+    players["jersey"] = rng.integers(1, 100, count)
+    players["team"] = np.full(count, -1)
+    return players
+
+
+def _shards(team_count: int, workers: int) -> List[Tuple[int, int]]:
+    size = max(1, -(-team_count // (workers * 4)))
+    return [(lo, min(lo + size, team_count)) for lo in range(0, team_count, size)]
+
+
+def _player_lists(cols: Dict[str, np.ndarray], team_keys: Dict[int, str]) -> Dict[str, list]:
+    """Array columns -> Python lists in PlayerIn field terms (names, team_key)."""
+    out: Dict[str, list] = {}
+    for name, values in cols.items():
+        values = values.tolist()
+        if name in _NAME_COLUMNS:
+            out[name] = list(map(_NAME_COLUMNS[name].__getitem__, values))
+        elif name == "team":
+            out["team_key"] = ["FA|FA" if t < 0 else team_keys[t] for t in values]
+        else:
+            out[name] = values
+    return out
+
+
+def _player_models(cols: Dict[str, list]) -> List[PlayerIn]:
+    names = list(cols)
+    return [PlayerIn(**dict(zip(names, row))) for row in zip(*cols.values())]
+
+
+def _player_rows(cols: Dict[str, list]) -> list:
+    from .columnar import PlayerRow
+    return list(map(PlayerRow._make, zip(*(cols[name] for name in PlayerRow._fields))))
+
+
+def _team_row(t: Tuple[str, str, str, str]):
+    from .snapshot import TeamRow
+    return TeamRow(*t, power_rating=50, cap_space=20_000_000)
+
+
+def _team_model(t: Tuple[str, str, str, str]) -> TeamIn:
+    return TeamIn(location_name=t[0], nickname=t[1], conference=t[2], division=t[3],
+                  power_rating=50, cap_space=20_000_000)
+
+
+def _depth_model(d: tuple) -> DepthChartIn:
+    return DepthChartIn(team_key=d[0], position=d[1], starter_jersey=d[2], backup_jersey=d[3])
+
+
+def _row_builders(rows: bool):
+    """(make_team, make_players, make_depth) for models or pre-validated tuples."""
+    if rows:
+        from .snapshot import DepthRow
+        return _team_row, _player_rows, DepthRow._make
+    return _team_model, _player_models, _depth_model
+
+
+def iter_league(seed: int, team_count: int = 32,
                 roster_sizes: Dict[str, int] = None,
-                free_agents: int = 0):
+                free_agents: int = 0,
+                workers: int = 1,
+                rows: bool = False,
+                block_teams: int = 0):
     """
-    Deterministically generate teams, players, and depth chart entries.
-    Returns (teams, players, depth_chart).
+    Yield the league as (teams, players, depth_chart) blocks of block_teams
+    teams each (0 = split evenly for `workers`). Free agents come as a last
+    block with no teams. Concatenating the blocks gives make_league's output.
     """
-    rng = random.Random(seed)
     roster_sizes = roster_sizes or DEFAULT_ROSTER_SIZES
+    positions = list(roster_sizes)
+    make_team, make_players, make_depth = _row_builders(rows)
+    if block_teams:
+        shards = [(lo, min(lo + block_teams, team_count)) for lo in range(0, team_count, block_teams)]
+    else:
+        shards = _shards(team_count, workers)
+    args = [(seed, lo, hi, roster_sizes) for lo, hi in shards]
 
-    teams: List[TeamIn] = []
-    players: List[PlayerIn] = []
-    depth: List[DepthChartIn] = []
-
-    for i in range(team_count):
-        t = make_team_tuple(i % len(DEFAULT_TEAMS))
-        teams.append(t)
-        team_key = f"{t.location_name}|{t.nickname}"
-
-        # generate jerseys unique per team
-        total_needed = sum(roster_sizes.values())
-        jerseys = unique_jerseys_for_team(rng, total_needed)
-        idx = 0
-
-        # generate by position
-        for pos, count in roster_sizes.items():
-            jerseys_pos = jerseys[idx: idx + count]
-            idx += count
-            group = [make_player(rng, team_key, pos, j) for j in jerseys_pos]
-            players.extend(group)
-
-            # depth chart: starter/backup (first two if available)
-            starter = jerseys_pos[0]
-            backup = jerseys_pos[1] if len(jerseys_pos) > 1 else None
-            depth.append(DepthChartIn(team_key=team_key, position=pos,
-                                      starter_jersey=starter, backup_jersey=backup))
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 and len(shards) > 1 else None
+    try:
+        # pool.map yields in submission order, so blocks stream out in team order
+        blocks = pool.map(generate_team_block, *zip(*args)) if pool else (generate_team_block(*a) for a in args)
+        for (lo, hi), (player_cols, depth_jerseys) in zip(shards, blocks):
+            identities = [team_identity(i) for i in range(lo, hi)]
+            team_keys = {i: f"{loc}|{nick}" for i, (loc, nick, _, _) in enumerate(identities, lo)}
+            depth = [make_depth((team_keys[lo + i // len(positions)], positions[i % len(positions)],
+                                 starter, None if backup < 0 else backup))
+                     for i, (starter, backup) in enumerate(depth_jerseys.tolist())]
+            yield (list(map(make_team, identities)), make_players(_player_lists(player_cols, team_keys)), depth)
+    finally:
+        if pool:
+            pool.shutdown(cancel_futures=True)
 
     # free agents pool (team_key = "FA|FA")
-    for _ in range(free_agents):
-        pos = rng.choice(POSITIONS)
-        jersey = rng.randint(1, 99)
-        players.append(make_player(rng, "FA|FA", pos, jersey))
+    if free_agents:
+        yield [], make_players(_player_lists(generate_free_agents(seed, free_agents), {})), []
+
+
+def make_league(seed: int, team_count: int = 32,
+                roster_sizes: Dict[str, int] = None,
+                free_agents: int = 0,
+                workers: int = 1,
+                rows: bool = False):
+    """
+    Deterministically generate teams, players, and depth chart entries.
+    Returns (teams, players, depth_chart).
 
+    Ratings are drawn per team with NumPy from a per-team substream of `seed`,
+    so workers > 1 (process pool) produces exactly the same league as workers=1.
+
+    rows=True returns TeamRow/PlayerRow/DepthRow tuples instead of pydantic
+    models (several times faster for big leagues; import_roster(validated=True)
+    and write_snapshot accept them directly).
+    """
+    teams, players, depth = [], [], []
+    for block_teams, block_players, block_depth in iter_league(
+        seed, team_count, roster_sizes, free_agents, workers=workers, rows=rows
+    ):
+        teams += block_teams
+        players += block_players
+        depth += block_depth
     return teams, players, depth
 
 def write_csvs(out_dir: str, teams: List[TeamIn], players: List[PlayerIn], depth: List[DepthChartIn]) -> None:
@@ -201,3 +344,8 @@ def write_json(out_dir: str, teams: List[TeamIn], players: List[PlayerIn], depth
         json.dump(dump(players), f, indent=2)
     with open(f"{out_dir}/depth_chart.json","w",encoding="utf-8") as f:
         json.dump(dump(depth), f, indent=2)
+
+def write_snapshot(out_path: str, teams: List[TeamIn], players: List[PlayerIn], depth: List[DepthChartIn]) -> None:
+    # single columnar binary file (see snapshot.py); much faster to load than the CSVs
+    from .snapshot import write_snapshot as _write
+    _write(out_path, teams, players, depth)
@@ -3,14 +3,35 @@ from __future__ import annotations
 import argparse
 import csv
 import json
-from typing import Iterable, List, Tuple, Dict, Optional, Set
+import os
+from contextlib import nullcontext
+from functools import lru_cache
+from typing import Iterable, Iterator, List, Tuple, Dict, Optional, Sequence, Set
 
-from sqlalchemy import select
+from sqlalchemy import insert, select, tuple_
 from sqlalchemy.orm import Session
 
 from .schemas import TeamIn, PlayerIn, DepthChartIn
+from .trace import ImportTrace
 from app.models import Team, Player, DepthChart  # adjust if your paths differ
-from app.models.database import create_db_and_tables, get_session
+from app.models.database import create_db_and_tables, import_profile, session_scope
+from app.models.validation import skip_flush_validation
+from app.core.logging import configure_logging
+
+
+# Team key used for the free-agent pool ("FA|FA" in players.csv)
+FA_KEY: Tuple[str, str] = ("FA", "FA")
+
+# Player columns written on update (natural key team_id/jersey is never rewritten)
+PLAYER_UPDATE_FIELDS: Tuple[str, ...] = (
+    "first_name", "last_name", "position", "age", "salary", "contract_years",
+    "speed", "strength", "agility", "throw_power", "throw_accuracy", "catching",
+    "tackling", "awareness", "potential", "stamina", "injury_proneness", "morale",
+)
+RATING_FIELDS: Tuple[str, ...] = PLAYER_UPDATE_FIELDS[6:]
+
+# Keep IN (...) lists well under SQLite's bound-parameter limit
+_IN_CHUNK = 500
 
 
 # --- Simple helper: set attribute if the model actually has it -----------------
@@ -39,6 +60,125 @@ def team_jersey_set(session: Session, team_id: int) -> Set[int]:
     return {r[0] for r in rows}
 
 
+@lru_cache(maxsize=4096)
+def split_team_key(team_key: str) -> Tuple[str, str]:
+    """'Arlington|Arrows' -> ('Arlington', 'Arrows')."""
+    loc, nick = [s.strip() for s in team_key.split("|", 1)]
+    return loc, nick
+
+
+def _chunks(items: Sequence, size: int = _IN_CHUNK):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+# --- Set-based lookups (one query per chunk of keys) ---------------------------
+def team_ids_by_keys(session: Session, keys: Iterable[Tuple[str, str]]) -> Dict[Tuple[str, str], int]:
+    keys = list(set(keys))
+    out: Dict[Tuple[str, str], int] = {}
+    for chunk in _chunks(keys):
+        rows = session.execute(
+            select(Team.id, Team.location_name, Team.nickname)
+            .where(tuple_(Team.location_name, Team.nickname).in_(chunk))
+        ).all()
+        out.update({(loc, nick): tid for tid, loc, nick in rows})
+    return out
+
+
+def player_ids_by_team_jersey(session: Session, team_ids: Iterable[int]) -> Dict[Tuple[int, int], int]:
+    """Map (team_id, jersey) -> player id. On duplicate jerseys the lowest id wins."""
+    team_ids = list(set(team_ids))
+    out: Dict[Tuple[int, int], int] = {}
+    for chunk in _chunks(team_ids):
+        rows = session.execute(
+            select(Player.id, Player.team_id, Player.jersey)
+            .where(Player.team_id.in_(chunk))
+            .order_by(Player.id)
+        ).all()
+        for pid, tid, jersey in rows:
+            out.setdefault((tid, jersey), pid)
+    return out
+
+
+def depth_ids_by_team_position(session: Session, team_ids: Iterable[int]) -> Dict[Tuple[int, str], int]:
+    team_ids = list(set(team_ids))
+    out: Dict[Tuple[int, str], int] = {}
+    for chunk in _chunks(team_ids):
+        rows = session.execute(
+            select(DepthChart.id, DepthChart.team_id, DepthChart.position)
+            .where(DepthChart.team_id.in_(chunk))
+        ).all()
+        out.update({(tid, pos): did for did, tid, pos in rows})
+    return out
+
+
+def _resolve_team_id(session: Session, key_to_team_id: Dict[Tuple[str, str], int],
+                     key: Tuple[str, str]) -> Optional[int]:
+    """Teams imported in this run first, then teams that already exist in the DB."""
+    if key == FA_KEY:
+        return None
+    if key not in key_to_team_id:
+        existing = team_by_key(session, key)
+        if existing is None:
+            return None
+        key_to_team_id[key] = existing.id
+    return key_to_team_id[key]
+
+
+def _upsert_many(session: Session, model, rows: List[dict], index_elements: Sequence[str],
+                 update_columns: Sequence[str], *, do_update: bool = True) -> None:
+    """
+    One executemany INSERT ... ON CONFLICT(index_elements) DO UPDATE/NOTHING.
+    index_elements must be backed by a unique constraint on the table.
+    """
+    if not rows:
+        return
+    if session.get_bind().dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    stmt = dialect_insert(model)
+    if do_update:
+        stmt = stmt.on_conflict_do_update(
+            index_elements=list(index_elements),
+            set_={c: stmt.excluded[c] for c in update_columns},
+        )
+    else:
+        stmt = stmt.on_conflict_do_nothing(index_elements=list(index_elements))
+    session.execute(stmt, rows)
+
+
+def _check_player_values(p: PlayerIn) -> None:
+    if p.age < 18:
+        raise ValueError(f"Player {p.first_name} {p.last_name} age {p.age} < 18")
+    if any(r < 0 or r > 100 for r in (getattr(p, f) for f in RATING_FIELDS)):
+        raise ValueError(f"Player {p.first_name} {p.last_name} has rating out of 0..100")
+
+
+def _validate_players(players: List[PlayerIn], trace: ImportTrace) -> None:
+    with trace.phase("validation", rows=len(players)):
+        for p in players:
+            _check_player_values(p)
+
+
+def _unknown_player_team(p: PlayerIn) -> ValueError:
+    return ValueError(f"Unknown team_key for player {p.first_name} {p.last_name}: '{p.team_key}' "
+                      f"(make sure teams.csv was loaded and matches exactly)")
+
+
+def _unknown_depth_team(d: DepthChartIn) -> ValueError:
+    return ValueError(f"Unknown team_key in depth chart: '{d.team_key}'. "
+                      f"Check teams.csv and depth_chart.csv for exact matching.")
+
+
+def _missing_depth_jersey(d: DepthChartIn, role: str, jersey: int, jerseys_on_team: List[int]) -> ValueError:
+    return ValueError(
+        f"Depth chart {role} jersey {jersey} not found on team {d.team_key} "
+        f"for position {d.position}. "
+        f"Available jerseys on that team: {jerseys_on_team[:60]}"
+    )
+
+
 # --- Import core ---------------------------------------------------------------
 def import_roster(
     session: Session,
@@ -46,7 +186,10 @@ def import_roster(
     teams: Iterable[TeamIn],
     players: Iterable[PlayerIn],
     depth_chart: Iterable[DepthChartIn],
-    upsert: bool = True
+    upsert: bool = True,
+    bulk: bool = False,
+    validated: bool = False,
+    trace: Optional[ImportTrace] = None,
 ) -> Dict[str, int]:
     """
     Import the league roster in three phases: TEAMS -> PLAYERS -> DEPTH CHART.
@@ -55,12 +198,62 @@ def import_roster(
       We now call session.flush() *after* inserting/updating players and *before*
       resolving the depth chart. This guarantees that SELECTs used to find starter/
       backup players will see the new rows in the database.
+
+    bulk=True switches to the set-based path: existing rows are preloaded in a few
+    queries, everything is resolved in memory and written with executemany
+    statements. Same summary, same error messages, far fewer round trips.
+
+    Team keys that are not part of `teams` are looked up in the database, so a
+    depth chart can be (re)imported on its own for teams that already exist.
+
+    validated=True skips the per-player age/rating checks; pass it only for rows
+    that already went through columnar.validate_player_columns (or equivalent).
+
+    Pass trace=ImportTrace() to get per-phase timings and SQL statement/row
+    counts back under result["trace"] (also logged); see trace.py.
     """
+    phases = bulk_import if bulk else _orm_import_phases
+    reporting = trace is not None
+    trace = trace if reporting else ImportTrace()
+    trace.meta.setdefault("strategy", "bulk" if bulk else "orm")
+    try:
+        # Depth rows are resolved by (team_id, jersey), so starter/backup are on the
+        # row's team by construction: no need to re-check them on every flush.
+        with trace.watch(session) if reporting else nullcontext(), \
+                skip_flush_validation(session, DepthChart):
+            result = phases(session, teams=teams, players=players, depth_chart=depth_chart,
+                            upsert=upsert, validated=validated, trace=trace)
+            with trace.phase("commit"):
+                session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    if reporting:
+        result["trace"] = trace.summary()
+        trace.log()
+    return result
+
+
+def _orm_import_phases(
+    session: Session,
+    *,
+    teams: Iterable[TeamIn],
+    players: Iterable[PlayerIn],
+    depth_chart: Iterable[DepthChartIn],
+    upsert: bool,
+    validated: bool = False,
+    trace: Optional[ImportTrace] = None,
+) -> Dict[str, int]:
+    """Row-by-row ORM import (one SELECT per team/player/depth row)."""
+    trace = trace or ImportTrace()
     created = updated = skipped = 0
     key_to_team_id: Dict[Tuple[str, str], int] = {}
+    teams, players, depth_chart = list(teams), list(players), list(depth_chart)
+    if not validated:
+        _validate_players(players, trace)
 
-    try:
-        # -------------------- TEAMS --------------------
+    # -------------------- TEAMS --------------------
+    with trace.phase("teams", rows=len(teams)):
         for t in teams:
             key = (t.location_name.strip(), t.nickname.strip())
             existing = team_by_key(session, key)
@@ -86,44 +279,22 @@ def import_roster(
                 key_to_team_id[key] = new_t.id
                 created += 1
 
-        # -------------------- PLAYERS -------------------
+    # -------------------- PLAYERS -------------------
+    with trace.phase("players", rows=len(players)):
         for p in players:
-            if p.age < 18:
-                raise ValueError(f"Player {p.first_name} {p.last_name} age {p.age} < 18")
-
-            ratings = [
-                p.speed, p.strength, p.agility, p.throw_power, p.throw_accuracy,
-                p.catching, p.tackling, p.awareness, p.potential, p.stamina,
-                p.injury_proneness, p.morale
-            ]
-            if any(r < 0 or r > 100 for r in ratings):
-                raise ValueError(f"Player {p.first_name} {p.last_name} has rating out of 0..100")
-
             # team_key like "Arlington|Arrows" or "FA|FA"
-            loc, nick = [s.strip() for s in p.team_key.split("|", 1)]
-            team_id = key_to_team_id.get((loc, nick))
+            key = split_team_key(p.team_key)
+            team_id = _resolve_team_id(session, key_to_team_id, key)
 
             # Non-FA players must map to a known team
-            if (loc, nick) != ("FA", "FA") and not team_id:
-                raise ValueError(f"Unknown team_key for player {p.first_name} {p.last_name}: '{p.team_key}' "
-                                 f"(make sure teams.csv was loaded and matches exactly)")
+            if key != FA_KEY and not team_id:
+                raise _unknown_player_team(p)
 
             existing = player_by_team_jersey(session, team_id, p.jersey) if team_id else None
             if existing:
                 if upsert:
-                    for name, value in [
-                        ("first_name", p.first_name), ("last_name", p.last_name),
-                        ("position", p.position), ("age", p.age),
-                        ("salary", p.salary), ("contract_years", p.contract_years),
-                        ("speed", p.speed), ("strength", p.strength), ("agility", p.agility),
-                        ("throw_power", p.throw_power), ("throw_accuracy", p.throw_accuracy),
-                        ("catching", p.catching), ("tacking", p.tackling),  # typo-safe set_if_attr
-                        ("tackling", p.tackling),
-                        ("awareness", p.awareness), ("potential", p.potential),
-                        ("stamina", p.stamina), ("injury_proneness", p.injury_proneness),
-                        ("morale", p.morale),
-                    ]:
-                        set_if_attr(existing, name, value)
+                    for name in PLAYER_UPDATE_FIELDS:
+                        set_if_attr(existing, name, getattr(p, name))
                     updated += 1
                 else:
                     skipped += 1
@@ -137,31 +308,23 @@ def import_roster(
                 )
                 if team_id:
                     set_if_attr(new_p, "team_id", team_id)
-                for name, value in [
-                    ("salary", p.salary), ("contract_years", p.contract_years),
-                    ("speed", p.speed), ("strength", p.strength), ("agility", p.agility),
-                    ("throw_power", p.throw_power), ("throw_accuracy", p.throw_accuracy),
-                    ("catching", p.catching), ("tackling", p.tackling),
-                    ("awareness", p.awareness), ("potential", p.potential),
-                    ("stamina", p.stamina), ("injury_proneness", p.injury_proneness),
-                    ("morale", p.morale),
-                ]:
-                    set_if_attr(new_p, name, value)
+                for name in PLAYER_UPDATE_FIELDS[4:]:
+                    set_if_attr(new_p, name, getattr(p, name))
                 session.add(new_p)
                 created += 1
 
-        # >>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
-        # IMPORTANT: make sure newly added players are visible to SELECTs
+    # >>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>
+    # IMPORTANT: make sure newly added players are visible to SELECTs
+    with trace.phase("flush"):
         session.flush()
-        # <<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
+    # <<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
 
-        # -------------------- DEPTH CHART ----------------
+    # -------------------- DEPTH CHART ----------------
+    with trace.phase("depth_chart", rows=len(depth_chart)):
         for d in depth_chart:
-            loc, nick = [s.strip() for s in d.team_key.split("|", 1)]
-            team_id = key_to_team_id.get((loc, nick))
+            team_id = _resolve_team_id(session, key_to_team_id, split_team_key(d.team_key))
             if not team_id:
-                raise ValueError(f"Unknown team_key in depth chart: '{d.team_key}'. "
-                                 f"Check teams.csv and depth_chart.csv for exact matching.")
+                raise _unknown_depth_team(d)
 
             jerseys_on_team = sorted(team_jersey_set(session, team_id))
             # Starter
@@ -169,12 +332,7 @@ def import_roster(
                 Player.team_id == team_id, Player.jersey == d.starter_jersey
             ))
             if not starter:
-                msg = (
-                    f"Depth chart starter jersey {d.starter_jersey} not found on team {d.team_key} "
-                    f"for position {d.position}. "
-                    f"Available jerseys on that team: {jerseys_on_team[:60]}"
-                )
-                raise ValueError(msg)
+                raise _missing_depth_jersey(d, "starter", d.starter_jersey, jerseys_on_team)
 
             # Backup (optional)
             backup = None
@@ -183,12 +341,10 @@ def import_roster(
                     Player.team_id == team_id, Player.jersey == d.backup_jersey
                 ))
                 if not backup:
-                    msg = (
-                        f"Depth chart backup jersey {d.backup_jersey} not found on team {d.team_key} "
-                        f"for position {d.position}. "
-                        f"Available jerseys on that team: {jerseys_on_team[:60]}"
-                    )
-                    raise ValueError(msg)
+                    raise _missing_depth_jersey(d, "backup", d.backup_jersey, jerseys_on_team)
+                # the DepthChart flush validator is skipped on this path (see import_roster)
+                if backup.id == starter.id:
+                    raise ValueError("starter and backup cannot be the same player")
 
             existing = session.scalar(select(DepthChart).where(
                 DepthChart.team_id == team_id, DepthChart.position == d.position
@@ -207,69 +363,251 @@ def import_roster(
                 session.add(dc)
                 created += 1
 
-        session.commit()
-        return {"created": created, "updated": updated, "skipped": skipped}
-    except Exception:
-        session.rollback()
-        raise
+    return {"created": created, "updated": updated, "skipped": skipped}
+
+
+def bulk_import(
+    session: Session,
+    *,
+    teams: Iterable[TeamIn],
+    players: Iterable[PlayerIn],
+    depth_chart: Iterable[DepthChartIn],
+    upsert: bool = True,
+    validated: bool = False,
+    trace: Optional[ImportTrace] = None,
+) -> Dict[str, int]:
+    """
+    The set-based phases of import_roster(bulk=True) without the commit: the
+    caller owns the transaction, so several calls (e.g. league blocks) can
+    share one. Same summary and error messages as import_roster.
+
+    Query count is independent of the row count (modulo IN-list chunking):
+    preload teams, upsert teams, reload team ids, preload players,
+    insert/update players, reload player ids, preload depth rows, upsert
+    depth rows.
+
+    Duplicate natural keys inside one import behave like the ORM path with
+    autoflush: the first occurrence is created, later ones count as updates.
+    """
+    trace = trace or ImportTrace()
+    created = updated = skipped = 0
+    teams = list(teams)
+    players = list(players)
+    depth_chart = list(depth_chart)
+    if not validated:
+        _validate_players(players, trace)
+
+    # -------------------- TEAMS --------------------
+    with trace.phase("teams", rows=len(teams)):
+        referenced = {t.natural_key for t in teams}
+        referenced.update(split_team_key(p.team_key) for p in players)
+        referenced.update(split_team_key(d.team_key) for d in depth_chart)
+        referenced.discard(FA_KEY)
+        key_to_team_id = team_ids_by_keys(session, referenced)
+
+        team_rows: Dict[Tuple[str, str], dict] = {}
+        for t in teams:
+            key = t.natural_key
+            seen = key in key_to_team_id or key in team_rows
+            if seen and not upsert:
+                skipped += 1
+                continue
+            if seen:
+                updated += 1
+            else:
+                created += 1
+            team_rows[key] = {
+                "location_name": key[0], "nickname": key[1],
+                "conference": t.conference, "division": t.division,
+                "power_rating": t.power_rating, "cap_space": t.cap_space,
+            }
+        _upsert_many(session, Team, list(team_rows.values()), ("location_name", "nickname"),
+                     ("conference", "division", "power_rating", "cap_space"))
+        key_to_team_id.update(team_ids_by_keys(session, [k for k in team_rows if k not in key_to_team_id]))
+
+    # -------------------- PLAYERS -------------------
+    with trace.phase("players", rows=len(players)):
+        existing_players = player_ids_by_team_jersey(
+            session, {key_to_team_id[split_team_key(p.team_key)] for p in players
+                      if split_team_key(p.team_key) in key_to_team_id}
+        )
+        # (team_id, jersey) -> row to insert or update; the unique index on
+        # players(team_id, jersey) lets both go through one ON CONFLICT upsert
+        rostered: Dict[Tuple[int, int], dict] = {}
+        new_free_agents: List[dict] = []
+        for p in players:
+            key = split_team_key(p.team_key)
+            team_id = key_to_team_id.get(key)
+            if key != FA_KEY and not team_id:
+                raise _unknown_player_team(p)
+
+            values = {name: getattr(p, name) for name in PLAYER_UPDATE_FIELDS}
+            if not team_id:
+                values.update(team_id=None, jersey=p.jersey)
+                new_free_agents.append(values)
+                created += 1
+                continue
+
+            natural = (team_id, p.jersey)
+            values.update(team_id=team_id, jersey=p.jersey)
+            if natural not in existing_players and natural not in rostered:
+                rostered[natural] = values
+                created += 1
+            elif not upsert:
+                skipped += 1
+            else:
+                rostered.setdefault(natural, {}).update(values)
+                updated += 1
+
+        # Core-level executemany: skips ORM per-row bookkeeping we do not need here
+        _upsert_many(session, Player.__table__, list(rostered.values()), ("team_id", "jersey"),
+                     PLAYER_UPDATE_FIELDS)
+        if new_free_agents:
+            session.execute(insert(Player.__table__), new_free_agents)
+
+    # -------------------- DEPTH CHART ----------------
+    with trace.phase("depth_chart", rows=len(depth_chart)):
+        depth_team_ids = {key_to_team_id.get(split_team_key(d.team_key)) for d in depth_chart}
+        depth_team_ids.discard(None)
+        roster: Dict[int, Dict[int, int]] = {}
+        for (team_id, jersey), pid in player_ids_by_team_jersey(session, depth_team_ids).items():
+            roster.setdefault(team_id, {})[jersey] = pid
+        existing_depth = depth_ids_by_team_position(session, depth_team_ids)
+
+        depth_rows: Dict[Tuple[int, str], dict] = {}
+        for d in depth_chart:
+            team_id = key_to_team_id.get(split_team_key(d.team_key))
+            if not team_id:
+                raise _unknown_depth_team(d)
+            jerseys = roster.get(team_id, {})
+            starter_id = jerseys.get(d.starter_jersey)
+            if starter_id is None:
+                raise _missing_depth_jersey(d, "starter", d.starter_jersey, sorted(jerseys))
+
+            backup_id = None
+            if d.backup_jersey not in (None, ""):
+                backup_id = jerseys.get(d.backup_jersey)
+                if backup_id is None:
+                    raise _missing_depth_jersey(d, "backup", d.backup_jersey, sorted(jerseys))
+                if backup_id == starter_id:
+                    raise ValueError("starter and backup cannot be the same player")
+
+            natural = (team_id, d.position)
+            seen = natural in existing_depth or natural in depth_rows
+            if seen and not upsert:
+                skipped += 1
+                continue
+            if seen:
+                updated += 1
+            else:
+                created += 1
+            depth_rows[natural] = {
+                "team_id": team_id, "position": d.position,
+                "starter_player_id": starter_id, "backup_player_id": backup_id,
+            }
+        _upsert_many(session, DepthChart, list(depth_rows.values()), ("team_id", "position"),
+                     ("starter_player_id", "backup_player_id"))
+
+    return {"created": created, "updated": updated, "skipped": skipped}
 
 
 # --- CSV loaders ---------------------------------------------------------------
+PLAYER_INT_FIELDS: Tuple[str, ...] = (
+    "jersey", "age", "salary", "contract_years", "speed", "strength", "agility",
+    "throw_power", "throw_accuracy", "catching", "tackling", "awareness",
+    "potential", "stamina", "injury_proneness", "morale",
+)
+
+
+def _team_from_row(row: Dict[str, str]) -> TeamIn:
+    return TeamIn(**{
+        "location_name": row["location_name"].strip(),
+        "nickname": row["nickname"].strip(),
+        "conference": row["conference"].strip(),
+        "division": row["division"].strip(),
+        "power_rating": int(row["power_rating"]),
+        "cap_space": int(row["cap_space"]),
+    })
+
+
+def _player_from_row(row: Dict[str, str]) -> PlayerIn:
+    payload = {k: row[k] for k in row}
+    # Normalize fields
+    payload["team_key"] = payload["team_key"].strip()
+    for k in PLAYER_INT_FIELDS:
+        payload[k] = int(str(payload[k]).strip())
+    payload["first_name"] = payload["first_name"].strip()
+    payload["last_name"] = payload["last_name"].strip()
+    payload["position"] = payload["position"].strip()
+    return PlayerIn(**payload)
+
+
+def _depth_from_row(row: Dict[str, str]) -> DepthChartIn:
+    team_key = row["team_key"].strip()
+    position = row["position"].strip()
+    starter_raw = str(row["starter_jersey"]).strip()
+    backup_raw = str(row.get("backup_jersey", "")).strip()
+
+    starter = int(starter_raw)
+    backup_int = int(backup_raw) if backup_raw != "" else None
+
+    return DepthChartIn(
+        team_key=team_key,
+        position=position,
+        starter_jersey=starter,
+        backup_jersey=backup_int
+    )
+
+
+def iter_csv_rows(path: str, start_offset: int = 0) -> Iterator[Tuple[Dict[str, str], int]]:
+    """
+    Yield (row, end_offset) for every data row of a CSV file.
+
+    end_offset is the byte position right after the row, so passing it back as
+    start_offset resumes with the next row. Only one row is held at a time.
+    """
+    with open(path, "rb") as f:
+        header = next(csv.reader([f.readline().decode("utf-8-sig")]), [])
+        if start_offset:
+            f.seek(start_offset)
+        pos = f.tell()
+
+        def lines() -> Iterator[str]:
+            nonlocal pos
+            for raw in iter(f.readline, b""):
+                pos += len(raw)
+                yield raw.decode("utf-8")
+
+        for values in csv.reader(lines()):
+            if values:
+                yield dict(zip(header, values)), pos
+
+
+def iter_csv_team(path: str, start_offset: int = 0) -> Iterator[Tuple[TeamIn, int]]:
+    for row, offset in iter_csv_rows(path, start_offset):
+        yield _team_from_row(row), offset
+
+
+def iter_csv_players(path: str, start_offset: int = 0) -> Iterator[Tuple[PlayerIn, int]]:
+    for row, offset in iter_csv_rows(path, start_offset):
+        yield _player_from_row(row), offset
+
+
+def iter_csv_depth(path: str, start_offset: int = 0) -> Iterator[Tuple[DepthChartIn, int]]:
+    for row, offset in iter_csv_rows(path, start_offset):
+        yield _depth_from_row(row), offset
+
+
 def _load_csv_team(path: str) -> List[TeamIn]:
-    out = []
-    with open(path, newline="", encoding="utf-8") as f:
-        r = csv.DictReader(f)
-        for row in r:
-            out.append(TeamIn(**{
-                "location_name": row["location_name"].strip(),
-                "nickname": row["nickname"].strip(),
-                "conference": row["conference"].strip(),
-                "division": row["division"].strip(),
-                "power_rating": int(row["power_rating"]),
-                "cap_space": int(row["cap_space"]),
-            }))
-    return out
+    return [t for t, _ in iter_csv_team(path)]
 
 
 def _load_csv_players(path: str) -> List[PlayerIn]:
-    out = []
-    with open(path, newline="", encoding="utf-8") as f:
-        r = csv.DictReader(f)
-        for row in r:
-            payload = {k: row[k] for k in row}
-            # Normalize fields
-            payload["team_key"] = payload["team_key"].strip()
-            for k in ["jersey", "age", "salary", "contract_years", "speed", "strength", "agility",
-                      "throw_power", "throw_accuracy", "catching", "tackling", "awareness",
-                      "potential", "stamina", "injury_proneness", "morale"]:
-                payload[k] = int(str(payload[k]).strip())
-            payload["first_name"] = payload["first_name"].strip()
-            payload["last_name"] = payload["last_name"].strip()
-            payload["position"] = payload["position"].strip()
-            out.append(PlayerIn(**payload))
-    return out
+    return [p for p, _ in iter_csv_players(path)]
 
 
 def _load_csv_depth(path: str) -> List[DepthChartIn]:
-    out = []
-    with open(path, newline="", encoding="utf-8") as f:
-        r = csv.DictReader(f)
-        for row in r:
-            team_key = row["team_key"].strip()
-            position = row["position"].strip()
-            starter_raw = str(row["starter_jersey"]).strip()
-            backup_raw = str(row.get("backup_jersey", "")).strip()
-
-            starter = int(starter_raw)
-            backup_int = int(backup_raw) if backup_raw != "" else None
-
-            out.append(DepthChartIn(
-                team_key=team_key,
-                position=position,
-                starter_jersey=starter,
-                backup_jersey=backup_int
-            ))
-    return out
+    return [d for d, _ in iter_csv_depth(path)]
 
 
 def _load_json(path: str) -> List[dict]:
@@ -278,17 +616,42 @@ def _load_json(path: str) -> List[dict]:
 
 
 # --- CLI entrypoints -----------------------------------------------------------
-def cli_import_from_dir(path: str) -> Dict[str, int]:
+def cli_import_from_dir(path: str, bulk: bool = False, columnar: bool = False,
+                        trace_file: Optional[str] = None, fast: bool = False) -> Dict[str, int]:
     """
     Import from a directory that contains teams.csv, players.csv, depth_chart.csv.
+
+    columnar=True validates players.csv column-wise (all bad rows reported at
+    once) and imports through the bulk path without re-validating.
+
+    The import is always traced (result["trace"], logged); trace_file also
+    writes the trace as JSON.
+
+    fast=True opens the database with the "bulk-load" profile (no rollback
+    journal on disk, synchronous=OFF): a crash mid-import can corrupt it.
     """
-    teams = _load_csv_team(f"{path}/teams.csv")
-    players = _load_csv_players(f"{path}/players.csv")
-    depth = _load_csv_depth(f"{path}/depth_chart.csv")
+    trace = ImportTrace(strategy="columnar" if columnar else "bulk" if bulk else "orm", source=path)
+    with trace.phase("csv_parse") as parse:
+        teams = _load_csv_team(f"{path}/teams.csv")
+        if columnar:
+            from .columnar import read_player_columns, validate_player_columns
+            columns = read_player_columns(f"{path}/players.csv")
+        else:
+            # PlayerIn validation happens while parsing here
+            players = _load_csv_players(f"{path}/players.csv")
+        depth = _load_csv_depth(f"{path}/depth_chart.csv")
+        parse.rows = len(teams) + len(columns if columnar else players) + len(depth)
+    if columnar:
+        with trace.phase("validation", rows=len(columns)):
+            players = validate_player_columns(columns).to_rows()
 
     create_db_and_tables()
-    with get_session() as session:
-        return import_roster(session, teams=teams, players=players, depth_chart=depth, upsert=True)
+    with session_scope(profile=import_profile(fast)) as session:
+        res = import_roster(session, teams=teams, players=players, depth_chart=depth,
+                            upsert=True, bulk=bulk or columnar, validated=columnar, trace=trace)
+    if trace_file:
+        trace.write_json(trace_file)
+    return res
 
 
 def main():
@@ -296,9 +659,39 @@ def main():
         description="Import roster from a directory containing teams.csv, players.csv, depth_chart.csv."
     )
     parser.add_argument("--from", dest="from_path", required=True,
-                        help="Directory with teams.csv, players.csv, depth_chart.csv")
+                        help="Directory with teams.csv, players.csv, depth_chart.csv, "
+                             "or a league snapshot file (*.ffsnap)")
+    parser.add_argument("--bulk", action="store_true",
+                        help="Use the set-based bulk import path")
+    parser.add_argument("--columnar", action="store_true",
+                        help="Validate players.csv column-wise and report every bad row (implies --bulk)")
+    parser.add_argument("--chunk-size", type=int, default=None,
+                        help="Stream the CSVs and commit every N rows (implies --bulk)")
+    parser.add_argument("--checkpoint", default=None,
+                        help="Checkpoint file for resumable streaming imports")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Only write rows/files that changed since the last import")
+    parser.add_argument("--trace-file", default=None,
+                        help="Write per-phase timings and SQL counts as JSON (plain CSV imports)")
+    parser.add_argument("--fast", action="store_true",
+                        help="Use the bulk-load SQLite profile (synchronous=OFF): faster, but a crash "
+                             "mid-import can corrupt the database")
     args = parser.parse_args()
-    res = cli_import_from_dir(args.from_path)
+    configure_logging()
+    if os.path.isfile(args.from_path):
+        from .snapshot import cli_import_snapshot
+        res = cli_import_snapshot(args.from_path, fast=args.fast)
+    elif args.incremental:
+        from .delta import cli_import_incremental
+        res = cli_import_incremental(args.from_path, fast=args.fast)
+    elif args.chunk_size or args.checkpoint:
+        from .stream import DEFAULT_CHUNK_SIZE, cli_stream_import_from_dir
+        res = cli_stream_import_from_dir(args.from_path, chunk_size=args.chunk_size or DEFAULT_CHUNK_SIZE,
+                                         checkpoint_path=args.checkpoint, fast=args.fast)
+    else:
+        res = cli_import_from_dir(args.from_path, bulk=args.bulk, columnar=args.columnar,
+                                  trace_file=args.trace_file, fast=args.fast)
+    res.pop("trace", None)  # already logged phase by phase
     print(f"Import summary: {res}")
 
 
@@ -0,0 +1,341 @@
+"""
+Compact columnar league snapshot (*.ffsnap).
+
+Layout (little-endian, every column 8-byte aligned):
+
+    header     magic "FFSNAP\\0\\1", version, column count
+    directory  one entry per column: name, array typecode, byte offset, item count
+    columns    raw array bytes
+
+Strings (names, team keys, positions, conferences, divisions) live once in a
+string table ("str.offsets" + "str.blob"); row columns store uint32 indexes
+into it. Ratings/jersey/age are uint8 columns, money is int64; write_snapshot
+raises ValueError for a value its column cannot hold.
+
+LeagueSnapshot opens the file through mmap and hands out memoryview columns,
+so reading costs no per-row objects until rows are actually requested:
+
+    write_snapshot("league.ffsnap", *make_league(seed=2025))
+    with LeagueSnapshot("league.ffsnap") as snap:
+        snap.validate()
+        import_roster(session, teams=snap.team_rows(), players=snap.player_rows(),
+                      depth_chart=snap.depth_rows(), bulk=True, validated=True)
+
+or simply import_snapshot(session, "league.ffsnap").
+"""
+
+from __future__ import annotations
+
+import argparse
+import mmap
+import struct
+import sys
+from operator import attrgetter
+from array import array
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.models.database import create_db_and_tables, import_profile, session_scope
+from .columnar import PlayerRow, RATING_FIELDS, _out_of_range, read_player_columns, validate_player_columns
+from .schemas import TeamIn, PlayerIn, DepthChartIn, POSITIONS
+
+MAGIC = b"FFSNAP\x00\x01"
+VERSION = 1
+_HEADER = struct.Struct("<8sII")          # magic, version, n_columns
+_DIR_ENTRY = struct.Struct("<32sc7xQQ")   # name, typecode, pad, offset, count
+_ALIGN = 8
+
+# (column, typecode) in file order; typecodes are array/memoryview formats
+TEAM_COLUMNS: Tuple[Tuple[str, str], ...] = (
+    ("team.location_name", "I"), ("team.nickname", "I"), ("team.conference", "I"),
+    ("team.division", "I"), ("team.power_rating", "B"), ("team.cap_space", "q"),
+)
+PLAYER_COLUMNS: Tuple[Tuple[str, str], ...] = (
+    ("player.first_name", "I"), ("player.last_name", "I"), ("player.position", "I"),
+    ("player.team_key", "I"), ("player.jersey", "B"), ("player.age", "B"),
+    ("player.salary", "q"), ("player.contract_years", "B"),
+) + tuple((f"player.{name}", "B") for name in RATING_FIELDS)
+DEPTH_COLUMNS: Tuple[Tuple[str, str], ...] = (
+    ("depth.team_key", "I"), ("depth.position", "I"),
+    ("depth.starter_jersey", "B"), ("depth.backup_jersey", "h"),   # -1 = no backup
+)
+STRING_COLUMNS: Tuple[Tuple[str, str], ...] = (("str.offsets", "I"), ("str.blob", "B"))
+
+_PLAYER_STR_FIELDS = ("first_name", "last_name", "position", "team_key")
+
+# value range of each numeric typecode the row columns use
+_TYPECODE_RANGES: Dict[str, Tuple[int, int]] = {
+    "B": (0, 0xFF), "h": (-0x8000, 0x7FFF), "q": (-(1 << 63), (1 << 63) - 1),
+}
+
+
+class TeamRow(NamedTuple):
+    """Attribute-compatible with TeamIn (including natural_key)."""
+    location_name: str
+    nickname: str
+    conference: str
+    division: str
+    power_rating: int
+    cap_space: int
+
+    @property
+    def natural_key(self) -> Tuple[str, str]:
+        return (self.location_name.strip(), self.nickname.strip())
+
+
+class DepthRow(NamedTuple):
+    """Attribute-compatible with DepthChartIn."""
+    team_key: str
+    position: str
+    starter_jersey: int
+    backup_jersey: Optional[int]
+
+
+def _check_byteorder() -> None:
+    if sys.byteorder != "little":
+        raise RuntimeError("league snapshots are little-endian; big-endian hosts are not supported")
+
+
+# --- Writing -------------------------------------------------------------------
+def _packed(name: str, typecode: str, values: list) -> array:
+    """array(typecode, values), or ValueError naming the column and first row that doesn't fit."""
+    lo, hi = _TYPECODE_RANGES[typecode]
+    bad = _out_of_range(values, lo, hi)
+    if bad:
+        i = bad[0]
+        raise ValueError(f"{name} row {i + 1}: {values[i]} does not fit the column ({lo}..{hi}); "
+                         f"{len(bad)} row(s) out of range")
+    return array(typecode, values)
+
+
+class _StringTable:
+    def __init__(self) -> None:
+        self.index: Dict[str, int] = {}
+
+    def __call__(self, s: str) -> int:
+        idx = self.index.get(s)
+        if idx is None:
+            idx = self.index[s] = len(self.index)
+        return idx
+
+    def columns(self) -> Tuple[array, array]:
+        offsets, blob = array("I", [0]), bytearray()
+        for s in self.index:  # dicts keep insertion order == index order
+            blob += s.encode("utf-8")
+            offsets.append(len(blob))
+        return offsets, array("B", blob)
+
+
+def write_snapshot(
+    path: str,
+    teams: Iterable[TeamIn],
+    players: Iterable[PlayerIn],
+    depth_chart: Iterable[DepthChartIn],
+) -> None:
+    """Write a league (e.g. make_league() output) as one snapshot file."""
+    _check_byteorder()
+    teams, players, depth_chart = list(teams), list(players), list(depth_chart)
+    st = _StringTable()
+    cols: Dict[str, array] = {}
+
+    # one pass per column: a comprehension + array() beats per-row appends
+    def column(name: str, typecode: str, rows: list, field: str, strings: bool = False) -> None:
+        get = attrgetter(field)
+        if strings:
+            cols[name] = array(typecode, [st(get(r)) for r in rows])
+        else:
+            cols[name] = _packed(name, typecode, list(map(get, rows)))
+
+    for name, typecode in TEAM_COLUMNS:
+        column(name, typecode, teams, name[5:], strings=typecode == "I")
+    for name, typecode in PLAYER_COLUMNS:
+        column(name, typecode, players, name[7:], strings=typecode == "I")
+    column("depth.team_key", "I", depth_chart, "team_key", strings=True)
+    column("depth.position", "I", depth_chart, "position", strings=True)
+    column("depth.starter_jersey", "B", depth_chart, "starter_jersey")
+    cols["depth.backup_jersey"] = _packed("depth.backup_jersey", "h", [
+        -1 if d.backup_jersey is None else d.backup_jersey for d in depth_chart])
+
+    cols["str.offsets"], cols["str.blob"] = st.columns()
+    _write_columns(path, cols)
+
+
+def _write_columns(path: str, cols: Dict[str, array]) -> None:
+    names = [name for name, _ in STRING_COLUMNS + TEAM_COLUMNS + PLAYER_COLUMNS + DEPTH_COLUMNS]
+    offset = _HEADER.size + _DIR_ENTRY.size * len(names)
+    directory, layout = [], []
+    for name in names:
+        offset = -(-offset // _ALIGN) * _ALIGN
+        arr = cols[name]
+        directory.append(_DIR_ENTRY.pack(name.encode("ascii"), arr.typecode.encode("ascii"), offset, len(arr)))
+        layout.append((offset, arr))
+        offset += len(arr) * arr.itemsize
+
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, len(names)))
+        f.write(b"".join(directory))
+        for col_offset, arr in layout:
+            f.write(b"\x00" * (col_offset - f.tell()))
+            arr.tofile(f)
+
+
+# --- Reading -------------------------------------------------------------------
+class LeagueSnapshot:
+    """Read-only, mmap-backed view of a snapshot file. Use as a context manager."""
+
+    def __init__(self, path: str) -> None:
+        _check_byteorder()
+        self.path = path
+        self._file = open(path, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._buf = memoryview(self._mmap)
+        try:
+            magic, version, n_columns = _HEADER.unpack_from(self._buf, 0)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"{path}: not a league snapshot (or unsupported version)")
+            self._cols: Dict[str, memoryview] = {}
+            for i in range(n_columns):
+                raw_name, typecode, offset, count = _DIR_ENTRY.unpack_from(
+                    self._buf, _HEADER.size + i * _DIR_ENTRY.size
+                )
+                view = self._buf[offset:offset + count * struct.calcsize(typecode.decode())]
+                self._cols[raw_name.rstrip(b"\x00").decode("ascii")] = view.cast(typecode.decode())
+            self.strings = self._decode_strings()
+        except Exception:
+            self.close()
+            raise
+
+    def _decode_strings(self) -> List[str]:
+        offsets, blob = self._cols["str.offsets"], self._cols["str.blob"]
+        raw = blob.tobytes()
+        return [raw[offsets[i]:offsets[i + 1]].decode("utf-8") for i in range(len(offsets) - 1)]
+
+    def column(self, name: str) -> memoryview:
+        return self._cols[name]
+
+    @property
+    def n_teams(self) -> int:
+        return len(self._cols["team.power_rating"])
+
+    @property
+    def n_players(self) -> int:
+        return len(self._cols["player.jersey"])
+
+    @property
+    def n_depth(self) -> int:
+        return len(self._cols["depth.starter_jersey"])
+
+    def _str_column(self, name: str) -> Iterator[str]:
+        return map(self.strings.__getitem__, self._cols[name])
+
+    # rows are built lazily from the columns; strings are shared, not re-decoded
+    def team_rows(self) -> Iterator[TeamRow]:
+        cols = [self._str_column(f"team.{f}") for f in ("location_name", "nickname", "conference", "division")]
+        cols += [self._cols["team.power_rating"], self._cols["team.cap_space"]]
+        return map(TeamRow._make, zip(*cols))
+
+    def player_rows(self) -> Iterator[PlayerRow]:
+        cols: List[Iterable] = [self._str_column(f"player.{f}") for f in _PLAYER_STR_FIELDS]
+        cols += [self._cols[f"player.{f}"] for f in PlayerRow._fields[len(_PLAYER_STR_FIELDS):]]
+        return map(PlayerRow._make, zip(*cols))
+
+    def depth_rows(self) -> Iterator[DepthRow]:
+        backups = (None if b < 0 else b for b in self._cols["depth.backup_jersey"])
+        return map(DepthRow._make, zip(
+            self._str_column("depth.team_key"), self._str_column("depth.position"),
+            self._cols["depth.starter_jersey"], backups,
+        ))
+
+    def validate(self) -> None:
+        """Column-wise range/enum checks (the file may not come from write_snapshot)."""
+        errors: List[str] = []
+        n_strings = len(self.strings)
+        for name, typecode in TEAM_COLUMNS + PLAYER_COLUMNS + DEPTH_COLUMNS:
+            if typecode == "I":
+                col = self._cols[name]
+                errors += [f"{name} row {i + 1}: string index {col[i]} out of 0..{n_strings - 1}"
+                           for i in _out_of_range(col, 0, n_strings - 1)]
+        if errors:
+            # every check below looks strings up; a bad index would fail there first
+            self._raise(errors)
+        ages = self._cols["player.age"]
+        errors += [f"player row {i + 1}: age {ages[i]} < 18" for i in _out_of_range(ages, 18, None)]
+        for name in RATING_FIELDS:
+            col = self._cols[f"player.{name}"]
+            errors += [f"player row {i + 1}: {name} {col[i]} out of 0..100" for i in _out_of_range(col, 0, 100)]
+        for table in ("player", "depth"):
+            col = self._cols[f"{table}.position"]
+            bad = {idx for idx in set(col) if self.strings[idx] not in POSITIONS}
+            errors += [f"{table} row {i + 1}: position {self.strings[v]!r} not in {POSITIONS}"
+                       for i, v in enumerate(col) if v in bad]
+            col = self._cols[f"{table}.team_key"]
+            bad = {idx for idx in set(col) if "|" not in self.strings[idx]}
+            errors += [f"{table} row {i + 1}: team_key {self.strings[v]!r} must look like 'location|nickname'"
+                       for i, v in enumerate(col) if v in bad]
+        if errors:
+            self._raise(errors)
+
+    def _raise(self, errors: List[str]) -> None:
+        shown = "\n  ".join(errors[:50])
+        raise ValueError(f"{len(errors)} invalid row(s) in {self.path}:\n  {shown}")
+
+    def close(self) -> None:
+        # memoryviews must be released before the mmap can be closed
+        for view in getattr(self, "_cols", {}).values():
+            view.release()
+        self._cols = {}
+        if getattr(self, "_buf", None) is not None:
+            self._buf.release()
+            self._buf = None
+        if not self._mmap.closed:
+            self._mmap.close()
+        self._file.close()
+
+    def __enter__(self) -> "LeagueSnapshot":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+# --- Import / convert ----------------------------------------------------------
+def import_snapshot(session: Session, path: str, *, upsert: bool = True) -> Dict[str, int]:
+    """Validate column-wise, then import through the bulk path without per-row re-validation."""
+    from .ingest import import_roster
+
+    with LeagueSnapshot(path) as snap:
+        snap.validate()
+        return import_roster(
+            session, teams=snap.team_rows(), players=snap.player_rows(),
+            depth_chart=snap.depth_rows(), upsert=upsert, bulk=True, validated=True,
+        )
+
+
+def csv_to_snapshot(csv_dir: str, out_path: str) -> None:
+    """Convert a teams.csv / players.csv / depth_chart.csv directory into a snapshot."""
+    from .ingest import _load_csv_depth, _load_csv_team
+
+    players = validate_player_columns(read_player_columns(f"{csv_dir}/players.csv")).to_rows()
+    write_snapshot(out_path, _load_csv_team(f"{csv_dir}/teams.csv"), players,
+                   _load_csv_depth(f"{csv_dir}/depth_chart.csv"))
+
+
+def cli_import_snapshot(path: str, fast: bool = False) -> Dict[str, int]:
+    create_db_and_tables()
+    with session_scope(profile=import_profile(fast)) as session:
+        return import_snapshot(session, path)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Convert a roster CSV directory into a league snapshot.")
+    parser.add_argument("--from", dest="from_path", required=True,
+                        help="Directory with teams.csv, players.csv, depth_chart.csv")
+    parser.add_argument("--out", required=True, help="Snapshot file to write (e.g. league.ffsnap)")
+    args = parser.parse_args(argv)
+    csv_to_snapshot(args.from_path, args.out)
+    print(f"Snapshot written: {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+Streaming, chunked CSV import with a resumable checkpoint.
+
+The CSV files are read with generators and fed to import_roster() in chunks of
+`chunk_size` rows; every chunk is its own transaction. Memory is bounded by the
+chunk size, not by the file size, and a failure only rolls back the chunk that
+was in flight.
+
+After each committed chunk a small JSON checkpoint is written:
+
+    {"phase": "players", "offset": 1048576, "chunk": 12, ...}
+
+Re-running with the same checkpoint path resumes from that byte offset. The
+checkpoint file is removed once the whole directory has been imported.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from functools import partial
+from itertools import islice
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.models.database import create_db_and_tables, import_profile, session_scope
+from .ingest import import_roster, iter_csv_depth, iter_csv_players, iter_csv_team
+
+# Import order matters: players need teams, depth rows need players
+PHASES: Tuple[Tuple[str, str, Callable], ...] = (
+    ("teams", "teams.csv", iter_csv_team),
+    ("players", "players.csv", iter_csv_players),
+    ("depth_chart", "depth_chart.csv", iter_csv_depth),
+)
+
+DEFAULT_CHUNK_SIZE = 5_000
+
+
+@dataclass
+class ImportCheckpoint:
+    """Progress marker: everything before (phase, offset) is committed."""
+    phase: str = PHASES[0][0]
+    offset: int = 0
+    chunk: int = 0          # number of the last committed chunk (0 = none yet)
+    file_size: int = 0      # size of the phase file when the checkpoint was taken
+    summary: Dict[str, int] = field(
+        default_factory=lambda: {"created": 0, "updated": 0, "skipped": 0}
+    )
+
+    @classmethod
+    def load(cls, path: str) -> Optional["ImportCheckpoint"]:
+        if not os.path.exists(path):
+            return None
+        with open(path, encoding="utf-8") as f:
+            return cls(**json.load(f))
+
+    def save(self, path: str) -> None:
+        # write-then-rename so a crash never leaves a half-written checkpoint
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(asdict(self), f)
+        os.replace(tmp, path)
+
+
+def _chunked(rows: Iterator[Tuple[object, int]], size: int) -> Iterator[Tuple[List[object], int]]:
+    """Group (item, end_offset) pairs into (items, offset_after_last_item)."""
+    while True:
+        batch = list(islice(rows, size))
+        if not batch:
+            return
+        yield [item for item, _ in batch], batch[-1][1]
+
+
+def stream_import(
+    session_factory: Callable[[], Session],
+    path: str,
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    checkpoint_path: Optional[str] = None,
+    upsert: bool = True,
+    bulk: bool = True,
+) -> Dict[str, int]:
+    """
+    Import teams.csv, players.csv and depth_chart.csv from `path` chunk by chunk.
+
+    session_factory must return a context-managed Session (e.g. SessionLocal or
+    session_scope); one session is opened per chunk.
+    Returns the usual created/updated/skipped summary plus the chunk count.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be >= 1")
+
+    cp = (ImportCheckpoint.load(checkpoint_path) if checkpoint_path else None) or ImportCheckpoint()
+    phase_names = [name for name, _, _ in PHASES]
+    start_phase = phase_names.index(cp.phase)
+
+    for i, (name, filename, reader) in enumerate(PHASES[start_phase:], start=start_phase):
+        file_path = os.path.join(path, filename)
+        size = os.path.getsize(file_path)
+        if name == cp.phase and cp.offset and cp.file_size != size:
+            raise ValueError(f"Checkpoint does not match {file_path} (file changed since "
+                             f"chunk {cp.chunk}); delete {checkpoint_path} to start over.")
+        offset = cp.offset if name == cp.phase else 0
+
+        for items, end_offset in _chunked(reader(file_path, offset), chunk_size):
+            kwargs = {"teams": [], "players": [], "depth_chart": []}
+            kwargs[name] = items
+            with session_factory() as session:
+                res = import_roster(session, upsert=upsert, bulk=bulk, **kwargs)
+            for k in cp.summary:
+                cp.summary[k] += res[k]
+            cp.phase, cp.offset, cp.file_size = name, end_offset, size
+            cp.chunk += 1
+            if checkpoint_path:
+                cp.save(checkpoint_path)
+
+        # phase finished: record that the next one starts at its first row
+        if i + 1 < len(PHASES):
+            cp.phase, cp.offset, cp.file_size = phase_names[i + 1], 0, 0
+            if checkpoint_path:
+                cp.save(checkpoint_path)
+
+    if checkpoint_path and os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+    return {**cp.summary, "chunks": cp.chunk}
+
+
+def cli_stream_import_from_dir(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                               checkpoint_path: Optional[str] = None,
+                               bulk: bool = True, fast: bool = False) -> Dict[str, int]:
+    """CLI flavour of stream_import() against the app database (fast: see import_profile)."""
+    create_db_and_tables()
+    return stream_import(partial(session_scope, profile=import_profile(fast)), path, chunk_size=chunk_size,
+                         checkpoint_path=checkpoint_path, bulk=bulk)
@@ -0,0 +1,99 @@
+"""
+Import instrumentation: wall time, SQL statements and rows per phase.
+
+    trace = ImportTrace(strategy="bulk")
+    with trace.phase("csv_parse"):
+        players = _load_csv_players(path)
+    res = import_roster(session, ..., trace=trace)   # adds res["trace"]
+    trace.write_json("import-trace.json")
+
+Phases used by the importer: csv_parse, validation, teams, players, flush,
+depth_chart, commit. Statements are counted with an after_cursor_execute
+listener on the session's engine while the import runs (so statements from
+other sessions on the same engine during that window are counted too).
+"sql_rows" is the driver's rowcount (rows written; statements with RETURNING,
+like the ORM's batched INSERTs, report none); "rows" is the number of input
+rows the phase handled.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Dict, Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.logging import get_logger
+
+PHASES = ("csv_parse", "validation", "teams", "players", "flush", "depth_chart", "commit")
+
+log = get_logger("importer")
+
+
+@dataclass
+class PhaseStats:
+    seconds: float = 0.0
+    statements: int = 0
+    sql_rows: int = 0
+    rows: int = 0
+
+
+class ImportTrace:
+    """Collects PhaseStats per phase name; phases can be entered more than once (stats add up)."""
+
+    def __init__(self, **meta: object) -> None:
+        self.meta: Dict[str, object] = dict(meta)
+        self.phases: Dict[str, PhaseStats] = {}
+        self._current: Optional[PhaseStats] = None
+
+    @contextmanager
+    def phase(self, name: str, rows: int = 0) -> Iterator[PhaseStats]:
+        stats = self.phases.setdefault(name, PhaseStats())
+        outer, self._current = self._current, stats
+        t0 = time.perf_counter()
+        try:
+            yield stats
+        finally:
+            stats.seconds += time.perf_counter() - t0
+            stats.rows += rows
+            self._current = outer
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        stats = self._current
+        if stats is not None:
+            stats.statements += 1
+            if cursor.rowcount > 0:
+                stats.sql_rows += cursor.rowcount
+
+    @contextmanager
+    def watch(self, session: Session) -> Iterator["ImportTrace"]:
+        """Count SQL statements on the session's engine for the duration of the block."""
+        engine = session.get_bind()
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+        try:
+            yield self
+        finally:
+            event.remove(engine, "after_cursor_execute", self._after_cursor_execute)
+
+    def summary(self) -> Dict[str, object]:
+        return {
+            **self.meta,
+            "total_seconds": round(sum(s.seconds for s in self.phases.values()), 6),
+            "statements": sum(s.statements for s in self.phases.values()),
+            "phases": {name: dict(asdict(s), seconds=round(s.seconds, 6)) for name, s in self.phases.items()},
+        }
+
+    def log(self) -> None:
+        for name, s in self.phases.items():
+            log.info("import phase=%s seconds=%.4f statements=%d sql_rows=%d rows=%d",
+                     name, s.seconds, s.statements, s.sql_rows, s.rows)
+        total = self.summary()
+        log.info("import total seconds=%.4f statements=%d", total["total_seconds"], total["statements"])
+
+    def write_json(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.summary(), f, indent=2)
@@ -1,73 +1,370 @@
 from __future__ import annotations
 
-from typing import Annotated, List, Optional
+import zlib
+from contextlib import asynccontextmanager
+from enum import Enum
+from typing import Annotated, AsyncIterator, List, Optional, Tuple
 
-from fastapi import Depends, FastAPI, HTTPException, Query
-from sqlalchemy.orm import Session
+from fastapi import Depends, FastAPI, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from pydantic import TypeAdapter
+from sqlalchemy import func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
 
-from app.models.database import get_session, create_db_and_tables
-from app.models import Team, Player, DepthChart, GameResult
-from app.models.dtos import TeamDTO, PlayerDTO, DepthChartDTO, GameResultDTO
+from app.models.database import create_db_and_tables
+from app.models.async_database import (
+    SessionScope, dispose_async_engines, get_async_session, get_async_session_scope,
+)
+from app.models import Team, Player, DepthChart, GameResult, PlayerSeasonStats
+from app.models.versions import data_etag
+from app.models.dtos import (
+    TeamDTO, PlayerDTO, DepthChartDTO, GameResultDTO, PlayerSummaryDTO, DepthChartEntryDTO, TeamBundleDTO,
+    PlayerSeasonStatsDTO, dump_ndjson, dump_rows, parse_fields,
+)
+from app.core.logging import get_logger
+from app.ui.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, MetricsMiddleware, render_metrics
+from app.ui.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, NEXT_CURSOR_HEADER, InvalidCursor, keyset_page
+
+log = get_logger("api")
+
+def bootstrap_db() -> None:
+    """
+    Best-effort: create tables for local sqlite if missing. Cheap once the
+    database carries the current schema version (see create_db_and_tables).
+    """
+    try:
+        create_db_and_tables()
+    except Exception:
+        log.warning("database bootstrap failed; continuing without it", exc_info=True)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Bootstrap on startup, not at import: importing the app stays cheap
+    # for workers, scripts and test collection
+    await run_in_threadpool(bootstrap_db)
+    yield
+    await dispose_async_engines()
 
 # Create the FastAPI app FIRST, then use it in route decorators
-app = FastAPI(title="Franchise Football API", version="0.1.0")
+app = FastAPI(title="Franchise Football API", version="0.1.0", lifespan=lifespan)
+app.add_middleware(MetricsMiddleware)
 
 @app.get("/health")
 def health():
     # tests expect a "version" key
     return {"status": "ok", "version": app.version}
 
-SessionDep = Annotated[Session, Depends(get_session)]
+@app.get("/metrics", include_in_schema=False)
+def metrics() -> Response:
+    """Prometheus text exposition of the request and SQL metrics (see app/ui/metrics.py)."""
+    return Response(content=render_metrics(), media_type=METRICS_CONTENT_TYPE)
+
+# Endpoints are async: a request waiting on the database doesn't hold a threadpool worker,
+# and the ETag check (conditional) reads its data versions on the same session
+AsyncSessionDep = Annotated[AsyncSession, Depends(get_async_session)]
+# For streaming bodies: the session is opened by the body itself, see _ndjson_stream
+AsyncSessionScopeDep = Annotated[SessionScope, Depends(get_async_session_scope)]
+
+def _etag_matches(if_none_match: Optional[str], tag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(t.strip().removeprefix("W/") == tag for t in if_none_match.split(","))
+
+def conditional(*tables: str):
+    """
+    Route dependency: ETag from the tables' data versions (app/models/versions.py).
+    A matching If-None-Match gets 304 before the endpoint runs its own queries
+    (and with the versions cached, before any query at all).
+    """
+    async def check(request: Request, response: Response, session: AsyncSessionDep) -> str:
+        return await _check_etag(request, response, session, tables)
+    return Depends(check)
+
+async def _check_etag(request: Request, response: Response, session: AsyncSession,
+                      tables: Tuple[str, ...]) -> str:
+    tag = await data_etag(session, *tables)
+    headers = {"ETag": tag, "Cache-Control": "no-cache"}
+    if _etag_matches(request.headers.get("if-none-match"), tag):
+        raise HTTPException(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return tag
+
+RATING_FIELDS = (
+    "speed", "strength", "agility", "throw_power", "throw_accuracy", "catching",
+    "tackling", "awareness", "potential", "stamina", "injury_proneness", "morale",
+)
+
+def _parse_min_ratings(values: List[str]) -> List[Tuple[str, int]]:
+    """['speed:80', 'awareness:70'] -> [('speed', 80), ('awareness', 70)]; 400 on anything else."""
+    out = []
+    for value in values:
+        name, _, threshold = value.partition(":")
+        if name not in RATING_FIELDS or not threshold.isdigit():
+            raise HTTPException(status_code=400,
+                                detail=f"min_rating must look like speed:80 with one of {', '.join(RATING_FIELDS)}")
+        out.append((name, int(threshold)))
+    return out
+
+async def _page(session: AsyncSession, response: Response, q, keys, cursor: Optional[str], limit: int,
+                *, scalars: bool = True):
+    try:
+        rows, next_cursor = await keyset_page(session, q, keys, cursor, limit, scalars=scalars)
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return rows
+
+async def _json_list(session: AsyncSession, response: Response, q, model, dto, *,
+                     fields: Optional[str] = None, keys=(), cursor: Optional[str] = None,
+                     limit: Optional[int] = None) -> Response:
+    """
+    Fast path for list endpoints: SELECT the DTO's columns (or the fields=
+    subset) as tuples and serialize the whole list with one cached
+    TypeAdapter.dump_json call. No ORM entities, no model per row, and no
+    second validation against response_model: the raw JSON Response (with
+    `response`'s headers: ETag, next cursor) goes out as is.
+    With `keys`, the list is in key order, and one keyset page when a cursor
+    or limit is given; key columns not asked for are fetched for the cursor
+    but left out of the JSON.
+    """
+    try:
+        selected = parse_fields(dto, fields) if fields is not None else tuple(dto.model_fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    columns = [getattr(model, f) for f in selected]
+    columns += [k for k in keys if k.key not in selected]   # trailing: dump_rows() drops them
+    q = q.with_only_columns(*columns)
+    if keys and (cursor is not None or limit is not None):
+        rows = await _page(session, response, q, keys, cursor, limit or DEFAULT_PAGE_SIZE, scalars=False)
+    else:
+        rows = (await session.execute(q.order_by(*keys) if keys else q)).all()
+    return Response(content=dump_rows(dto, selected, rows), media_type="application/json",
+                    headers=dict(response.headers))
 
 # --- Teams ---
-@app.get("/teams", response_model=List[TeamDTO])
-def list_teams(session: SessionDep) -> List[TeamDTO]:
-    rows = session.query(Team).all()
-    return [TeamDTO.model_validate(r) for r in rows]
-
-@app.get("/teams/{team_id}", response_model=TeamDTO)
-def get_team(team_id: int, session: SessionDep) -> TeamDTO:
-    row = session.get(Team, team_id)
+@app.get("/teams", response_model=List[TeamDTO], dependencies=[conditional("teams")])
+async def list_teams(session: AsyncSessionDep, response: Response) -> List[TeamDTO]:
+    return await _json_list(session, response, select(Team).order_by(Team.id), Team, TeamDTO)
+
+# --- Team bundles ---
+MAX_BUNDLE_TEAMS = 128
+BUNDLE_TABLES = ("teams", "players", "depth_charts")
+_bundles_adapter = TypeAdapter(List[TeamBundleDTO])
+
+def _summary(player: Optional[Player]) -> Optional[PlayerSummaryDTO]:
+    return PlayerSummaryDTO.model_validate(player) if player is not None else None
+
+def _bundle(team: Team) -> TeamBundleDTO:
+    return TeamBundleDTO(
+        team=TeamDTO.model_validate(team),
+        players=[PlayerDTO.model_validate(p) for p in sorted(team.players, key=lambda p: p.id)],
+        depth_chart=[
+            DepthChartEntryDTO(position=dc.position, starter=_summary(dc.starter_player),
+                               backup=_summary(dc.backup_player))
+            for dc in sorted(team.depth_charts, key=lambda dc: dc.id)
+        ],
+    )
+
+async def _load_bundles(session: AsyncSession, team_ids: Optional[List[int]]) -> List[TeamBundleDTO]:
+    """
+    Teams with roster and depth chart in three queries, however many teams:
+    teams, then players (selectin), then depth rows with starter/backup joined.
+    """
+    q = (
+        select(Team)
+        .options(
+            selectinload(Team.players),
+            selectinload(Team.depth_charts).options(
+                joinedload(DepthChart.starter_player), joinedload(DepthChart.backup_player),
+            ),
+        )
+        .order_by(Team.id)
+    )
+    if team_ids is not None:
+        q = q.where(Team.id.in_(team_ids))
+    teams = (await session.scalars(q)).all()
+    return [_bundle(t) for t in teams]
+
+@app.get("/teams/bundles", response_model=List[TeamBundleDTO], dependencies=[conditional(*BUNDLE_TABLES)])
+async def get_team_bundles(
+    session: AsyncSessionDep,
+    response: Response,
+    ids: List[int] = Query(default=[], description="team ids (repeatable); omit for every team"),
+) -> List[TeamBundleDTO]:
+    """Bundles for many teams in one call (league overview), ordered by team id."""
+    if len(set(ids)) > MAX_BUNDLE_TEAMS:
+        raise HTTPException(status_code=400, detail=f"at most {MAX_BUNDLE_TEAMS} team ids per call")
+    if not ids and await session.scalar(select(func.count()).select_from(Team)) > MAX_BUNDLE_TEAMS:
+        raise HTTPException(status_code=400, detail=f"more than {MAX_BUNDLE_TEAMS} teams: pass ids")
+    bundles = await _load_bundles(session, sorted(set(ids)) or None)
+    return Response(content=_bundles_adapter.dump_json(bundles), media_type="application/json",
+                    headers=dict(response.headers))
+
+@app.get("/teams/{team_id}/bundle", response_model=TeamBundleDTO, dependencies=[conditional(*BUNDLE_TABLES)])
+async def get_team_bundle(team_id: int, session: AsyncSessionDep, response: Response) -> TeamBundleDTO:
+    """Team, roster and depth chart (starter/backup names embedded) for a team page."""
+    bundles = await _load_bundles(session, [team_id])
+    if not bundles:
+        raise HTTPException(status_code=404, detail="team not found")
+    return Response(content=bundles[0].model_dump_json(), media_type="application/json",
+                    headers=dict(response.headers))
+
+@app.get("/teams/{team_id}", response_model=TeamDTO, dependencies=[conditional("teams")])
+async def get_team(team_id: int, session: AsyncSessionDep) -> TeamDTO:
+    row = await session.get(Team, team_id)
     if not row:
         raise HTTPException(status_code=404, detail="team not found")
     return TeamDTO.model_validate(row)
 
 # --- Players ---
-@app.get("/players", response_model=List[PlayerDTO])
-def list_players(session: SessionDep, team_id: Optional[int] = Query(default=None)) -> List[PlayerDTO]:
-    q = session.query(Player)
+@app.get("/players", response_model=List[PlayerDTO], dependencies=[conditional("players")])
+async def list_players(
+    session: AsyncSessionDep,
+    response: Response,
+    team_id: Optional[int] = Query(default=None),
+    position: Optional[str] = Query(default=None),
+    min_age: Optional[int] = Query(default=None, ge=18),
+    max_age: Optional[int] = Query(default=None, ge=18),
+    min_rating: List[str] = Query(default=[], description="rating:threshold, e.g. speed:80 (repeatable)"),
+    fields: Optional[str] = Query(default=None, description="comma-separated PlayerDTO fields, e.g. id,last_name,jersey"),
+    cursor: Optional[str] = Query(default=None),
+    limit: Optional[int] = Query(default=None, ge=1, le=MAX_PAGE_SIZE,
+                                 description=f"page size (default {DEFAULT_PAGE_SIZE} once paging)"),
+) -> List[PlayerDTO]:
+    """
+    Players ordered by id. With cursor= or limit=, one page at a time (next
+    page cursor in X-Next-Cursor); with neither, the whole list as before.
+    fields= returns only those keys, selecting only those columns.
+    """
+    q = select(Player)
     if team_id is not None:
-        q = q.filter(Player.team_id == team_id)
-    rows = q.all()
-    return [PlayerDTO.model_validate(r) for r in rows]
+        q = q.where(Player.team_id == team_id)
+    if position is not None:
+        q = q.where(Player.position == position.upper())
+    if min_age is not None:
+        q = q.where(Player.age >= min_age)
+    if max_age is not None:
+        q = q.where(Player.age <= max_age)
+    for name, threshold in _parse_min_ratings(min_rating):
+        q = q.where(getattr(Player, name) >= threshold)
+    return await _json_list(session, response, q, Player, PlayerDTO, fields=fields,
+                            keys=(Player.id,), cursor=cursor, limit=limit)
 
-@app.get("/players/{player_id}", response_model=PlayerDTO)
-def get_player(player_id: int, session: SessionDep) -> PlayerDTO:
-    row = session.get(Player, player_id)
+@app.get("/players/{player_id}", response_model=PlayerDTO, dependencies=[conditional("players")])
+async def get_player(player_id: int, session: AsyncSessionDep) -> PlayerDTO:
+    row = await session.get(Player, player_id)
     if not row:
         raise HTTPException(status_code=404, detail="player not found")
     return PlayerDTO.model_validate(row)
 
 # --- Depth Chart ---
-@app.get("/depth-chart/{team_id}", response_model=List[DepthChartDTO])
-def get_depth_chart(team_id: int, session: SessionDep) -> List[DepthChartDTO]:
-    rows = session.query(DepthChart).filter(DepthChart.team_id == team_id).all()
-    return [DepthChartDTO.model_validate(r) for r in rows]
+@app.get("/depth-chart/{team_id}", response_model=List[DepthChartDTO],
+         dependencies=[conditional("depth_charts")])
+async def get_depth_chart(team_id: int, session: AsyncSessionDep, response: Response) -> List[DepthChartDTO]:
+    q = select(DepthChart).where(DepthChart.team_id == team_id).order_by(DepthChart.id)
+    return await _json_list(session, response, q, DepthChart, DepthChartDTO)
 
 # --- Games ---
-@app.get("/games", response_model=List[GameResultDTO])
-def list_games(session: SessionDep, season: Optional[int] = Query(default=None)) -> List[GameResultDTO]:
-    q = session.query(GameResult)
+@app.get("/games", response_model=List[GameResultDTO], dependencies=[conditional("game_results")])
+async def list_games(
+    session: AsyncSessionDep,
+    response: Response,
+    season: Optional[int] = Query(default=None),
+    week: Optional[int] = Query(default=None, ge=1),
+    team_id: Optional[int] = Query(default=None, description="home or away"),
+    cursor: Optional[str] = Query(default=None),
+    limit: Optional[int] = Query(default=None, ge=1, le=MAX_PAGE_SIZE,
+                                 description=f"page size (default {DEFAULT_PAGE_SIZE} once paging)"),
+) -> List[GameResultDTO]:
+    """
+    Games ordered by (season, week, id). With cursor= or limit=, one page at a
+    time (cursor in X-Next-Cursor); with neither, the whole list as before.
+    """
+    q = select(GameResult)
     if season is not None:
-        q = q.filter(GameResult.season == season)
-    rows = q.all()
-    return [GameResultDTO.model_validate(r) for r in rows]
+        q = q.where(GameResult.season == season)
+    if week is not None:
+        q = q.where(GameResult.week == week)
+    if team_id is not None:
+        q = q.where(or_(GameResult.home_team_id == team_id, GameResult.away_team_id == team_id))
+    # Page on the sort keys left after the equality filters, so the cursor seeks
+    # straight into ix_game_results_season_week instead of re-reading the season
+    keys = (GameResult.season, GameResult.week, GameResult.id)
+    if season is not None:
+        keys = keys[1:] if week is None else keys[2:]
+    return await _json_list(session, response, q, GameResult, GameResultDTO,
+                            keys=keys, cursor=cursor, limit=limit)
 
-# Best-effort: create tables for local sqlite if missing
-def _ensure_db():
-    try:
-        create_db_and_tables()
-    except Exception:
-        pass
+# --- Export (NDJSON streams) ---
+class ExportResource(str, Enum):
+    teams = "teams"
+    players = "players"
+    depth_charts = "depth-charts"
+    games = "games"
+    season_stats = "season-stats"
+
+EXPORTS = {
+    ExportResource.teams: (Team, TeamDTO),
+    ExportResource.players: (Player, PlayerDTO),
+    ExportResource.depth_charts: (DepthChart, DepthChartDTO),
+    ExportResource.games: (GameResult, GameResultDTO),
+    ExportResource.season_stats: (PlayerSeasonStats, PlayerSeasonStatsDTO),
+}
+EXPORT_CHUNK_ROWS = 2000
+NDJSON = "application/x-ndjson"
+
+def _accepts_gzip(accept_encoding: Optional[str]) -> bool:
+    for item in (accept_encoding or "").split(","):
+        name, _, param = item.partition(";")
+        if name.strip().lower() in ("gzip", "*"):
+            param = param.replace(" ", "").lower()
+            try:
+                return not param.startswith("q=") or float(param[2:]) > 0
+            except ValueError:
+                return False
+    return False
+
+async def _ndjson_stream(session_scope: SessionScope, model, dto, compress: bool) -> AsyncIterator[bytes]:
+    """
+    Whole table in id order from a server-side cursor, EXPORT_CHUNK_ROWS rows
+    per fetch: memory holds one chunk, and the first bytes go out after the
+    first fetch whatever the table size. The session lives exactly as long as
+    the body: opened on the first chunk, closed after the last.
+    """
+    fields = tuple(dto.model_fields)
+    q = (select(*(getattr(model, f) for f in fields)).order_by(model.id)
+         .execution_options(yield_per=EXPORT_CHUNK_ROWS))
+    gz = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS) if compress else None
+    async with session_scope() as session:
+        result = await session.stream(q)
+        async for rows in result.partitions():
+            chunk = dump_ndjson(dto, fields, rows)
+            if gz is not None:
+                chunk = gz.compress(chunk)
+            if chunk:
+                yield chunk
+    if gz is not None:
+        yield gz.flush()
 
-_ensure_db()
+@app.get("/export/{resource}", response_class=StreamingResponse,
+         responses={200: {"content": {NDJSON: {}}}})
+async def export_table(resource: ExportResource, request: Request, response: Response,
+                       session_scope: AsyncSessionScopeDep) -> StreamingResponse:
+    """
+    Stream a whole table as NDJSON (one DTO per line, id order), for warehouse
+    syncs. Gzip-compressed when the client sends Accept-Encoding: gzip.
+    """
+    model, dto = EXPORTS[resource]
+    async with session_scope() as session:
+        await _check_etag(request, response, session, (model.__tablename__,))
+    compress = _accepts_gzip(request.headers.get("accept-encoding"))
+    headers = dict(response.headers)
+    headers["Vary"] = "Accept-Encoding"
+    if compress:
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(_ndjson_stream(session_scope, model, dto, compress), media_type=NDJSON, headers=headers)
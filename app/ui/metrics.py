@@ -0,0 +1,231 @@
+"""
+Request and SQL metrics for the API, exposed as Prometheus text at /metrics.
+
+- MetricsMiddleware: per-route latency and response-size histograms, request
+  counts by status, in-flight gauge, and SQL statements / SQL time per request
+- SQL is counted by before/after_cursor_execute listeners on every Engine
+  (sync, and the sync side of async engines); statements are attributed to
+  the request whose context is current, so scripts pay one ContextVar lookup
+- Slow requests (Settings.slow_request_ms, off by default) are logged with
+  their slowest SQL statements
+
+No prometheus_client dependency: a few counters and fixed-bucket histograms
+rendered in the text exposition format are all we need.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+from app.core.logging import get_logger
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100, 500)
+
+# statements kept per request for the slow-request log
+SLOW_LOG_STATEMENTS = 5
+
+log = get_logger("api.slow")
+
+Labels = Tuple[str, ...]
+
+
+# --- Minimal metric types --------------------------------------------------
+class Counter:
+    def __init__(self, name: str, doc: str, labels: Sequence[str] = ()):
+        self.name, self.doc, self.labels = name, doc, tuple(labels)
+        self._values: Dict[Labels, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, labels: Labels = (), amount: float = 1) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def value(self, labels: Labels = ()) -> float:
+        return self._values.get(labels, 0)
+
+    def render(self, kind: str = "counter") -> List[str]:
+        lines = [f"# HELP {self.name} {self.doc}", f"# TYPE {self.name} {kind}"]
+        for labels, value in sorted(self._values.items()):
+            lines.append(f"{self.name}{_labels(self.labels, labels)} {_num(value)}")
+        return lines
+
+
+class Gauge(Counter):
+    def dec(self, labels: Labels = (), amount: float = 1) -> None:
+        self.inc(labels, -amount)
+
+    def render(self, kind: str = "gauge") -> List[str]:
+        return super().render(kind)
+
+
+class Histogram:
+    def __init__(self, name: str, doc: str, labels: Sequence[str], buckets: Sequence[float]):
+        self.name, self.doc, self.labels, self.buckets = name, doc, tuple(labels), tuple(buckets)
+        # labels -> [count per bucket..., +Inf count, sum]
+        self._values: Dict[Labels, List[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, labels: Labels, value: float) -> None:
+        with self._lock:
+            row = self._values.get(labels)
+            if row is None:
+                row = self._values[labels] = [0] * (len(self.buckets) + 2)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    row[i] += 1
+            row[-2] += 1
+            row[-1] += value
+
+    def count(self, labels: Labels) -> int:
+        row = self._values.get(labels)
+        return int(row[-2]) if row else 0
+
+    def sum(self, labels: Labels) -> float:
+        row = self._values.get(labels)
+        return row[-1] if row else 0.0
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.doc}", f"# TYPE {self.name} histogram"]
+        for labels, row in sorted(self._values.items()):
+            for bound, n in zip(self.buckets, row):
+                lines.append(f"{self.name}_bucket{_labels(self.labels + ('le',), labels + (_num(bound),))} {int(n)}")
+            lines.append(f"{self.name}_bucket{_labels(self.labels + ('le',), labels + ('+Inf',))} {int(row[-2])}")
+            lines.append(f"{self.name}_count{_labels(self.labels, labels)} {int(row[-2])}")
+            lines.append(f"{self.name}_sum{_labels(self.labels, labels)} {_num(row[-1])}")
+        return lines
+
+
+def _num(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(names: Labels, values: Labels) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{n}="{_escape(str(v))}"' for n, v in zip(names, values)) + "}"
+
+
+REQUESTS = Counter("http_requests_total", "Requests by method, route and status.", ("method", "route", "status"))
+IN_FLIGHT = Gauge("http_requests_in_flight", "Requests being served right now.")
+LATENCY = Histogram("http_request_duration_seconds", "Request latency.", ("method", "route"), LATENCY_BUCKETS)
+RESPONSE_SIZE = Histogram("http_response_size_bytes", "Response body size.", ("method", "route"), SIZE_BUCKETS)
+DB_QUERIES = Histogram("db_statements_per_request", "SQL statements executed per request.", ("route",),
+                       QUERY_BUCKETS)
+DB_TIME = Histogram("db_seconds_per_request", "Time spent in SQL per request.", ("route",), LATENCY_BUCKETS)
+
+METRICS = (REQUESTS, IN_FLIGHT, LATENCY, RESPONSE_SIZE, DB_QUERIES, DB_TIME)
+
+
+def render_metrics() -> str:
+    lines: List[str] = []
+    for metric in METRICS:
+        lines += metric.render()
+    return "\n".join(lines) + "\n"
+
+
+# --- Per-request SQL accounting --------------------------------------------
+@dataclass
+class RequestSQL:
+    statements: int = 0
+    seconds: float = 0.0
+    # (seconds, sql) of the slowest statements, only kept when slow logging is on
+    slowest: Optional[List[Tuple[float, str]]] = None
+
+    def record(self, seconds: float, sql: str) -> None:
+        self.statements += 1
+        self.seconds += seconds
+        if self.slowest is not None:
+            self.slowest.append((seconds, sql))
+            if len(self.slowest) > SLOW_LOG_STATEMENTS:
+                self.slowest.sort(key=lambda s: s[0], reverse=True)
+                del self.slowest[SLOW_LOG_STATEMENTS:]
+
+
+_current: ContextVar[Optional[RequestSQL]] = ContextVar("request_sql", default=None)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _sql_start(conn, cursor, statement, parameters, context, executemany):
+    if _current.get() is not None:
+        # on the statement's own context: a statement that raises leaves nothing behind
+        context._metrics_t0 = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _sql_end(conn, cursor, statement, parameters, context, executemany):
+    stats = _current.get()
+    t0 = getattr(context, "_metrics_t0", None)
+    if stats is not None and t0 is not None:
+        stats.record(time.perf_counter() - t0, statement)
+
+
+# --- ASGI middleware -------------------------------------------------------
+class MetricsMiddleware:
+    """
+    Pure ASGI middleware (no BaseHTTPMiddleware task hop). Routes are labelled
+    by their path template ("/teams/{team_id}"), unmatched paths as "unmatched",
+    so label cardinality stays bounded.
+    """
+
+    def __init__(self, app, slow_request_ms: Optional[float] = None):
+        self.app = app
+        self.slow_request_ms = settings.slow_request_ms if slow_request_ms is None else slow_request_ms
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        slow_ms = self.slow_request_ms
+        stats = RequestSQL(slowest=[] if slow_ms else None)
+        token = _current.set(stats)
+        status, size = 500, 0
+
+        async def send_wrapper(message):
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        IN_FLIGHT.inc()
+        t0 = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - t0
+            IN_FLIGHT.dec()
+            _current.reset(token)
+            route = getattr(scope.get("route"), "path", "unmatched")
+            method = scope["method"]
+            REQUESTS.inc((method, route, str(status)))
+            LATENCY.observe((method, route), elapsed)
+            RESPONSE_SIZE.observe((method, route), size)
+            DB_QUERIES.observe((route,), stats.statements)
+            DB_TIME.observe((route,), stats.seconds)
+            if slow_ms and elapsed * 1000 >= slow_ms:
+                _log_slow(method, scope.get("path", ""), route, status, elapsed, stats)
+
+
+def _log_slow(method: str, path: str, route: str, status: int, elapsed: float, stats: RequestSQL) -> None:
+    worst = sorted(stats.slowest or [], key=lambda s: s[0], reverse=True)
+    sql = "".join(f"\n  {secs * 1000:8.1f} ms  {' '.join(stmt.split())[:500]}" for secs, stmt in worst)
+    log.warning("slow request %s %s (%s) -> %s in %.1f ms; %d SQL statement(s), %.1f ms in SQL%s",
+                method, path, route, status, elapsed * 1000, stats.statements, stats.seconds * 1000, sql)
@@ -0,0 +1,78 @@
+"""
+Keyset (cursor) pagination for list endpoints.
+
+A page is "the next `limit` rows after the last key the client saw", in a
+stable order on indexed key columns ending with the primary key:
+
+    rows, next_cursor = await keyset_page(session, select(GameResult),
+                                          (GameResult.season, GameResult.week, GameResult.id),
+                                          cursor, limit)
+
+No OFFSET: every page is an index range scan that starts where the previous
+one stopped, so page 1,000 costs the same as page 1. The cursor is opaque to
+clients (urlsafe base64 of the key names and values); a malformed cursor, or
+one from another endpoint, raises InvalidCursor.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+from typing import List, Optional, Sequence, Tuple
+
+from sqlalchemy import Select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+# Response header carrying the cursor of the next page (absent on the last page)
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def encode_cursor(keys: Sequence[InstrumentedAttribute], values: Sequence[object]) -> str:
+    payload = json.dumps([[k.key for k in keys], list(values)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(keys: Sequence[InstrumentedAttribute], cursor: str) -> List[object]:
+    """Key values stored in `cursor`; InvalidCursor unless it was made for these keys."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        names, values = json.loads(raw)
+    except (ValueError, TypeError):
+        raise InvalidCursor("malformed cursor") from None
+    if names != [k.key for k in keys] or not isinstance(values, list) or len(values) != len(keys):
+        raise InvalidCursor("cursor does not belong to this listing")
+    return values
+
+
+def after_key(stmt: Select, keys: Sequence[InstrumentedAttribute], cursor: Optional[str]) -> Select:
+    """Order `stmt` by `keys` and, given a cursor, keep only rows strictly after it."""
+    if cursor:
+        values = decode_cursor(keys, cursor)
+        if len(keys) == 1:
+            stmt = stmt.where(keys[0] > values[0])
+        else:
+            stmt = stmt.where(tuple_(*keys) > tuple_(*values))
+    return stmt.order_by(*keys)
+
+
+async def keyset_page(session: AsyncSession, stmt: Select, keys: Sequence[InstrumentedAttribute],
+                      cursor: Optional[str], limit: int, *, scalars: bool = True) -> Tuple[list, Optional[str]]:
+    """
+    One page of ORM rows (scalars=False: Row tuples, for column selects that
+    include the keys) and the cursor of the next page (None on the last one).
+    Fetches limit + 1 rows to know whether another page exists.
+    """
+    result = await session.execute(after_key(stmt, keys, cursor).limit(limit + 1))
+    rows = result.scalars().all() if scalars else result.all()
+    if len(rows) <= limit:
+        return list(rows), None
+    last = rows[limit - 1]
+    return list(rows[:limit]), encode_cursor(keys, [getattr(last, k.key) for k in keys])
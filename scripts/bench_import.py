@@ -0,0 +1,65 @@
+"""
+Benchmark import_roster: row-by-row ORM path vs set-based bulk path.
+
+Each run imports a generated league of N x 32 teams into a fresh SQLite file,
+then imports it again (the "re-import" column is the all-updates case).
+
+Usage:
+  python scripts\\bench_import.py
+  python scripts\\bench_import.py --leagues 1 4 --free-agents 200
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.models.database import Base
+from app.services.importer.generator import make_league
+from app.services.importer.ingest import import_roster
+from app.services.importer.trace import ImportTrace
+
+
+def run_once(db_path: Path, teams, players, depth, bulk: bool, trace=None):
+    engine = create_engine(f"sqlite:///{db_path}", future=True)
+    Base.metadata.create_all(engine)
+    SessionLocal = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+    timings = []
+    for _ in range(2):  # fresh import, then re-import (updates)
+        with SessionLocal() as session:
+            t0 = time.perf_counter()
+            import_roster(session, teams=teams, players=players, depth_chart=depth, bulk=bulk,
+                          trace=trace if not timings else None)
+            timings.append(time.perf_counter() - t0)
+    engine.dispose()
+    return timings
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--leagues", type=int, nargs="+", default=[1, 4])
+    ap.add_argument("--free-agents", type=int, default=100)
+    ap.add_argument("--seed", type=int, default=2025)
+    ap.add_argument("--phases", action="store_true", help="Also print the per-phase trace of each fresh import")
+    args = ap.parse_args()
+
+    print(f"{'teams':>6} {'rows':>8} {'mode':>5} {'fresh rows/s':>14} {'re-import rows/s':>17}")
+    for copies in args.leagues:
+        teams, players, depth = make_league(args.seed, team_count=32 * copies, free_agents=args.free_agents)
+        rows = len(teams) + len(players) + len(depth)
+        for bulk in (False, True):
+            trace = ImportTrace() if args.phases else None
+            with tempfile.TemporaryDirectory() as tmp:
+                fresh, again = run_once(Path(tmp) / "bench.db", teams, players, depth, bulk, trace)
+            mode = "bulk" if bulk else "orm"
+            print(f"{len(teams):>6} {rows:>8} {mode:>5} {rows / fresh:>14,.0f} {rows / again:>17,.0f}")
+            if trace:
+                for name, stats in trace.phases.items():
+                    print(f"{'':>14} {name:>12} {stats.seconds:>8.3f}s {stats.statements:>7} stmts")
+
+
+if __name__ == "__main__":
+    main()
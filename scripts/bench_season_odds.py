@@ -0,0 +1,51 @@
+"""
+Benchmark the Monte Carlo season simulator (playoff / division / seed odds).
+
+Loads a generated league into an in-memory database, builds SeasonInputs
+for a full round-robin season still to play (--weeks), then times
+simulate_seasons for each season count and worker count.
+
+Usage:
+  python scripts\\bench_season_odds.py
+  python scripts\\bench_season_odds.py --seasons 10000 100000 --workers 1 4
+"""
+
+import argparse
+import time
+
+from sqlalchemy.orm import Session
+
+from app.engine.season import load_season_inputs, round_robin, simulate_seasons
+from app.models.database import Base, make_engine
+from app.services.importer.bootstrap import generate_and_load
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Season odds simulator throughput.")
+    parser.add_argument("--teams", type=int, default=32)
+    parser.add_argument("--weeks", type=int, default=17)
+    parser.add_argument("--seasons", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1])
+    parser.add_argument("--seed", type=int, default=2025)
+    args = parser.parse_args()
+
+    engine = make_engine(profile="test")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        generate_and_load(session, seed=args.seed, team_count=args.teams, trusted=True)
+        schedule = round_robin(list(range(1, args.teams + 1)), args.weeks)
+        inputs = load_season_inputs(session, season=2025, remaining=[g for week in schedule for g in week])
+    engine.dispose()
+
+    print(f"{args.teams} teams, {len(inputs.home)} games left")
+    print(f"{'seasons':>9} {'workers':>8} {'seconds':>8} {'seasons/s':>10}")
+    for n in args.seasons:
+        for workers in args.workers:
+            t0 = time.perf_counter()
+            simulate_seasons(inputs, n, seed=args.seed, workers=workers)
+            dt = time.perf_counter() - t0
+            print(f"{n:>9} {workers:>8} {dt:>8.2f} {n / dt:>10,.0f}")
+
+
+if __name__ == "__main__":
+    main()
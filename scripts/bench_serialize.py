@@ -0,0 +1,92 @@
+"""
+Benchmark /players serialization: per-row models vs the bulk JSON fast path.
+
+"models" is what list_players used to do: load Player entities, build one
+PlayerDTO per row with model_validate, then what FastAPI does with a returned
+list (validate it again against response_model, dump to JSON-able Python,
+json.dumps). "fast" is the current path: SELECT the DTO columns as tuples and
+serialize the list with one cached TypeAdapter.dump_json call.
+
+Both run through the async session the endpoint uses, against a SQLite file
+loaded with generate_and_load. Fetch and serialize are timed separately.
+
+Usage:
+  python scripts\\bench_serialize.py
+  python scripts\\bench_serialize.py --rows 2000 20000 --repeat 5
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+from pydantic import TypeAdapter
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models import Player
+from app.models.async_database import async_session_scope, dispose_async_engines
+from app.models.database import Base, make_engine
+from app.models.dtos import PlayerDTO, dump_rows
+from app.services.importer.bootstrap import generate_and_load
+
+FIELDS = tuple(PlayerDTO.model_fields)
+RESPONSE_ADAPTER = TypeAdapter(List[PlayerDTO])   # stands in for FastAPI's response_model field
+
+
+async def models_path(url: str, n: int):
+    async with async_session_scope(url, profile="serve") as session:
+        t0 = time.perf_counter()
+        rows = (await session.scalars(select(Player).order_by(Player.id).limit(n))).all()
+        t1 = time.perf_counter()
+        items = [PlayerDTO.model_validate(r) for r in rows]
+        checked = RESPONSE_ADAPTER.validate_python(items)
+        body = json.dumps(RESPONSE_ADAPTER.dump_python(checked, mode="json")).encode()
+        return t1 - t0, time.perf_counter() - t1, len(body)
+
+
+async def fast_path(url: str, n: int):
+    async with async_session_scope(url, profile="serve") as session:
+        t0 = time.perf_counter()
+        q = select(*(getattr(Player, f) for f in FIELDS)).order_by(Player.id).limit(n)
+        rows = (await session.execute(q)).all()
+        t1 = time.perf_counter()
+        body = dump_rows(PlayerDTO, FIELDS, rows)
+        return t1 - t0, time.perf_counter() - t1, len(body)
+
+
+def load(url: str, n: int) -> None:
+    engine = make_engine(url, profile="bulk-load")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        generate_and_load(session, seed=2025, team_count=math.ceil(n / 53), trusted=True)
+    engine.dispose()  # the serve profile switches the file to WAL, which needs it to ourselves
+
+
+async def run(args):
+    print(f"{'rows':>8} {'path':>7} {'fetch ms':>9} {'ser ms':>9} {'total ms':>9} {'MB':>6}")
+    for n in args.rows:
+        with tempfile.TemporaryDirectory() as tmp:
+            url = f"sqlite:///{Path(tmp) / 'bench.db'}"
+            load(url, n)
+            for name, fn in (("models", models_path), ("fast", fast_path)):
+                best = min([await fn(url, n) for _ in range(args.repeat)], key=lambda r: r[0] + r[1])
+                fetch, ser, size = best
+                print(f"{n:>8} {name:>7} {fetch * 1e3:>9.1f} {ser * 1e3:>9.1f} "
+                      f"{(fetch + ser) * 1e3:>9.1f} {size / 1e6:>6.2f}")
+            await dispose_async_engines()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-row DTOs vs bulk dump_json for /players.")
+    parser.add_argument("--rows", type=int, nargs="+", default=[2_000, 20_000, 200_000])
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per path; the best is reported")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
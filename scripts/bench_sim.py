@@ -0,0 +1,63 @@
+"""
+Benchmark the play-by-play simulator: full games per second on one core.
+
+Loads a generated 32-team league into an in-memory database, snapshots the
+team sheets once (load_team_sheets), then simulates games between random
+pairings with one SeededRNG. Only simulate_game is timed; the best of
+--repeat runs is reported.
+
+Usage:
+  python scripts\\bench_sim.py
+  python scripts\\bench_sim.py --games 20000 --repeat 5 --seed 7
+"""
+
+import argparse
+import statistics
+import time
+
+from sqlalchemy.orm import Session
+
+from app.core.random import SeededRNG
+from app.engine import load_team_sheets, simulate_game
+from app.models.database import Base, make_engine
+from app.services.importer.bootstrap import generate_and_load
+
+
+def load_sheets(seed: int):
+    engine = make_engine(profile="test")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        generate_and_load(session, seed=seed, team_count=32, trusted=True)
+        sheets = load_team_sheets(session, range(1, 33))
+    engine.dispose()
+    return list(sheets.values())
+
+
+def run(sheets, games: int, seed: int):
+    rng = SeededRNG(seed)
+    pairs = [tuple(rng.choice(sheets) for _ in range(2)) for _ in range(games)]
+    pairs = [(h, a) if h is not a else (h, sheets[(sheets.index(h) + 1) % len(sheets)]) for h, a in pairs]
+    t0 = time.perf_counter()
+    outcomes = [simulate_game(h, a, rng) for h, a in pairs]
+    return time.perf_counter() - t0, outcomes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Play-by-play simulator throughput.")
+    parser.add_argument("--games", type=int, default=5_000)
+    parser.add_argument("--repeat", type=int, default=5, help="Runs; the fastest is reported")
+    parser.add_argument("--seed", type=int, default=2025)
+    args = parser.parse_args()
+
+    sheets = load_sheets(args.seed)
+    best, outcomes = min((run(sheets, args.games, args.seed) for _ in range(args.repeat)), key=lambda r: r[0])
+    plays = sum(o.plays for o in outcomes)
+    print(f"{args.games} games in {best:.2f} s: {args.games / best:,.0f} games/s, "
+          f"{plays / best:,.0f} plays/s, {best / args.games * 1e6:.0f} us/game")
+    print(f"points/game {statistics.mean(o.home_score + o.away_score for o in outcomes):.1f}, "
+          f"plays/game {plays / args.games:.1f}, "
+          f"ties {sum(o.winner_team_id is None for o in outcomes) / args.games:.1%}")
+
+
+if __name__ == "__main__":
+    main()
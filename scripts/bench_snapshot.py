@@ -0,0 +1,97 @@
+"""
+Benchmark the binary league snapshot against the CSV directory format.
+
+For each league size: write both formats, read them back into rows
+(CSV through the columnar loader, snapshot through mmap + column validation),
+and import each into a fresh SQLite file through the bulk path.
+
+Usage:
+  python scripts\\bench_snapshot.py
+  python scripts\\bench_snapshot.py --teams 32 1000 --no-import
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.models.database import Base
+from app.services.importer.columnar import load_players_columnar
+from app.services.importer.generator import make_league, write_csvs
+from app.services.importer.ingest import _load_csv_depth, _load_csv_team, import_roster
+from app.services.importer.snapshot import LeagueSnapshot, import_snapshot, write_snapshot
+
+
+def timed(fn):
+    t0 = time.perf_counter()
+    out = fn()
+    return time.perf_counter() - t0, out
+
+
+def read_csv_dir(path: str):
+    return (_load_csv_team(f"{path}/teams.csv"), load_players_columnar(f"{path}/players.csv"),
+            _load_csv_depth(f"{path}/depth_chart.csv"))
+
+
+def read_snapshot(path: str):
+    with LeagueSnapshot(path) as snap:
+        snap.validate()
+        return list(snap.team_rows()), list(snap.player_rows()), list(snap.depth_rows())
+
+
+def import_into(db_path: Path, load):
+    engine = create_engine(f"sqlite:///{db_path}", future=True)
+    Base.metadata.create_all(engine)
+    with sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)() as session:
+        seconds, _ = timed(lambda: load(session))
+    engine.dispose()
+    return seconds
+
+
+def dir_size(path: Path) -> int:
+    return sum(f.stat().st_size for f in path.iterdir())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CSV vs league snapshot: size, write, read, import.")
+    parser.add_argument("--teams", type=int, nargs="+", default=[32, 1000, 10000])
+    parser.add_argument("--seed", type=int, default=2025)
+    parser.add_argument("--no-import", action="store_true", help="Skip the database import timings")
+    args = parser.parse_args()
+
+    print(f"{'teams':>6} {'rows':>8} {'format':>8} {'size MB':>8} {'write s':>8} {'read s':>8} {'import s':>9}")
+    for n in args.teams:
+        league = make_league(args.seed, team_count=n, rows=True)
+        rows = sum(len(part) for part in league)
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp = Path(tmp)
+            csv_dir, snap = tmp / "csv", tmp / "league.ffsnap"
+            csv_dir.mkdir()
+
+            # loop variables bound as defaults, not looked up when the lambda runs
+            w_csv, _ = timed(lambda csv_dir=csv_dir, league=league: write_csvs(str(csv_dir), *league))
+            w_snap, _ = timed(lambda snap=snap, league=league: write_snapshot(str(snap), *league))
+            r_csv, csv_rows = timed(lambda csv_dir=csv_dir: read_csv_dir(str(csv_dir)))
+            r_snap, _ = timed(lambda snap=snap: read_snapshot(str(snap)))
+
+            i_csv = i_snap = float("nan")
+            if not args.no_import:
+                teams, players, depth = csv_rows
+                i_csv = import_into(tmp / "csv.db", lambda s, teams=teams, players=players, depth=depth: import_roster(
+                    s, teams=teams, players=players, depth_chart=depth, bulk=True, validated=True))
+                i_snap = import_into(tmp / "snap.db", lambda s, snap=snap: import_snapshot(s, str(snap)))
+                # the CSV column includes parsing so both columns are file -> database
+                i_csv += r_csv
+
+            print(f"{n:>6} {rows:>8} {'csv':>8} {dir_size(csv_dir) / 1e6:>8.2f} "
+                  f"{w_csv:>8.2f} {r_csv:>8.2f} {i_csv:>9.2f}")
+            print(f"{'':>6} {'':>8} {'snapshot':>8} {os.path.getsize(snap) / 1e6:>8.2f} "
+                  f"{w_snap:>8.2f} {r_snap:>8.2f} {i_snap:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
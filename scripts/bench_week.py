@@ -0,0 +1,69 @@
+"""
+Benchmark the weekly runner: a week of games for a batch of leagues.
+
+Each league is a generated 32-team league in its own in-memory database.
+Timed separately: loading the team sheets, playing every league's games in
+one pool (play_games), and the bulk write-back (write_week, rolled back so
+every worker count plays the same week against the same data).
+
+Usage:
+  python scripts\\bench_week.py
+  python scripts\\bench_week.py --leagues 16 --weeks 4 --workers 1 2 4 8
+"""
+
+import argparse
+import os
+import time
+
+from sqlalchemy.orm import Session
+
+from app.engine.season import round_robin
+from app.engine.sheet import load_team_sheets
+from app.engine.week import WeekGame, play_games, write_week
+from app.models.database import Base, make_engine
+from app.services.importer.bootstrap import generate_and_load
+
+
+def make_leagues(count: int):
+    sessions = []
+    for i in range(count):
+        engine = make_engine(profile="test")
+        Base.metadata.create_all(engine)
+        session = Session(engine)
+        generate_and_load(session, seed=1000 + i, team_count=32, trusted=True)
+        sessions.append(session)
+    return sessions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Weekly multi-league game simulation.")
+    parser.add_argument("--leagues", type=int, default=4)
+    parser.add_argument("--weeks", type=int, default=2)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, os.cpu_count() or 1])
+    args = parser.parse_args()
+
+    sessions = make_leagues(args.leagues)
+    schedule = round_robin(list(range(1, 33)), args.weeks)
+    print(f"{args.leagues} leagues x {len(schedule[0])} games, {os.cpu_count()} CPUs")
+    print(f"{'workers':>8} {'week':>5} {'load ms':>8} {'play ms':>8} {'write ms':>9} {'games/s':>8}")
+    for workers in args.workers:
+        for week, games in enumerate(schedule, 1):
+            t0 = time.perf_counter()
+            batch = []
+            for i, session in enumerate(sessions):
+                sheets = load_team_sheets(session, range(1, 33))
+                batch += [WeekGame(i, 2025, week, sheets[h], sheets[a]) for h, a in games]
+            t1 = time.perf_counter()
+            outcomes = play_games(batch, workers=workers)
+            t2 = time.perf_counter()
+            per_league = len(games)
+            for i, session in enumerate(sessions):
+                write_week(session, 2025, week, outcomes[i * per_league:(i + 1) * per_league])
+                session.rollback()      # keep the databases identical for the next worker count
+            t3 = time.perf_counter()
+            print(f"{workers:>8} {week:>5} {(t1 - t0) * 1e3:>8.1f} {(t2 - t1) * 1e3:>8.1f} "
+                  f"{(t3 - t2) * 1e3:>9.1f} {len(batch) / (t2 - t1):>8,.0f}")
+
+
+if __name__ == "__main__":
+    main()
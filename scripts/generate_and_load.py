@@ -0,0 +1,18 @@
+"""
+Generate a league and load it straight into the database (no CSV round trip).
+
+Usage:
+  python scripts\generate_and_load.py --trust
+  python scripts\generate_and_load.py --seed 12345 --teams 32 --free-agents 100
+  python scripts\generate_and_load.py --trust --fast     (bulk-load profile, see app/models/database.py)
+"""
+
+from dotenv import load_dotenv
+
+from app.services.importer.bootstrap import main
+
+# Load environment variables (DEFAULT_SEED, etc.)
+load_dotenv()
+
+if __name__ == "__main__":
+    main()
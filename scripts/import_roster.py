@@ -1,11 +1,40 @@
 import argparse
+import os
+from app.core.logging import configure_logging
+from app.services.importer.delta import cli_import_incremental
 from app.services.importer.ingest import cli_import_from_dir
+from app.services.importer.snapshot import cli_import_snapshot
+from app.services.importer.stream import DEFAULT_CHUNK_SIZE, cli_stream_import_from_dir
 
 def main():
     parser = argparse.ArgumentParser(description="Import roster from CSV directory.")
-    parser.add_argument("--path", required=True, help="Directory with teams.csv, players.csv, depth_chart.csv")
+    parser.add_argument("--path", required=True, help="Directory with teams.csv, players.csv, depth_chart.csv, or a *.ffsnap snapshot file")
+    parser.add_argument("--bulk", action="store_true", help="Use the set-based bulk import path")
+    parser.add_argument("--columnar", action="store_true",
+                        help="Validate players.csv column-wise and report every bad row (implies --bulk)")
+    parser.add_argument("--chunk-size", type=int, default=None,
+                        help="Stream the CSVs and commit every N rows (implies --bulk)")
+    parser.add_argument("--checkpoint", default=None, help="Checkpoint file for resumable streaming imports")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Only write rows/files that changed since the last import")
+    parser.add_argument("--trace-file", default=None,
+                        help="Write per-phase timings and SQL counts as JSON (plain CSV imports)")
+    parser.add_argument("--fast", action="store_true",
+                        help="Use the bulk-load SQLite profile (synchronous=OFF): faster, but a crash "
+                             "mid-import can corrupt the database")
     args = parser.parse_args()
-    res = cli_import_from_dir(args.path)
+    configure_logging()
+    if os.path.isfile(args.path):
+        res = cli_import_snapshot(args.path, fast=args.fast)
+    elif args.incremental:
+        res = cli_import_incremental(args.path, fast=args.fast)
+    elif args.chunk_size or args.checkpoint:
+        res = cli_stream_import_from_dir(args.path, chunk_size=args.chunk_size or DEFAULT_CHUNK_SIZE,
+                                         checkpoint_path=args.checkpoint, fast=args.fast)
+    else:
+        res = cli_import_from_dir(args.path, bulk=args.bulk, columnar=args.columnar,
+                                  trace_file=args.trace_file, fast=args.fast)
+    res.pop("trace", None)  # already logged phase by phase
     print(f"Import summary: {res}")
 
 if __name__ == "__main__":
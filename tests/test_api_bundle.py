@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.ui.api import MAX_BUNDLE_TEAMS, app
+from app.models.database import make_engine
+from app.models.async_database import async_session_scope, get_async_engine, get_async_session
+from app.models.database import Base
+from app.services.importer.bootstrap import generate_and_load
+
+
+@pytest.fixture(scope="module")
+def league_url(tmp_path_factory):
+    url = f"sqlite:///{tmp_path_factory.mktemp('bundle') / 'league.db'}"
+    engine = make_engine(url, profile="default")
+    Base.metadata.create_all(engine)
+    with Session(engine) as s:
+        generate_and_load(s, seed=17, team_count=6, free_agents=5, trusted=True)
+    engine.dispose()
+    return url
+
+
+@pytest.fixture
+def client(league_url):
+    async def _override():
+        async with async_session_scope(league_url, profile="default") as db:
+            yield db
+
+    app.dependency_overrides[get_async_session] = _override
+    statements = []
+    try:
+        with TestClient(app) as c:
+            c.get("/health")
+            event.listen(get_async_engine(league_url, "default").sync_engine, "before_cursor_execute",
+                         lambda conn, cursor, stmt, *a: statements.append(stmt))
+            c.statements = statements
+            yield c
+    finally:
+        app.dependency_overrides.clear()
+
+
+def test_bundle_matches_the_separate_endpoints(client):
+    team = client.get("/teams").json()[2]
+    tid = team["id"]
+    client.statements.clear()
+    bundle = client.get(f"/teams/{tid}/bundle").json()
+    assert len(client.statements) == 3
+
+    assert bundle["team"] == team
+    assert bundle["players"] == client.get("/players", params={"team_id": tid}).json()
+    by_id = {p["id"]: p for p in bundle["players"]}
+    depth = client.get(f"/depth-chart/{tid}").json()
+    assert [e["position"] for e in bundle["depth_chart"]] == [d["position"] for d in depth]
+    for entry, row in zip(bundle["depth_chart"], depth):
+        starter = by_id[row["starter_player_id"]]
+        assert entry["starter"] == {k: starter[k] for k in ("id", "first_name", "last_name", "position", "jersey")}
+        assert (entry["backup"] or {}).get("id") == row["backup_player_id"]
+
+
+def test_batched_bundles_use_the_same_three_queries(client):
+    ids = [t["id"] for t in client.get("/teams").json()]
+    client.statements.clear()
+    some = client.get("/teams/bundles", params={"ids": [ids[4], ids[1], ids[4]]}).json()
+    assert [b["team"]["id"] for b in some] == [ids[1], ids[4]]
+    assert len(client.statements) == 3
+
+    client.statements.clear()
+    everything = client.get("/teams/bundles").json()
+    assert [b["team"]["id"] for b in everything] == ids
+    assert len(client.statements) == 4  # + the team count check
+    assert some[0] == everything[1]
+
+
+def test_bundle_errors(client):
+    assert client.get("/teams/999999/bundle").status_code == 404
+    too_many = [("ids", i) for i in range(MAX_BUNDLE_TEAMS + 1)]
+    assert client.get("/teams/bundles", params=too_many).status_code == 400
@@ -4,21 +4,21 @@ import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import StaticPool
 
 from app.ui.api import app
 from app.models.database import Base, get_session
+from app.models.async_database import async_session_scope, get_async_session
 from app.models import Team, Player, DepthChart, GameResult, Conference, Division
 
 
 @pytest.fixture(scope="function")
-def client():
-    # Single in-memory DB shared across threads
+def client(tmp_path):
+    # One SQLite file, shared by the sync engine and the async (aiosqlite) endpoints
+    url = f"sqlite:///{tmp_path / 'api.db'}"
     engine = create_engine(
-        "sqlite+pysqlite:///:memory:",
+        url,
         future=True,
         connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
     )
     Base.metadata.create_all(engine)
     SessionLocal = sessionmaker(bind=engine, expire_on_commit=False, class_=Session)
@@ -46,15 +46,16 @@ def client():
                        home_score=0, away_score=0)
         s.add(g); s.commit()
 
-    # Override dependency to yield a *new* session per request/thread
+    # every endpoint is on the async session (one per request, shared with the ETag check)
     def _override_get_session():
-        db = SessionLocal()
-        try:
+        raise AssertionError("an endpoint opened a sync session")
+
+    async def _override_get_async_session():
+        async with async_session_scope(url, profile="default") as db:
             yield db
-        finally:
-            db.close()
 
     app.dependency_overrides[get_session] = _override_get_session
+    app.dependency_overrides[get_async_session] = _override_get_async_session
     try:
         with TestClient(app) as c:
             yield c
@@ -112,3 +113,14 @@ def test_games_list(client: TestClient):
     games = r.json()
     assert len(games) >= 1
     assert games[0]["season"] == 2025
+
+
+def test_list_endpoints_serialize_like_the_dtos(client: TestClient):
+    from app.models.dtos import PlayerDTO, TeamDTO
+
+    teams = client.get("/teams").json()
+    assert [list(t) for t in teams] == [list(TeamDTO.model_fields)] * 2
+    assert [t["conference"] for t in teams] == ["AFC", "NFC"]
+    players = client.get("/players").json()
+    assert [PlayerDTO.model_validate(p).model_dump() for p in players] == players
+    assert client.get("/players").headers["content-type"] == "application/json"
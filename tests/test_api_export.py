@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import gzip
+import json
+from contextlib import asynccontextmanager
+from functools import partial
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.ui import api
+from app.ui.api import app
+from app.models.database import Base, make_engine
+from app.models.async_database import async_session_scope, get_async_session, get_async_session_scope
+from app.models import GameResult, Player, PlayerSeasonStats
+from app.services.importer.bootstrap import generate_and_load
+
+
+@pytest.fixture(scope="module")
+def league_url(tmp_path_factory):
+    url = f"sqlite:///{tmp_path_factory.mktemp('export') / 'league.db'}"
+    engine = make_engine(url, profile="default")
+    Base.metadata.create_all(engine)
+    with Session(engine) as s:
+        generate_and_load(s, seed=23, team_count=4, free_agents=10, trusted=True)
+        s.add(GameResult(season=2025, week=1, home_team_id=1, away_team_id=2, home_score=21, away_score=7,
+                         winner_team_id=1))
+        s.add(PlayerSeasonStats(season=2025, team_id=1, player_id=1, games=1, pass_att=30, pass_yds=250))
+        s.commit()
+        counts = {"players": s.scalar(select(func.count()).select_from(Player))}
+    engine.dispose()
+    return url, counts
+
+
+@pytest.fixture
+def client(league_url):
+    async def _override():
+        async with async_session_scope(league_url[0], profile="default") as db:
+            yield db
+
+    app.dependency_overrides[get_async_session] = _override
+    app.dependency_overrides[get_async_session_scope] = lambda: partial(
+        async_session_scope, league_url[0], profile="default")
+    try:
+        with TestClient(app) as c:
+            yield c
+    finally:
+        app.dependency_overrides.clear()
+
+
+def _lines(body: bytes):
+    return [json.loads(line) for line in body.decode().splitlines()]
+
+
+def test_export_players_ndjson_matches_list_endpoint(client, league_url):
+    r = client.get("/export/players", headers={"Accept-Encoding": "identity"})
+    assert r.status_code == 200
+    assert r.headers["content-type"] == "application/x-ndjson"
+    assert "content-encoding" not in r.headers and r.headers["ETag"]
+    rows = _lines(r.content)
+    assert len(rows) == league_url[1]["players"]
+    assert rows == client.get("/players").json()
+
+
+def test_export_every_resource(client):
+    for resource in api.ExportResource:
+        r = client.get(f"/export/{resource.value}", headers={"Accept-Encoding": "identity"})
+        assert r.status_code == 200 and _lines(r.content), resource
+    stats = _lines(client.get("/export/season-stats").content)
+    assert stats[0]["pass_yds"] == 250
+    assert client.get("/export/coaches").status_code == 422
+
+
+def test_export_gzip_when_accepted(client):
+    plain = client.get("/export/players", headers={"Accept-Encoding": "identity"}).content
+    with client.stream("GET", "/export/players", headers={"Accept-Encoding": "gzip"}) as r:
+        assert r.headers["content-encoding"] == "gzip"
+        raw = b"".join(r.iter_raw())
+    assert gzip.decompress(raw) == plain and len(raw) * 3 < len(plain)
+    assert not api._accepts_gzip("gzip;q=0, identity")
+    assert api._accepts_gzip("br, gzip;q=0.5")
+
+
+@pytest.mark.asyncio
+async def test_export_streams_in_chunks(league_url, monkeypatch):
+    # the test clients buffer bodies, so drive the generator directly
+    monkeypatch.setattr(api, "EXPORT_CHUNK_ROWS", 25)
+    scope = partial(async_session_scope, league_url[0], profile="default")
+    chunks = [c async for c in api._ndjson_stream(scope, Player, api.PlayerDTO, compress=False)]
+    assert len(chunks) == -(-league_url[1]["players"] // 25)
+    assert all(len(_lines(c)) <= 25 for c in chunks)
+
+
+@pytest.mark.asyncio
+async def test_export_session_spans_the_body(league_url):
+    events = []
+
+    @asynccontextmanager
+    async def scope():
+        async with async_session_scope(league_url[0], profile="default") as session:
+            events.append("open")
+            yield session
+        events.append("closed")
+
+    stream = api._ndjson_stream(scope, Player, api.PlayerDTO, compress=False)
+    assert events == []                         # nothing opened before the body starts
+    chunks = [c async for c in stream]
+    assert events == ["open", "closed"] and len(_lines(b"".join(chunks))) == league_url[1]["players"]
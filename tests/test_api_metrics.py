@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import logging
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.ui import metrics
+from app.ui.api import app
+from app.models.database import Base
+from app.models.async_database import async_session_scope, get_async_session
+from app.models import Conference, Division, Player, Team
+
+
+@pytest.fixture
+def client(tmp_path):
+    url = f"sqlite:///{tmp_path / 'metrics.db'}"
+    engine = create_engine(url, future=True)
+    Base.metadata.create_all(engine)
+    with Session(engine) as s:
+        for i in range(3):
+            t = Team(location_name=f"M{i}", nickname="Etrics", conference=Conference.AFC, division=Division.EAST)
+            s.add(t)
+            s.flush()
+            s.add(Player(team_id=t.id, first_name="M", last_name=str(i), position="QB", jersey=1, age=22))
+        s.commit()
+    engine.dispose()
+
+    async def _override():
+        async with async_session_scope(url, profile="default") as db:
+            yield db
+
+    app.dependency_overrides[get_async_session] = _override
+    try:
+        with TestClient(app) as c:
+            yield c
+    finally:
+        app.dependency_overrides.clear()
+
+
+def test_route_latency_size_and_sql_counts(client, monkeypatch):
+    labels = ("GET", "/teams/{team_id}/bundle")
+    # warm the cached data versions behind the ETag, so each request is just the bundle's SELECTs
+    monkeypatch.setattr(settings, "etag_ttl_ms", 60_000)
+    client.get("/teams/1/bundle")
+    before = (metrics.LATENCY.count(labels), metrics.DB_QUERIES.sum(labels[1:]),
+              metrics.REQUESTS.value(labels + ("200",)))
+    r1 = client.get("/teams/1/bundle")
+    r2 = client.get("/teams/2/bundle")
+
+    assert metrics.LATENCY.count(labels) == before[0] + 2
+    assert metrics.REQUESTS.value(labels + ("200",)) == before[2] + 2
+    assert metrics.DB_QUERIES.sum(labels[1:]) == before[1] + 2 * 3   # bundle = 3 SELECTs
+    assert metrics.RESPONSE_SIZE.sum(labels) >= len(r1.content) + len(r2.content)
+    assert metrics.IN_FLIGHT.value() == 0
+
+    client.get("/no/such/path")
+    assert metrics.REQUESTS.value(("GET", "unmatched", "404")) >= 1
+
+
+def test_metrics_endpoint_is_prometheus_text(client):
+    client.get("/players")
+    r = client.get("/metrics")
+    assert r.status_code == 200 and r.headers["content-type"].startswith("text/plain; version=0.0.4")
+    text = r.text
+    assert "# TYPE http_request_duration_seconds histogram" in text
+    assert 'http_request_duration_seconds_bucket{method="GET",route="/players",le="+Inf"}' in text
+    assert 'db_statements_per_request_count{route="/players"}' in text
+    assert "http_requests_in_flight 1" in text   # the /metrics request itself
+
+
+def test_slow_request_log_shows_sql(client, monkeypatch, caplog):
+    middleware = next(m for m in app.user_middleware if m.cls is metrics.MetricsMiddleware)
+    monkeypatch.setitem(middleware.kwargs, "slow_request_ms", 0.0001)
+    app.middleware_stack = None   # rebuild with the new threshold
+    try:
+        monkeypatch.setattr(settings, "etag_ttl_ms", 60_000)
+        with TestClient(app) as c, caplog.at_level(logging.WARNING, logger="franchise.api.slow"):
+            c.get("/teams/1/bundle")   # warms the cached data versions
+            c.get("/teams/1/bundle")
+    finally:
+        app.middleware_stack = None
+    record = [r for r in caplog.records if "/teams/{team_id}/bundle" in r.getMessage()][-1]
+    assert "3 SQL statement(s)" in record.getMessage() and "SELECT depth_charts." in record.getMessage()
+
+
+def test_failed_statement_leaves_no_timer_behind():
+    engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+    stats = metrics.RequestSQL()
+    token = metrics._current.set(stats)
+    try:
+        with engine.connect() as conn:
+            with pytest.raises(OperationalError):
+                conn.execute(text("SELECT * FROM no_such_table"))
+            conn.execute(text("SELECT 1"))
+            assert not [k for k in conn.info if k.startswith("metrics")]
+    finally:
+        metrics._current.reset(token)
+    assert stats.statements == 1 and 0 <= stats.seconds < 1
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, select, text
+from sqlalchemy.orm import Session
+
+from app.ui.api import app
+from app.ui.pagination import NEXT_CURSOR_HEADER, after_key, encode_cursor
+from app.models.database import Base
+from app.models.async_database import async_session_scope, get_async_session
+from app.models import Conference, Division, GameResult, Player, Team
+
+POSITIONS = ["QB", "RB", "WR", "TE", "LB", "CB"]
+
+
+@pytest.fixture(scope="module")
+def seeded(tmp_path_factory):
+    """4 teams x 15 players, 10 free agents, 2 seasons x 5 weeks x 2 games."""
+    url = f"sqlite:///{tmp_path_factory.mktemp('paging') / 'api.db'}"
+    engine = create_engine(url, future=True)
+    Base.metadata.create_all(engine)
+    with Session(engine) as s:
+        teams = [Team(location_name=f"Loc{i}", nickname=f"Nick{i}", conference=Conference.AFC,
+                      division=Division.EAST) for i in range(4)]
+        s.add_all(teams)
+        s.flush()
+        n = 0
+        for team_id in [t.id for t in teams] + [None]:
+            for j in range(15 if team_id else 10):
+                n += 1
+                s.add(Player(team_id=team_id, first_name="P", last_name=str(n), jersey=j + 1,
+                             position=POSITIONS[n % len(POSITIONS)], age=20 + n % 15,
+                             speed=n * 7 % 101, awareness=n * 13 % 101))
+        # insert weeks out of order so id order != (season, week) order
+        for season in (2026, 2025):
+            for week in (5, 1, 3, 2, 4):
+                for home, away in ((0, 1), (2, 3)):
+                    s.add(GameResult(season=season, week=week, home_team_id=teams[home].id,
+                                     away_team_id=teams[away].id, home_score=week, away_score=0))
+        s.commit()
+        players = s.scalars(select(Player).order_by(Player.id)).all()
+        games = s.scalars(select(GameResult)).all()
+        data = {"url": url, "players": players, "games": games, "teams": [t.id for t in teams]}
+    engine.dispose()
+    return data
+
+
+@pytest.fixture
+def client(seeded):
+    async def _override():
+        async with async_session_scope(seeded["url"], profile="default") as db:
+            yield db
+
+    app.dependency_overrides[get_async_session] = _override
+    try:
+        with TestClient(app) as c:
+            yield c
+    finally:
+        app.dependency_overrides.clear()
+
+
+def _all_pages(client, path, **params):
+    items, pages, cursor = [], 0, None
+    while True:
+        r = client.get(path, params={**params, **({"cursor": cursor} if cursor else {})})
+        assert r.status_code == 200, r.text
+        assert len(r.json()) <= params.get("limit", 100)
+        items += r.json()
+        pages += 1
+        cursor = r.headers.get(NEXT_CURSOR_HEADER)
+        if cursor is None:
+            return items, pages
+
+
+def test_players_page_through_in_id_order(client, seeded):
+    items, pages = _all_pages(client, "/players", limit=7)
+    assert [p["id"] for p in items] == [p.id for p in seeded["players"]]
+    assert pages == 10  # 70 players, 7 per page
+
+
+def test_players_filters_combine(client, seeded):
+    params = {"position": "wr", "min_age": 25, "max_age": 30, "min_rating": ["speed:40", "awareness:20"]}
+    items, _ = _all_pages(client, "/players", limit=3, **params)
+    expected = [p.id for p in seeded["players"]
+                if p.position == "WR" and 25 <= p.age <= 30 and p.speed >= 40 and p.awareness >= 20]
+    assert expected and [p["id"] for p in items] == expected
+
+    team = seeded["teams"][1]
+    items, _ = _all_pages(client, "/players", team_id=team, limit=4)
+    assert [p["id"] for p in items] == [p.id for p in seeded["players"] if p.team_id == team]
+
+
+def test_games_ordered_by_season_week_then_id(client, seeded):
+    def key(g):
+        return g.season, g.week, g.id
+
+    items, _ = _all_pages(client, "/games", limit=3)
+    assert [g["id"] for g in items] == [g.id for g in sorted(seeded["games"], key=key)]
+
+    items, _ = _all_pages(client, "/games", season=2025, limit=3)
+    assert [g["id"] for g in items] == [g.id for g in sorted(seeded["games"], key=key) if g.season == 2025]
+
+    team = seeded["teams"][3]
+    items, _ = _all_pages(client, "/games", season=2026, week=4, team_id=team, limit=1)
+    assert [(g["season"], g["week"], g["away_team_id"]) for g in items] == [(2026, 4, team)]
+
+
+def test_no_cursor_or_limit_returns_everything(client, seeded):
+    r = client.get("/players")
+    assert [p["id"] for p in r.json()] == [p.id for p in seeded["players"]]
+    assert NEXT_CURSOR_HEADER not in r.headers
+    assert len(client.get("/games", params={"season": 2025}).json()) == 10
+    assert len(client.get("/players", params={"limit": 5}).json()) == 5
+
+
+def test_bad_cursor_and_filters_rejected(client):
+    assert client.get("/players", params={"cursor": "not-a-cursor"}).status_code == 400
+    games_cursor = client.get("/games", params={"limit": 1}).headers[NEXT_CURSOR_HEADER]
+    assert client.get("/players", params={"cursor": games_cursor}).status_code == 400
+    assert client.get("/players", params={"min_rating": "salary:10"}).status_code == 400
+    assert client.get("/players", params={"limit": 0}).status_code == 422
+
+
+def test_next_page_seeks_the_index(seeded):
+    engine = create_engine(seeded["url"])
+    keys = (GameResult.season, GameResult.week, GameResult.id)
+    for stmt, ks, cursor_values in (
+        (select(GameResult), keys, [2025, 3, 10]),
+        (select(GameResult).where(GameResult.season == 2025), keys[1:], [3, 10]),
+        (select(Player).where(Player.position == "QB"), (Player.id,), [20]),
+    ):
+        sql = after_key(stmt, ks, encode_cursor(ks, cursor_values)).limit(10)
+        compiled = sql.compile(engine, compile_kwargs={"literal_binds": True})
+        with engine.connect() as conn:
+            plan = " ".join(r[-1] for r in conn.execute(text(f"EXPLAIN QUERY PLAN {compiled}")))
+        assert plan.startswith("SEARCH") and "TEMP B-TREE" not in plan, plan
+    engine.dispose()
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+
+from app.ui.api import app
+from app.ui.pagination import NEXT_CURSOR_HEADER
+from app.models.database import Base
+from app.models.async_database import async_session_scope, get_async_engine, get_async_session
+from app.models.dtos import PlayerDTO, parse_fields, projection_adapter
+from app.models import Conference, Division, Player, Team
+
+
+@pytest.fixture
+def client(tmp_path):
+    url = f"sqlite:///{tmp_path / 'api.db'}"
+    engine = create_engine(url, future=True)
+    Base.metadata.create_all(engine)
+    with Session(engine) as s:
+        t = Team(location_name="Proj", nickname="Ections", conference=Conference.NFC, division=Division.WEST)
+        s.add(t)
+        s.flush()
+        s.add_all(Player(team_id=t.id, first_name="F", last_name=f"L{j}", position="RB", jersey=j, age=22)
+                  for j in range(1, 26))
+        s.commit()
+    engine.dispose()
+
+    statements = []
+
+    async def _override():
+        async with async_session_scope(url, profile="default") as db:
+            yield db
+
+    app.dependency_overrides[get_async_session] = _override
+    try:
+        with TestClient(app) as c:
+            event.listen(get_async_engine(url, "default").sync_engine, "before_cursor_execute",
+                         lambda conn, cursor, stmt, *a: statements.append(stmt))
+            c.statements = statements
+            yield c
+    finally:
+        app.dependency_overrides.clear()
+
+
+def test_fields_limits_payload_and_sql_columns(client):
+    full = client.get("/players", params={"limit": 25})
+    client.statements.clear()
+    slim = client.get("/players", params={"limit": 25, "fields": "jersey,last_name,id"})
+    assert slim.status_code == 200
+    assert [list(p) for p in slim.json()] == [["id", "last_name", "jersey"]] * 25
+    assert [p["id"] for p in slim.json()] == [p["id"] for p in full.json()]
+    assert len(slim.content) * 3 < len(full.content)
+
+    select_sql = next(s for s in client.statements if s.startswith("SELECT"))
+    selected = select_sql.split("FROM")[0]
+    assert "players.last_name" in selected and "players.speed" not in selected
+
+
+def test_fields_pagination_without_id(client):
+    seen, cursor = [], None
+    while True:
+        params = {"fields": "jersey", "limit": 10, **({"cursor": cursor} if cursor else {})}
+        r = client.get("/players", params=params)
+        assert all(list(p) == ["jersey"] for p in r.json())
+        seen += [p["jersey"] for p in r.json()]
+        cursor = r.headers.get(NEXT_CURSOR_HEADER)
+        if cursor is None:
+            break
+    assert seen == list(range(1, 26))
+
+
+def test_unknown_field_rejected(client):
+    r = client.get("/players", params={"fields": "id,password"})
+    assert r.status_code == 400 and "password" in r.json()["detail"]
+
+
+def test_projection_adapter_cached_per_field_set():
+    a = projection_adapter(PlayerDTO, parse_fields(PlayerDTO, "position, id"))
+    b = projection_adapter(PlayerDTO, parse_fields(PlayerDTO, "id,position"))
+    assert a is b
+    assert a.dump_json([{"id": 1, "position": "QB"}]) == b'[{"id":1,"position":"QB"}]'
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import func, select, text
+from sqlalchemy.orm import Session
+
+from app.models.async_database import (
+    async_session_scope, async_url, dispose_async_engines, get_async_session, make_async_engine,
+)
+from app.models.database import Base, get_session, make_engine
+from app.models import Conference, Division, Player, Team
+from app.ui import api
+
+
+def test_async_url_swaps_driver():
+    assert async_url("sqlite:///x.db") == "sqlite+aiosqlite:///x.db"
+    assert async_url("sqlite+pysqlite:///:memory:") == "sqlite+aiosqlite:///:memory:"
+    assert async_url("sqlite+aiosqlite:///x.db") == "sqlite+aiosqlite:///x.db"
+    assert async_url("postgresql://u:p@h/db") == "postgresql+asyncpg://u:p@h/db"
+
+
+@pytest.mark.asyncio
+async def test_async_engine_applies_profile_pragmas(tmp_path):
+    engine = make_async_engine(f"sqlite:///{tmp_path / 'serve.db'}", profile="serve")
+    async with engine.connect() as conn:
+        assert str((await conn.execute(text("PRAGMA journal_mode"))).scalar()).lower() == "wal"
+        assert (await conn.execute(text("PRAGMA synchronous"))).scalar() == 1
+    await engine.dispose()
+
+
+def _seed(url: str, players_per_team: int = 20) -> None:
+    engine = make_engine(url, profile="default")
+    Base.metadata.create_all(engine)
+    with Session(engine) as s:
+        for i in range(2):
+            t = Team(location_name=f"Town{i}", nickname=f"Team{i}", conference=Conference.AFC,
+                     division=Division.EAST)
+            s.add(t)
+            s.flush()
+            s.add_all(Player(team_id=t.id, first_name="P", last_name=str(j), position="WR",
+                             jersey=j, age=23) for j in range(1, players_per_team + 1))
+        s.commit()
+    engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_async_session_scope_and_sync_helpers_share_a_database(tmp_path):
+    url = f"sqlite:///{tmp_path / 'shared.db'}"
+    _seed(url)
+    async with async_session_scope(url, profile="serve") as session:
+        assert await session.scalar(select(func.count()).select_from(Player)) == 40
+    await dispose_async_engines()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_on_async_endpoints(tmp_path):
+    url = f"sqlite:///{tmp_path / 'api.db'}"
+    _seed(url)
+    for endpoint in (api.list_teams, api.list_players, api.get_depth_chart, api.list_games):
+        assert inspect.iscoroutinefunction(endpoint)
+
+    async def _session():
+        async with async_session_scope(url, profile="serve") as db:
+            yield db
+
+    api.app.dependency_overrides[get_async_session] = _session
+    try:
+        transport = ASGITransport(app=api.app)
+        async with AsyncClient(transport=transport, base_url="http://test") as ac:
+            teams = (await ac.get("/teams")).json()
+            responses = await asyncio.gather(*(
+                ac.get(f"/players?team_id={teams[i % 2]['id']}") for i in range(50)
+            ))
+    finally:
+        api.app.dependency_overrides.clear()
+        await dispose_async_engines()
+
+    assert all(r.status_code == 200 for r in responses)
+    assert {len(r.json()) for r in responses} == {20}
+    assert get_session not in api.app.dependency_overrides  # sync helpers untouched
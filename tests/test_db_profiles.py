@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.models.database import Base, make_engine
+import app.models  # noqa: F401  (register tables)
+
+
+def _pragma(engine, name):
+    with engine.connect() as conn:
+        return conn.execute(text(f"PRAGMA {name}")).scalar()
+
+
+def test_serve_profile_applies_pragmas_on_every_connect(tmp_path):
+    engine = make_engine(f"sqlite:///{tmp_path / 'serve.db'}", profile="serve")
+    assert str(_pragma(engine, "journal_mode")).lower() == "wal"
+    assert _pragma(engine, "synchronous") == 1          # NORMAL
+    assert _pragma(engine, "cache_size") == -64 * 1024
+    assert _pragma(engine, "mmap_size") == 256 * 1024 * 1024
+
+    engine.dispose()  # brand-new DBAPI connection
+    assert _pragma(engine, "synchronous") == 1
+    engine.dispose()
+
+
+def test_bulk_load_profile_trades_durability_for_speed(tmp_path):
+    engine = make_engine(f"sqlite:///{tmp_path / 'bulk.db'}", profile="bulk-load")
+    assert str(_pragma(engine, "journal_mode")).lower() == "memory"
+    assert _pragma(engine, "synchronous") == 0          # OFF
+    engine.dispose()
+
+
+def test_test_profile_is_one_shared_in_memory_database():
+    engine = make_engine("sqlite:///ignored.db", profile="test")
+    Base.metadata.create_all(engine)
+    with engine.connect() as conn:  # another checkout sees the tables created above
+        assert conn.execute(text("SELECT count(*) FROM teams")).scalar() == 0
+    assert engine.url.database == ":memory:"
+
+
+def test_pool_settings_come_from_settings(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "db_pool_size", 3)
+    monkeypatch.setattr(settings, "db_max_overflow", 1)
+    engine = make_engine(f"sqlite:///{tmp_path / 'pool.db'}", profile="default")
+    assert (engine.pool.size(), engine.pool._max_overflow) == (3, 1)
+
+
+def test_unknown_profile_is_rejected(monkeypatch):
+    with pytest.raises(ValueError, match=r"'turbo'.*bulk-load, default, serve, test"):
+        make_engine(profile="turbo")
+    monkeypatch.setattr(settings, "db_profile", "sever")     # a misspelled DB_PROFILE
+    with pytest.raises(ValueError, match="'sever'"):
+        make_engine()
+
+
+def test_importer_clis_use_bulk_load_only_when_asked(monkeypatch):
+    from contextlib import contextmanager
+    from app.services.importer import bootstrap
+
+    profiles = []
+
+    @contextmanager
+    def session_scope(url=None, profile=None):
+        profiles.append(profile)
+        yield None
+
+    monkeypatch.setattr(bootstrap, "session_scope", session_scope)
+    monkeypatch.setattr(bootstrap, "create_db_and_tables", lambda: None)
+    monkeypatch.setattr(bootstrap, "generate_and_load", lambda session, **kwargs: {})
+    bootstrap.main(["--seed", "1"])
+    bootstrap.main(["--seed", "1", "--fast"])
+    assert profiles == [None, "bulk-load"]          # None = Settings.db_profile
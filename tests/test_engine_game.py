@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+
+from app.core.random import SeededRNG
+from app.engine import STAT_FIELDS, build_sheet, load_team_sheets, simulate_game
+from app.engine.game import N_STATS
+from app.engine.sheet import RATINGS, SLOT, SLOTS
+from app.models.database import Base
+from app.services.importer.bootstrap import generate_and_load
+from app.services.importer.schemas import POSITIONS
+
+
+def _sheet(team_id: int, rating: int, *, skip=()):
+    rows, ratings = [], {}
+    for i, pos in enumerate(POSITIONS):
+        if pos in skip:
+            continue
+        starter, backup = team_id * 100 + 2 * i, team_id * 100 + 2 * i + 1
+        rows.append((pos, starter, backup))
+        ratings[starter] = ratings[backup] = [rating] * len(RATINGS)
+    return build_sheet(team_id, rows, ratings)
+
+
+def _column(outcome, side, slot, field):
+    return outcome.stats[side][SLOT[slot] * N_STATS + STAT_FIELDS.index(field)]
+
+
+def test_same_seed_same_game():
+    home, away = _sheet(1, 70), _sheet(2, 65)
+    a = [simulate_game(home, away, SeededRNG(42)) for _ in range(3)]
+    assert len({(o.home_score, o.away_score, o.plays, o.stats[0].tobytes(), o.stats[1].tobytes()) for o in a}) == 1
+    others = {(o.home_score, o.away_score, o.plays)
+              for o in (simulate_game(home, away, SeededRNG(s)) for s in range(10))}
+    assert len(others) > 1
+
+
+def test_box_score_adds_up():
+    home, away = _sheet(1, 70), _sheet(2, 70)
+    rng = SeededRNG(7)
+    games = [simulate_game(home, away, rng) for _ in range(200)]
+    assert 90 < sum(g.plays for g in games) / len(games) < 160
+    assert 20 < sum(g.home_score + g.away_score for g in games) / len(games) < 60
+    for g in games:
+        for side in (0, 1):
+            receivers = ("WR1", "WR2", "TE1", "RB1")
+            assert _column(g, side, "QB1", "pass_cmp") == sum(_column(g, side, r, "rec_rec") for r in receivers)
+            assert _column(g, side, "QB1", "pass_yds") == sum(_column(g, side, r, "rec_yds") for r in receivers)
+            assert _column(g, side, "QB1", "pass_td") == sum(_column(g, side, r, "rec_td") for r in receivers)
+            assert _column(g, side, "QB1", "snaps") == g.plays - _column(g, 1 - side, "QB1", "snaps")
+        if g.winner_team_id is not None:
+            assert g.winner_team_id == (1 if g.home_score > g.away_score else 2)
+
+
+def test_better_team_wins_more():
+    strong, weak = _sheet(1, 85), _sheet(2, 45)
+    rng = SeededRNG(3)
+    wins = sum(simulate_game(strong, weak, rng).winner_team_id == 1 for _ in range(200))
+    assert wins > 150
+
+
+def test_empty_slots_play_as_replacements_and_earn_nothing():
+    home, away = _sheet(1, 70, skip=("RB", "K")), _sheet(2, 70)
+    assert home.player_ids[SLOT["RB1"]] is None
+    g = simulate_game(home, away, SeededRNG(1))
+    box = g.box_score()
+    assert _column(g, 0, "RB1", "rush_att") > 0           # a replacement carried the ball...
+    assert None not in box                                # ...but only real players get a line
+    assert set(box) <= set(home.player_ids + away.player_ids)
+    assert box[home.player_ids[SLOT["QB1"]]]["games"] == 1
+
+
+def test_sheets_load_in_two_queries_and_outlive_the_session():
+    engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    statements = []
+    with Session(engine) as session:
+        generate_and_load(session, seed=11, team_count=4, trusted=True)
+        event.listen(engine, "before_cursor_execute", lambda *a: statements.append(a[2]))
+        sheets = load_team_sheets(session, [1, 2, 3, 4])
+    engine.dispose()
+    assert len(statements) == 2
+    assert sorted(sheets) == [1, 2, 3, 4]
+    assert all(len(s.player_ids) == len(SLOTS) for s in sheets.values())
+
+    g = simulate_game(sheets[1], sheets[2], SeededRNG(5))   # no session, no database
+    assert {pid for _, pid, _ in g.player_lines()} <= set(sheets[1].player_ids + sheets[2].player_ids)
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import numpy as np
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app.engine.season import (
+    PLAYOFF_SEEDS, build_inputs, load_season_inputs, round_robin, simulate_seasons,
+)
+from app.models import GameResult
+from app.models.database import Base
+from app.services.importer.bootstrap import generate_and_load
+from app.services.importer.generator import DEFAULT_TEAMS
+
+
+def _league(strengths=None):
+    teams = [(i + 1, conf, div, 60.0 if strengths is None else strengths[i])
+             for i, (_, _, conf, div) in enumerate(DEFAULT_TEAMS)]
+    schedule = round_robin([t[0] for t in teams], 17)
+    return teams, [g for week in schedule for g in week]
+
+
+def test_round_robin_schedule():
+    schedule = round_robin(list(range(1, 33)), 17)
+    assert len(schedule) == 17 and all(len(week) == 16 for week in schedule)
+    for week in schedule:
+        assert sorted(t for g in week for t in g) == list(range(1, 33))
+    pairs = [frozenset(g) for week in schedule for g in week]
+    assert len(set(pairs)) == len(pairs)
+    odd = round_robin([1, 2, 3], 3)
+    assert all(len(week) == 1 for week in odd)
+
+
+def test_odds_are_consistent_probabilities():
+    teams, remaining = _league(list(np.random.default_rng(1).normal(60, 6, 32)))
+    odds = simulate_seasons(build_inputs(teams, remaining), 20_000, seed=3)
+    assert np.isclose(odds.playoffs.sum(), 2 * PLAYOFF_SEEDS)      # 7 seeds per conference
+    assert np.isclose(odds.division.sum(), 8)                     # one winner per division
+    assert np.allclose(odds.seeds.sum(axis=0), 2)
+    assert np.allclose(odds.seeds[:, :4].sum(axis=1), odds.division)   # top 4 seeds = division winners
+    assert np.isclose(odds.mean_wins.sum(), len(remaining))
+    strength = np.array([t[3] for t in teams])
+    assert np.corrcoef(strength, odds.playoffs)[0, 1] > 0.8
+
+
+def test_same_odds_for_any_worker_count():
+    teams, remaining = _league()
+    inputs = build_inputs(teams, remaining)
+    one = simulate_seasons(inputs, 3_000, seed=9, chunk_seasons=1_000)
+    two = simulate_seasons(inputs, 3_000, seed=9, chunk_seasons=1_000, workers=2)
+    assert np.array_equal(one.seeds, two.seeds) and np.array_equal(one.division, two.division)
+    assert not np.array_equal(one.seeds, simulate_seasons(inputs, 3_000, seed=10, chunk_seasons=1_000).seeds)
+
+
+def test_clinched_and_eliminated():
+    # one team has beaten its division rivals 15 times, with a week to go
+    teams, _ = _league()
+    rivals = [t[0] for t in teams if (t[1], t[2]) == (teams[0][1], teams[0][2])]
+    played = [(rivals[0], other, 30, 0) for other in rivals[1:] for _ in range(5)]
+    last_week = round_robin([t[0] for t in teams], 1)[0]
+    odds = simulate_seasons(build_inputs(teams, last_week, played), 2_000, seed=1).by_team()
+    assert odds[rivals[0]]["division"] == 1.0
+    assert all(odds[r]["division"] == 0.0 for r in rivals[1:])
+
+
+def test_inputs_from_database():
+    engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        generate_and_load(session, seed=5, team_count=8, trusted=True)
+        session.add(GameResult(season=2025, week=1, home_team_id=1, away_team_id=2,
+                               winner_team_id=1, home_score=24, away_score=10))
+        session.commit()
+        inputs = load_season_inputs(session, 2025, remaining=[(3, 4), (2, 1)])
+    assert list(inputs.team_ids) == list(range(1, 9))
+    assert inputs.wins[0] == 1 and inputs.wins[1] == 0
+    assert 0 < inputs.strength.min() <= inputs.strength.max() < 100
+    assert list(inputs.home) == [2, 1] and list(inputs.away) == [3, 0]
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import create_engine, event, select, update
+from sqlalchemy.orm import Session
+
+from app.engine import build_sheet, invalidate_strengths, strength_of, team_strengths
+from app.engine import strength
+from app.engine.game import UNITS
+from app.engine.sheet import RATINGS, REPLACEMENT_RATING
+from app.engine.strength import DEPTH_WEIGHT
+from app.models import DepthChart, Player
+from app.models.database import Base
+from app.services.importer.bootstrap import generate_and_load
+from app.services.importer.schemas import POSITIONS
+
+
+@pytest.fixture()
+def league():
+    engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *a: statements.append(a[2]))
+    with Session(engine) as session:
+        generate_and_load(session, seed=3, team_count=4, trusted=True)
+        session.commit()
+        statements.clear()
+        yield session, statements
+
+
+def _starting_qb(session, team_id):
+    return session.scalar(select(DepthChart.starter_player_id)
+                          .where(DepthChart.team_id == team_id, DepthChart.position == "QB"))
+
+
+def test_units_from_starters_and_backups():
+    rows = [(pos, 2 * i, 2 * i + 1) for i, pos in enumerate(POSITIONS)]
+    ratings = {pid: [60] * len(RATINGS) for _, s, b in rows for pid in (s, b)}
+    ratings[rows[0][2]] = [80] * len(RATINGS)              # QB2
+    strength = strength_of(build_sheet(1, rows, ratings))
+    assert strength.units["qb"] == pytest.approx(60 + 20 * DEPTH_WEIGHT)
+    assert all(strength.units[u] == pytest.approx(60) for u in UNITS if u != "qb")
+    assert strength.overall == pytest.approx(sum(strength.units.values()) / len(UNITS))
+    empty = strength_of(build_sheet(2, [], {}))
+    assert all(v == pytest.approx(REPLACEMENT_RATING) for v in empty.units.values()) and not empty.player_ids
+
+
+def test_cached_until_the_team_changes(league):
+    session, statements = league
+    first = team_strengths(session)
+    assert sorted(first) == [1, 2, 3, 4] and statements
+    statements.clear()
+    assert team_strengths(session, [2, 1]) == {1: first[1], 2: first[2]} and not statements
+
+    qb = session.get(Player, _starting_qb(session, 1))
+    qb.throw_accuracy = 99 if qb.throw_accuracy < 99 else 1
+    session.commit()
+    again = team_strengths(session)
+    assert again[1] is not first[1] and again[1].units["qb"] != first[1].units["qb"]
+    assert all(again[t] is first[t] for t in (2, 3, 4))
+
+    qb.morale = 1 if qb.morale != 1 else 2                  # not a rating: stays cached
+    session.commit()
+    assert team_strengths(session)[1] is again[1]
+
+
+def test_depth_chart_trade_and_rollback(league):
+    session, _ = league
+    before = team_strengths(session)
+    chart = session.scalars(select(DepthChart).where(DepthChart.team_id == 2, DepthChart.position == "QB")).one()
+    chart.starter_player_id, chart.backup_player_id = chart.backup_player_id, chart.starter_player_id
+    session.flush()
+    mid = team_strengths(session)
+    assert mid[2] is not before[2] and mid[1] is before[1]
+    assert 2 not in strength._cache[session.get_bind()]    # other sessions never get the uncommitted trade
+    session.rollback()
+    assert team_strengths(session)[2].units == before[2].units
+
+    player = session.get(Player, _starting_qb(session, 3))
+    player.team_id, player.jersey = 4, 0                     # still on team 3's chart
+    session.commit()
+    after = team_strengths(session)
+    assert after[3] is not before[3] and after[4] is not before[4] and after[1] is before[1]
+
+
+def test_bulk_and_manual_invalidation(league):
+    session, _ = league
+    before = team_strengths(session)
+    session.execute(update(Player).where(Player.team_id == 1).values(speed=0))
+    session.commit()
+    after = team_strengths(session)
+    assert all(after[t] is not before[t] for t in before)
+    assert after[1].units["coverage"] < before[1].units["coverage"]
+
+    conn = session.connection()                              # bypasses the session's tracking
+    conn.execute(update(Player.__table__).where(Player.team_id == 2).values(speed=0))
+    assert team_strengths(session)[2] is after[2]
+    invalidate_strengths(session, [2])
+    assert team_strengths(session)[2].units["coverage"] < after[2].units["coverage"]
+    session.rollback()
+
+
+def test_eviction_during_a_load_is_not_undone(league, monkeypatch):
+    session, statements = league
+    load = strength.load_team_sheets
+
+    def load_then_write(s, team_ids):
+        sheets = load(s, team_ids)
+        invalidate_strengths(s)                              # a commit lands mid-load
+        return sheets
+
+    monkeypatch.setattr(strength, "load_team_sheets", load_then_write)
+    first = team_strengths(session, [1, 2])
+    assert sorted(first) == [1, 2]
+    monkeypatch.setattr(strength, "load_team_sheets", load)
+    statements.clear()
+    again = team_strengths(session, [1, 2])
+    assert statements and again[1] is not first[1]           # reloaded, not served stale
+    statements.clear()
+    assert team_strengths(session, [1, 2]) == again and not statements
+
+
+def test_engines_do_not_share_entries(league):
+    session, _ = league
+    other = create_engine("sqlite+pysqlite:///:memory:", future=True)
+    Base.metadata.create_all(other)
+    with Session(other) as s:
+        generate_and_load(s, seed=4, team_count=4, trusted=True)
+        s.commit()
+        assert team_strengths(s)[1].units != team_strengths(session)[1].units
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import pickle
+
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.engine.season import round_robin
+from app.engine.week import LeagueWeek, WeekGame, game_seed, play_games, run_week, run_weeks
+from app.engine.sheet import SLOT, load_team_sheets
+from app.models import GameResult, PlayerSeasonStats
+from app.models.database import Base
+from app.models.versions import data_version
+from app.services.importer.bootstrap import generate_and_load
+
+
+def _league(seed: int, teams: int = 8) -> Session:
+    engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    session = Session(engine)
+    generate_and_load(session, seed=seed, team_count=teams, trusted=True)
+    return session
+
+
+def _key(o):
+    return o.home.team_id, o.away.team_id, o.home_score, o.away_score, o.plays, o.stats[0].tobytes(), o.stats[1].tobytes()
+
+
+def test_game_seed_depends_on_every_part():
+    base = game_seed(2025, 2025, 1, 3, 4)
+    assert base == game_seed(2025, 2025, 1, 3, 4)
+    variants = [game_seed(2026, 2025, 1, 3, 4), game_seed(2025, 2026, 1, 3, 4), game_seed(2025, 2025, 2, 3, 4),
+                game_seed(2025, 2025, 1, 4, 3), game_seed(2025, 2025, 1, 3, 5)]
+    assert len({base, *variants}) == 6
+    assert 0 <= base < 2 ** 64
+
+
+def test_results_do_not_depend_on_workers_or_order():
+    with _league(3) as session:
+        sheets = load_team_sheets(session, range(1, 9))
+    games = [WeekGame(7, 2025, 1, sheets[h], sheets[a]) for h, a in round_robin(list(range(1, 9)), 1)[0]]
+    assert len(pickle.dumps(games[0].home)) < 2048                  # what a worker receives per team
+
+    serial = [_key(o) for o in play_games(games)]
+    pooled = [_key(o) for o in play_games(games, workers=2, chunk_games=1)]
+    backwards = [_key(o) for o in play_games(games[::-1], workers=2, chunk_games=3)][::-1]
+    assert serial == pooled == backwards
+
+
+def test_run_week_writes_results_and_accumulates_stats():
+    session = _league(5)
+    schedule = round_robin(list(range(1, 9)), 2)
+    before = data_version(session, "game_results", "player_season_stats")
+
+    first = run_week(session, league_seed=1, season=2025, week=1, schedule=schedule[0])
+    second = run_week(session, league_seed=1, season=2025, week=2, schedule=schedule[1])
+    assert first["games"] == second["games"] == 4
+    assert first["stats_updated"] == 0 and second["stats_updated"] >= 8 * 18   # every starter played again
+    assert data_version(session, "game_results", "player_season_stats") == tuple(v + 2 for v in before)
+
+    results = session.scalars(select(GameResult).order_by(GameResult.id)).all()
+    assert [(r.week, r.home_team_id, r.away_team_id) for r in results] == \
+        [(w + 1, h, a) for w, week in enumerate(schedule) for h, a in week]
+    for r in results:
+        assert r.winner_team_id in (None, r.home_team_id, r.away_team_id)
+
+    qb = load_team_sheets(session, [1])[1].player_ids[SLOT["QB1"]]
+    line = session.scalars(select(PlayerSeasonStats).where(PlayerSeasonStats.player_id == qb)).one()
+    assert line.games == 2 and line.pass_att > 0
+    passing = session.scalar(select(func.sum(PlayerSeasonStats.pass_cmp)))
+    catching = session.scalar(select(func.sum(PlayerSeasonStats.rec_rec)))
+    assert passing == catching
+    session.close()
+
+
+def test_run_weeks_batches_leagues_in_one_pool():
+    a, b = _league(11), _league(12)
+    week = round_robin(list(range(1, 9)), 1)[0]
+    summaries = run_weeks([LeagueWeek(a, 1, 2025, 1, week), LeagueWeek(b, 2, 2025, 1, week)], workers=2)
+    assert [s["games"] for s in summaries] == [4, 4]
+
+    alone = _league(12)
+    run_week(alone, league_seed=2, season=2025, week=1, schedule=week)
+
+    def scores(s):
+        return s.execute(select(GameResult.home_score, GameResult.away_score).order_by(GameResult.id)).all()
+
+    assert scores(b) == scores(alone)                                 # batching changes nothing
+    for s in (a, b, alone):
+        s.close()
+
+
+def test_a_week_is_written_once():
+    session = _league(6)
+    week = round_robin(list(range(1, 9)), 1)[0]
+    run_week(session, league_seed=1, season=2025, week=1, schedule=week)
+
+    def totals():
+        return (session.scalar(select(func.count(GameResult.id))),
+                session.scalar(select(func.sum(PlayerSeasonStats.games))))
+
+    before = totals()
+    with pytest.raises(ValueError, match=r"week 1 already has results for teams \[1, 8\]"):
+        run_week(session, league_seed=1, season=2025, week=1, schedule=[week[0]])
+    assert totals() == before
+
+    line = session.scalars(select(PlayerSeasonStats).limit(1)).one()
+    session.add(PlayerSeasonStats(season=line.season, team_id=line.team_id, player_id=line.player_id))
+    with pytest.raises(IntegrityError):
+        session.flush()
+    session.rollback()
+    session.close()
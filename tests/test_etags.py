@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event, insert, update
+from sqlalchemy.orm import Session
+
+from app.ui.api import app
+from app.models.database import Base
+from app.models.async_database import async_session_scope, get_async_engine, get_async_session
+from app.core.config import settings
+from app.models import versions
+from app.models.versions import data_version
+from app.models import Conference, DepthChart, Division, Player, Team
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+@pytest.fixture
+def env(tmp_path):
+    url = f"sqlite:///{tmp_path / 'etag.db'}"
+    engine = create_engine(url, future=True)
+    Base.metadata.create_all(engine)
+    with Session(engine) as s:
+        t = Team(location_name="Tag", nickname="Etags", conference=Conference.AFC, division=Division.EAST)
+        s.add(t)
+        s.flush()
+        s.add(Player(team_id=t.id, first_name="E", last_name="T", position="QB", jersey=1, age=30))
+        s.commit()
+
+    async def _override():
+        async with async_session_scope(url, profile="default") as db:
+            yield db
+
+    app.dependency_overrides[get_async_session] = _override
+    statements = []
+    try:
+        with TestClient(app) as c:
+            c.get("/health")
+            event.listen(get_async_engine(url, "default").sync_engine, "before_cursor_execute",
+                         lambda conn, cursor, stmt, *a: statements.append(stmt))
+            yield c, engine, statements, url
+    finally:
+        app.dependency_overrides.clear()
+        engine.dispose()
+
+
+def test_if_none_match_gets_304_without_queries(env):
+    client, _, statements, _ = env
+    first = client.get("/teams")
+    tag = first.headers["ETag"]
+    assert first.status_code == 200 and statements
+
+    statements.clear()
+    again = client.get("/teams", headers={"If-None-Match": tag})
+    assert again.status_code == 304 and again.content == b""
+    assert again.headers["ETag"] == tag
+    assert statements == []
+    assert client.get("/teams", headers={"If-None-Match": f'"other", W/{tag}'}).status_code == 304
+
+
+def test_commit_changes_only_the_touched_tables_tag(env):
+    client, engine, _, _ = env
+    teams_tag = client.get("/teams").headers["ETag"]
+    players_tag = client.get("/players").headers["ETag"]
+
+    with Session(engine) as s:
+        s.get(Player, 1).morale = 99
+        s.commit()
+
+    assert client.get("/teams", headers={"If-None-Match": teams_tag}).status_code == 304
+    r = client.get("/players", headers={"If-None-Match": players_tag})
+    assert r.status_code == 200 and r.json()[0]["morale"] == 99
+    assert r.headers["ETag"] != players_tag
+    # the sparse-fieldset path returns its own Response but keeps the ETag
+    assert client.get("/players?fields=id").headers["ETag"] == r.headers["ETag"]
+
+
+def test_core_dml_and_rollbacks(env):
+    _, engine, _, _ = env
+    before = data_version(engine, "players", "depth_charts")
+    with Session(engine) as s:
+        s.execute(update(Player).where(Player.id == 1).values(morale=10))
+        s.rollback()
+    assert data_version(engine, "players", "depth_charts") == before
+
+    with Session(engine) as s:
+        s.execute(insert(DepthChart.__table__).values(team_id=1, position="QB", starter_player_id=1))
+        s.commit()
+    assert data_version(engine, "players", "depth_charts") == (before[0], before[1] + 1)
+
+
+def test_deleting_a_team_bumps_cascading_tables(env):
+    _, engine, _, _ = env
+    before = data_version(engine, "teams", "players", "game_results")
+    with Session(engine) as s:
+        s.delete(s.get(Team, 1))
+        s.commit()
+    after = data_version(engine, "teams", "players", "game_results")
+    assert all(a > b for a, b in zip(after, before))
+
+
+_WRITER_SCRIPT = """
+import sys
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from app.models import Player
+with Session(create_engine(sys.argv[1])) as s:
+    s.get(Player, 1).morale = 42
+    s.commit()
+"""
+
+
+def test_another_process_writing_changes_the_tag(env, monkeypatch):
+    client, engine, _, url = env
+    tag = client.get("/players").headers["ETag"]
+
+    env_vars = dict(os.environ, PYTHONPATH=str(ROOT))
+    subprocess.run([sys.executable, "-c", _WRITER_SCRIPT, url], cwd=ROOT, env=env_vars, check=True)
+    # within the TTL this process may still serve its cached versions
+    monkeypatch.setattr(settings, "etag_ttl_ms", 0)
+    r = client.get("/players", headers={"If-None-Match": tag})
+    assert r.status_code == 200 and r.json()[0]["morale"] == 42
+    assert r.headers["ETag"] != tag
+
+    # every worker reads the same versions: a cold cache computes the same tag
+    versions._cache.clear()
+    assert client.get("/players").headers["ETag"] == r.headers["ETag"]
+    assert data_version(engine, "players") == (2,)
@@ -0,0 +1,93 @@
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.models.database import Base
+from app.models import Conference, DepthChart, Division, GameResult, Player, Team
+from app.models.validation import pending_by_model, skip_flush_validation
+
+POSITIONS = ["QB", "RB", "WR", "TE", "OL", "DL", "LB", "CB", "S", "K", "P"]
+
+
+def _session():
+    engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine, class_=Session)()
+
+
+def _league(s, n_teams=3):
+    """Committed teams with two players per position; returns {team_id: [player ids]}."""
+    teams = [Team(location_name=f"Loc{i}", nickname=f"Nick{i}", conference=Conference.AFC,
+                  division=Division.EAST) for i in range(n_teams)]
+    s.add_all(teams)
+    s.flush()
+    rosters = {}
+    for t in teams:
+        players = [Player(team_id=t.id, first_name="A", last_name=pos, position=pos, jersey=j, age=25)
+                   for j, pos in enumerate(POSITIONS * 2, start=1)]
+        s.add_all(players)
+        s.flush()
+        rosters[t.id] = [p.id for p in players]
+    s.commit()  # expires everything: validators can't answer from memory
+    return rosters
+
+
+def _count_selects(s):
+    seen = []
+    event.listen(s.get_bind(), "before_cursor_execute",
+                 lambda conn, cursor, stmt, *a: seen.append(stmt) if stmt.startswith("SELECT") else None)
+    return seen
+
+
+def test_depth_rows_validated_with_one_query():
+    with _session() as s:
+        rosters = _league(s)
+        for team_id, ids in rosters.items():
+            s.add_all(DepthChart(team_id=team_id, position=pos, starter_player_id=ids[i],
+                                 backup_player_id=ids[i + len(POSITIONS)])
+                      for i, pos in enumerate(POSITIONS))
+        selects = _count_selects(s)
+        s.flush()
+        assert len(selects) == 1 and "FROM players" in selects[0]
+
+
+def test_unflushed_team_change_is_seen():
+    with _session() as s:
+        rosters = _league(s, n_teams=2)
+        (t1, ids1), (t2, _) = rosters.items()
+        moved = s.get(Player, ids1[1])
+        moved.team_id = t2
+        s.add(DepthChart(team_id=t1, position="QB", starter_player_id=ids1[0], backup_player_id=moved.id))
+        with pytest.raises(ValueError, match="backup_player must belong to the same team"):
+            s.flush()
+
+
+def test_missing_player_rejected():
+    with _session() as s:
+        rosters = _league(s, n_teams=1)
+        (t1, _), = rosters.items()
+        s.add(DepthChart(team_id=t1, position="QB", starter_player_id=10_000))
+        with pytest.raises(ValueError, match="starter_player must belong to the same team"):
+            s.flush()
+
+
+def test_skip_flush_validation_is_scoped():
+    with _session() as s:
+        rosters = _league(s, n_teams=2)
+        (t1, _), (t2, ids2) = rosters.items()
+        s.add(GameResult(season=2025, week=1, home_team_id=t1, away_team_id=t2,
+                         home_score=0, away_score=0, winner_team_id=t1))
+        s.add(DepthChart(team_id=t1, position="QB", starter_player_id=ids2[0]))
+        with skip_flush_validation(s, DepthChart):
+            assert list(pending_by_model(s)) == [GameResult]
+            s.flush()  # the cross-team row goes through
+
+        s.add(DepthChart(team_id=t1, position="RB", starter_player_id=ids2[1]))
+        with pytest.raises(ValueError, match="starter_player must belong"):
+            s.flush()
+        s.rollback()
+
+        with skip_flush_validation(s):
+            s.add(GameResult(season=2025, week=2, home_team_id=t1, away_team_id=t2,
+                             home_score=3, away_score=0, winner_team_id=t1))
+            assert pending_by_model(s) == {}
@@ -0,0 +1,45 @@
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.models.database import Base
+from app.models import DepthChart, Player, Team
+from app.services.importer.bootstrap import generate_and_load
+from app.services.importer.generator import make_league
+from app.services.importer.ingest import import_roster
+
+
+def _session():
+    engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine, class_=Session)()
+
+
+def _dump(s):
+    return s.execute(
+        select(Team.location_name, Player.first_name, Player.position, Player.jersey, Player.speed,
+               Player.injury_proneness)
+        .outerjoin(Team, Player.team_id == Team.id).order_by(Player.id)
+    ).all()
+
+
+def test_generate_and_load_matches_generate_then_import():
+    teams, players, depth = make_league(seed=41, team_count=5, free_agents=7)
+    with _session() as s:
+        import_roster(s, teams=teams, players=players, depth_chart=depth)
+        expected = _dump(s)
+
+    for trusted in (False, True):
+        with _session() as s:
+            res = generate_and_load(s, seed=41, team_count=5, free_agents=7, trusted=trusted, block_teams=2)
+            assert _dump(s) == expected
+            assert s.scalar(select(func.count()).select_from(DepthChart)) == 5 * 12
+        assert res == {"created": 5 + 5 * 53 + 7 + 5 * 12, "updated": 0, "skipped": 0,
+                       "teams": 5, "players": 5 * 53 + 7}
+
+
+def test_generate_and_load_rerun_updates_in_place():
+    with _session() as s:
+        generate_and_load(s, seed=42, team_count=3, trusted=True)
+        again = generate_and_load(s, seed=42, team_count=3, trusted=True)
+        assert again["created"] == 0
+        assert s.scalar(select(func.count()).select_from(Player)) == 3 * 53
@@ -0,0 +1,71 @@
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.models.database import Base
+from app.models import Player
+from app.services.importer.columnar import (
+    PlayerValidationError, load_players_columnar, read_player_columns, validate_player_columns,
+)
+from app.services.importer.generator import make_league, write_csvs
+from app.services.importer.ingest import _load_csv_players, import_roster
+
+
+def test_columnar_rows_match_pydantic_loader(tmp_path):
+    write_csvs(str(tmp_path), *make_league(seed=11, team_count=2, free_agents=5))
+    path = str(tmp_path / "players.csv")
+
+    expected = _load_csv_players(path)
+    rows = load_players_columnar(path)
+    assert len(rows) == len(expected)
+    for row, model in zip(rows, expected):
+        assert row._asdict() == {k: getattr(model, k) for k in row._fields}
+
+
+def test_columnar_reports_every_bad_row_with_line_numbers(tmp_path):
+    teams, players, depth = make_league(seed=12, team_count=1)
+    players[0].age = 17
+    players[3].speed = 101
+    players[3].morale = -1
+    write_csvs(str(tmp_path), teams, players, depth)
+    path = tmp_path / "players.csv"
+    text = path.read_text(encoding="utf-8").splitlines()
+    text[6] = text[6].replace(f",{players[5].position},", ",XX,", 1)
+    text.append("Short,Row,QB")
+    path.write_text("\n".join(text) + "\n", encoding="utf-8")
+
+    with pytest.raises(PlayerValidationError) as exc:
+        validate_player_columns(read_player_columns(str(path)))
+    found = {(line, name) for line, name, _ in exc.value.errors}
+    assert found == {
+        (2, "age"), (5, "speed"), (5, "morale"), (7, "position"), (len(text), ""),
+    }
+    assert "line 5: speed 101 out of 0..100" in str(exc.value)
+
+
+def test_columnar_non_integer_cell_is_reported_once(tmp_path):
+    write_csvs(str(tmp_path), *make_league(seed=13, team_count=1))
+    path = tmp_path / "players.csv"
+    lines = path.read_text(encoding="utf-8").splitlines()
+    cells = lines[1].split(",")
+    cells[4] = "old"  # age
+    lines[1] = ",".join(cells)
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    with pytest.raises(PlayerValidationError) as exc:
+        validate_player_columns(read_player_columns(str(path)))
+    assert [(line, name) for line, name, _ in exc.value.errors] == [(2, "age")]
+
+
+def test_validated_rows_import_through_bulk_path(tmp_path):
+    teams, players, depth = make_league(seed=14, team_count=2)
+    write_csvs(str(tmp_path), teams, players, depth)
+    rows = load_players_columnar(str(tmp_path / "players.csv"))
+
+    engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    with sessionmaker(bind=engine, class_=Session)() as s:
+        res = import_roster(s, teams=teams, players=rows, depth_chart=depth, bulk=True, validated=True)
+        assert res["created"] == 2 + 106 + 24
+        first = s.scalar(select(Player).order_by(Player.id).limit(1))
+        assert (first.first_name, first.jersey) == (players[0].first_name, players[0].jersey)
@@ -0,0 +1,104 @@
+from sqlalchemy import create_engine, event, func, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.models.database import Base
+from app.models import DepthChart, ImportFingerprint, Player, Team
+from app.services.importer.delta import import_roster_incremental
+from app.services.importer.generator import make_league
+from app.services.importer.ingest import import_roster
+
+
+def _engine_and_sessions():
+    engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    return engine, sessionmaker(bind=engine, autoflush=False, expire_on_commit=False, class_=Session)
+
+
+def _count_statements(engine):
+    stmts = []
+    event.listen(engine, "before_cursor_execute", lambda conn, cur, sql, *a: stmts.append(sql))
+    return stmts
+
+
+def test_incremental_rerun_writes_nothing():
+    engine, SessionLocal = _engine_and_sessions()
+    teams, players, depth = make_league(seed=21, team_count=2, free_agents=3)
+
+    with SessionLocal() as s:
+        first = import_roster_incremental(s, teams=teams, players=players, depth_chart=depth)
+    assert first["created"] == 2 + 106 + 3 + 24
+    assert len(first["diff"]["player"]["new"]) == 109
+
+    stmts = _count_statements(engine)
+    with SessionLocal() as s:
+        again = import_roster_incremental(s, teams=teams, players=players, depth_chart=depth)
+        assert s.scalar(select(func.count()).select_from(Player)) == 109  # FAs not re-inserted
+    assert (again["created"], again["updated"], again["unchanged"]) == (0, 0, 2 + 109 + 24)
+    assert not [sql for sql in stmts if not sql.lstrip().upper().startswith("SELECT")]
+
+
+def test_incremental_touches_only_changed_rows():
+    engine, SessionLocal = _engine_and_sessions()
+    teams, players, depth = make_league(seed=22, team_count=2, free_agents=2)
+    with SessionLocal() as s:
+        import_roster_incremental(s, teams=teams, players=players, depth_chart=depth)
+
+    players[5].speed = 99 if players[5].speed != 99 else 98
+    players[-1].morale = 1                      # a free agent
+    teams[1].cap_space += 1
+    depth = depth[1:]                           # first depth row disappears from the input
+
+    stmts = _count_statements(engine)
+    with SessionLocal() as s:
+        res = import_roster_incremental(s, teams=teams, players=players, depth_chart=depth)
+        fa = s.scalar(select(Player).where(Player.team_id.is_(None), Player.morale == 1))
+        assert fa is not None
+        assert s.scalar(select(func.count()).select_from(Player)) == 108
+        # nothing is deleted, only reported
+        assert s.scalar(select(func.count()).select_from(DepthChart)) == 24
+
+    assert res["updated"] == 3 and res["created"] == 0
+    assert res["diff"]["team"]["changed"] == [f"{teams[1].location_name}|{teams[1].nickname}"]
+    assert len(res["diff"]["player"]["changed"]) == 2
+    assert res["diff"]["depth"]["missing"] == [f"{depth[0].team_key}#QB"]
+    assert len(stmts) < 20
+
+
+def test_incremental_adopts_free_agents_from_full_import():
+    _, SessionLocal = _engine_and_sessions()
+    teams, players, depth = make_league(seed=23, team_count=1, free_agents=4)
+    with SessionLocal() as s:
+        import_roster(s, teams=teams, players=players, depth_chart=depth, bulk=True)
+        res = import_roster_incremental(s, teams=teams, players=players, depth_chart=depth)
+        assert res["created"] == 0
+        assert s.scalar(select(func.count()).select_from(Player)) == 53 + 4
+        assert s.scalar(select(func.count()).select_from(ImportFingerprint)) == 1 + 57 + 12
+        assert s.scalar(select(func.count()).select_from(Team)) == 1
+
+
+def test_cli_skips_files_whose_digest_matches(tmp_path, monkeypatch):
+    from contextlib import contextmanager
+    from app.services.importer import delta
+    from app.services.importer.generator import write_csvs
+
+    _, SessionLocal = _engine_and_sessions()
+
+    @contextmanager
+    def session_scope(**kwargs):
+        with SessionLocal() as s:
+            yield s
+            s.commit()
+
+    monkeypatch.setattr(delta, "session_scope", session_scope)
+    monkeypatch.setattr(delta, "create_db_and_tables", lambda: None)
+
+    teams, players, depth = make_league(seed=24, team_count=1)
+    write_csvs(str(tmp_path), teams, players, depth)
+    first = delta.cli_import_incremental(str(tmp_path))
+    assert first["files_skipped"] == [] and first["created"] == 1 + 53 + 12
+
+    players[0].age += 1
+    write_csvs(str(tmp_path), teams, players, depth)
+    second = delta.cli_import_incremental(str(tmp_path))
+    assert second["files_skipped"] == ["depth_chart.csv", "teams.csv"]
+    assert second["updated"] == 1 and set(second["diff"]) == {"player"}
@@ -30,3 +30,33 @@ def test_generator_determinism_and_counts():
     team_key = f"{teams1[0].location_name}|{teams1[0].nickname}"
     jerseys = [p.jersey for p in players1 if p.team_key == team_key]
     assert len(jerseys) == len(set(jerseys))
+
+
+def test_generator_sharding_is_worker_count_independent():
+    from app.services.importer.generator import generate_team_block
+
+    single = make_league(seed=77, team_count=6, free_agents=4)
+    sharded = make_league(seed=77, team_count=6, free_agents=4, workers=3)
+    assert [p.model_dump() for p in single[1]] == [p.model_dump() for p in sharded[1]]
+    assert [d.model_dump() for d in single[2]] == [d.model_dump() for d in sharded[2]]
+
+    # a shard starting mid-league draws exactly what the full run drew for those teams
+    full, _ = generate_team_block(77, 0, 6, DEFAULT_ROSTER_SIZES)
+    tail, _ = generate_team_block(77, 4, 6, DEFAULT_ROSTER_SIZES)
+    per_team = sum(DEFAULT_ROSTER_SIZES.values())
+    for name, values in tail.items():
+        assert (full[name][4 * per_team:] == values).all()
+
+
+def test_generator_rows_match_models_and_team_keys_stay_unique():
+    teams, players, depth = make_league(seed=5, team_count=70, free_agents=3)
+    rows = make_league(seed=5, team_count=70, free_agents=3, rows=True)
+
+    keys = [t.natural_key for t in teams]
+    assert len(set(keys)) == 70
+    assert teams[32].location_name == f"{teams[0].location_name} 2"
+    assert teams[64].location_name == f"{teams[0].location_name} 3"
+    assert [r._asdict() for r in rows[0]] == [t.model_dump() for t in teams]
+    assert [r._asdict() for r in rows[1]] == [{k: getattr(p, k) for k in r._fields} for r, p in zip(rows[1], players)]
+    assert [r._asdict() for r in rows[2]] == [d.model_dump() for d in depth]
+    assert [p.team_key for p in players[-3:]] == ["FA|FA"] * 3
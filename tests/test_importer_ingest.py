@@ -54,7 +54,8 @@ def test_cross_team_depthchart_rejected():
 
         # Create a depth chart entry that points to jersey from another team
         # pick a jersey from team2 but attach under team1
-        jersey_from_team2 = next(p.jersey for p in players if p.team_key == tk2)
+        team1_jerseys = {p.jersey for p in players if p.team_key == tk1}
+        jersey_from_team2 = next(p.jersey for p in players if p.team_key == tk2 and p.jersey not in team1_jerseys)
         bad_depth = [d for d in depth if d.team_key == tk1][:1]
         bad_depth[0].starter_jersey = jersey_from_team2
 
@@ -76,3 +77,66 @@ def test_bad_rating_raises():
             assert "rating" in str(e)
         else:
             raise AssertionError("Expected ValueError for rating > 100")
+
+def _memory_session_factory():
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from app.models.database import Base
+
+    engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    return engine, sessionmaker(bind=engine, autoflush=False, expire_on_commit=False, class_=Session)
+
+def test_bulk_import_matches_orm_path():
+    from sqlalchemy import text
+
+    teams, players, depth = make_league(seed=7, team_count=3, free_agents=4)
+    dumps, summaries = [], []
+    for bulk in (False, True):
+        engine, SessionLocal = _memory_session_factory()
+        with SessionLocal() as session:
+            runs = [
+                import_roster(session, teams=teams, players=players, depth_chart=depth, bulk=bulk),
+                import_roster(session, teams=teams, players=players, depth_chart=depth, bulk=bulk),
+                import_roster(session, teams=teams, players=players, depth_chart=depth,
+                              bulk=bulk, upsert=False),
+            ]
+        summaries.append(runs)
+        with engine.connect() as conn:
+            dumps.append([
+                conn.execute(text(f"select * from {t} order by id")).all()
+                for t in ("players", "depth_charts")
+            ])
+    assert summaries[0] == summaries[1]
+    assert summaries[1][1] == {"created": 4, "updated": 3 + 3 * 53 + 3 * 12, "skipped": 0}
+    assert dumps[0] == dumps[1]
+
+def test_bulk_import_same_error_messages():
+    teams, players, depth = make_league(seed=8, team_count=2)
+    bad_depth = [d.model_copy(update={"starter_jersey": 100}) for d in depth[:1]]
+    messages = []
+    for bulk in (False, True):
+        _, SessionLocal = _memory_session_factory()
+        with SessionLocal() as session:
+            try:
+                import_roster(session, teams=teams, players=players, depth_chart=bad_depth, bulk=bulk)
+            except ValueError as e:
+                messages.append(str(e))
+            # the failed import rolled back completely
+            assert session.scalar(select(Team).limit(1)) is None
+    assert len(messages) == 2 and messages[0] == messages[1]
+    assert "starter jersey 100 not found on team" in messages[0]
+
+def test_same_starter_and_backup_rejected_on_both_paths():
+    teams, players, depth = make_league(seed=9, team_count=1)
+    bad_depth = [depth[0].model_copy(update={"backup_jersey": depth[0].starter_jersey})]
+    messages = []
+    for bulk in (False, True):
+        _, SessionLocal = _memory_session_factory()
+        with SessionLocal() as session:
+            try:
+                import_roster(session, teams=teams, players=players, depth_chart=bad_depth, bulk=bulk)
+            except ValueError as e:
+                messages.append(str(e))
+            assert session.scalar(select(DepthChart).limit(1)) is None
+    assert messages == ["starter and backup cannot be the same player"] * 2
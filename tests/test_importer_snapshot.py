@@ -0,0 +1,110 @@
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.models.database import Base
+from app.models import DepthChart, Player, Team
+from app.services.importer.generator import make_league, write_csvs, write_snapshot
+from app.services.importer.ingest import import_roster
+from app.services.importer import snapshot
+from app.services.importer.snapshot import LeagueSnapshot, csv_to_snapshot, import_snapshot
+
+
+def _session():
+    engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine, class_=Session)()
+
+
+def _dump(s):
+    players = s.execute(
+        select(Player.first_name, Player.last_name, Player.position, Player.jersey, Player.age,
+               Player.salary, Player.speed, Player.morale, Team.location_name)
+        .outerjoin(Team, Player.team_id == Team.id).order_by(Player.id)
+    ).all()
+    depth = s.execute(select(DepthChart.position, DepthChart.starter_player_id, DepthChart.backup_player_id)
+                      .order_by(DepthChart.id)).all()
+    return players, depth
+
+
+def test_snapshot_round_trips_league(tmp_path):
+    teams, players, depth = make_league(seed=31, team_count=2, free_agents=3)
+    depth[-1].backup_jersey = None
+    path = str(tmp_path / "league.ffsnap")
+    write_snapshot(path, teams, players, depth)
+
+    with LeagueSnapshot(path) as snap:
+        assert (snap.n_teams, snap.n_players, snap.n_depth) == (2, 109, 24)
+        assert [r._asdict() for r in snap.team_rows()] == [t.model_dump() for t in teams]
+        for row, p in zip(snap.player_rows(), players):
+            assert row._asdict() == {k: getattr(p, k) for k in row._fields}
+        assert [r._asdict() for r in snap.depth_rows()] == [d.model_dump() for d in depth]
+        assert snap.column("player.speed").format == "B"
+
+
+def test_snapshot_import_matches_csv_import(tmp_path):
+    league = make_league(seed=32, team_count=2, free_agents=2)
+    write_csvs(str(tmp_path), *league)
+    csv_to_snapshot(str(tmp_path), str(tmp_path / "league.ffsnap"))
+
+    with _session() as s:
+        res = import_snapshot(s, str(tmp_path / "league.ffsnap"))
+        from_snapshot = _dump(s)
+        assert s.scalar(select(func.count()).select_from(Player)) == 108
+    with _session() as s:
+        import_roster(s, teams=league[0], players=league[1], depth_chart=league[2])
+        assert _dump(s) == from_snapshot
+    assert res["created"] == 2 + 108 + 24
+
+
+def test_snapshot_validate_rejects_out_of_range_columns(tmp_path):
+    teams, players, depth = make_league(seed=33, team_count=1)
+    players[2].speed = 101        # fits in uint8, so only validate() catches it
+    players[4].age = 17
+    path = str(tmp_path / "league.ffsnap")
+    write_snapshot(path, teams, players, depth)
+
+    with LeagueSnapshot(path) as snap:
+        with pytest.raises(ValueError) as exc:
+            snap.validate()
+    assert "player row 3: speed 101 out of 0..100" in str(exc.value)
+    assert "player row 5: age 17 < 18" in str(exc.value)
+
+
+def test_write_rejects_values_the_columns_cannot_hold(tmp_path):
+    teams, players, depth = make_league(seed=34, team_count=1)
+    teams[0].power_rating = 300
+    with pytest.raises(ValueError, match=r"team.power_rating row 1: 300 does not fit"):
+        write_snapshot(str(tmp_path / "league.ffsnap"), teams, players, depth)
+
+
+def _column_offset(data: bytes, name: str) -> int:
+    _, _, n_columns = snapshot._HEADER.unpack_from(data, 0)
+    for i in range(n_columns):
+        entry = snapshot._HEADER.size + i * snapshot._DIR_ENTRY.size
+        raw_name, _, offset, _ = snapshot._DIR_ENTRY.unpack_from(data, entry)
+        if raw_name.rstrip(b"\x00").decode() == name:
+            return offset
+    raise KeyError(name)
+
+
+def test_snapshot_validate_rejects_bad_string_indexes(tmp_path):
+    path = tmp_path / "league.ffsnap"
+    write_snapshot(str(path), *make_league(seed=35, team_count=1))
+    with LeagueSnapshot(str(path)) as snap:
+        n_strings = len(snap.strings)
+    data = bytearray(path.read_bytes())
+    start = _column_offset(data, "player.last_name")
+    data[start + 4:start + 8] = (n_strings + 7).to_bytes(4, "little")   # player row 2
+    path.write_bytes(bytes(data))
+
+    with LeagueSnapshot(str(path)) as snap:
+        with pytest.raises(ValueError, match=rf"player.last_name row 2: string index {n_strings + 7} out of"):
+            snap.validate()
+
+
+def test_snapshot_rejects_foreign_file(tmp_path):
+    path = tmp_path / "teams.csv"
+    path.write_text("location_name,nickname\n" * 10, encoding="utf-8")
+    with pytest.raises(ValueError, match="not a league snapshot"):
+        LeagueSnapshot(str(path))
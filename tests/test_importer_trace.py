@@ -0,0 +1,68 @@
+import json
+import logging
+from contextlib import contextmanager
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.models.database import Base
+from app.services.importer import ingest
+from app.services.importer.generator import make_league, write_csvs
+from app.services.importer.ingest import import_roster
+from app.services.importer.trace import ImportTrace
+
+
+def _sessions():
+    engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine, class_=Session)
+
+
+def test_trace_reports_phases_statements_and_rows(caplog):
+    teams, players, depth = make_league(seed=51, team_count=2, free_agents=3)
+    traces = {}
+    for bulk in (False, True):
+        with _sessions()() as s, caplog.at_level(logging.INFO, logger="franchise.importer"):
+            res = import_roster(s, teams=teams, players=players, depth_chart=depth, bulk=bulk,
+                                trace=ImportTrace())
+        traces[bulk] = res["trace"]
+
+    orm, bulk = traces[False], traces[True]
+    assert (orm["strategy"], bulk["strategy"]) == ("orm", "bulk")
+    assert set(orm["phases"]) == {"validation", "teams", "players", "flush", "depth_chart", "commit"}
+    assert set(bulk["phases"]) == {"validation", "teams", "players", "depth_chart", "commit"}
+    assert bulk["phases"]["players"]["rows"] == len(players) == 109
+    assert bulk["phases"]["players"]["sql_rows"] == 109 + 1      # + its data_versions row
+    assert orm["phases"]["flush"]["statements"] > 0
+    # the ORM path issues per-row SELECTs; the bulk path a handful of statements
+    assert orm["statements"] > 10 * bulk["statements"]
+    assert bulk["statements"] == sum(p["statements"] for p in bulk["phases"].values())
+    assert "import phase=players" in caplog.text
+
+
+def test_untraced_import_keeps_plain_summary():
+    teams, players, depth = make_league(seed=52, team_count=1)
+    with _sessions()() as s:
+        res = import_roster(s, teams=teams, players=players, depth_chart=depth, bulk=True)
+    assert set(res) == {"created", "updated", "skipped"}
+
+
+def test_cli_writes_json_trace(tmp_path, monkeypatch):
+    SessionLocal = _sessions()
+
+    @contextmanager
+    def session_scope(**kwargs):
+        with SessionLocal() as s:
+            yield s
+
+    monkeypatch.setattr(ingest, "session_scope", session_scope)
+    monkeypatch.setattr(ingest, "create_db_and_tables", lambda: None)
+    write_csvs(str(tmp_path), *make_league(seed=53, team_count=1))
+
+    trace_file = tmp_path / "trace.json"
+    res = ingest.cli_import_from_dir(str(tmp_path), columnar=True, trace_file=str(trace_file))
+    data = json.loads(trace_file.read_text(encoding="utf-8"))
+    assert data == res["trace"]
+    assert data["strategy"] == "columnar"
+    assert data["phases"]["csv_parse"]["rows"] == 1 + 53 + 12
+    assert data["phases"]["validation"]["rows"] == 53
@@ -0,0 +1,101 @@
+import re
+
+import pytest
+from sqlalchemy import create_engine, func, select, text
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.models.database import Base, upgrade_schema
+from app.models import DepthChart, GameResult, Player, PlayerSeasonStats, Team
+
+
+def _engine():
+    engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+    Base.metadata.create_all(engine)
+    return engine
+
+
+def _plan(engine, stmt) -> str:
+    compiled = stmt.compile(engine, compile_kwargs={"literal_binds": True})
+    with engine.connect() as conn:
+        rows = conn.execute(text(f"EXPLAIN QUERY PLAN {compiled}")).all()
+    return "\n".join(r[-1] for r in rows)
+
+
+HOT_QUERIES = {
+    "player by team/jersey": (
+        select(Player.id).where(Player.team_id == 1, Player.jersey == 12), "players"),
+    "players by team list": (
+        select(Player.id, Player.team_id, Player.jersey).where(Player.team_id.in_([1, 2, 3])), "players"),
+    "players by age": (
+        select(Player.id).where(Player.age >= 25, Player.age <= 30), "players"),
+    "players by team/age": (
+        select(Player.id).where(Player.team_id == 1, Player.age >= 25), "players"),
+    "depth chart by team/position": (
+        select(DepthChart.id).where(DepthChart.team_id == 1, DepthChart.position == "QB"), "depth_charts"),
+    "games by season/week": (
+        select(GameResult).where(GameResult.season == 2025, GameResult.week == 3), "game_results"),
+    "games by season": (
+        select(GameResult).where(GameResult.season == 2025), "game_results"),
+    "season stats by player": (
+        select(PlayerSeasonStats).where(PlayerSeasonStats.season == 2025,
+                                        PlayerSeasonStats.player_id == 7), "player_season_stats"),
+    "season stats by team": (
+        select(PlayerSeasonStats).where(PlayerSeasonStats.season == 2025,
+                                        PlayerSeasonStats.team_id == 2), "player_season_stats"),
+}
+
+
+@pytest.mark.parametrize("name", sorted(HOT_QUERIES))
+def test_hot_queries_use_an_index(name):
+    stmt, table = HOT_QUERIES[name]
+    plan = _plan(_engine(), stmt)
+    assert not any(line.startswith(f"SCAN {table}") for line in plan.splitlines()), plan
+    assert re.search(r"USING (COVERING )?INDEX|USING (INTEGER )?PRIMARY KEY", plan), plan
+
+
+def _old_database():
+    """A database created before the index pack: same tables, none of the new indexes."""
+    engine = _engine()
+    with engine.begin() as conn:
+        for name in ("uq_players_team_jersey", "ix_game_results_season_week",
+                     "ix_player_season_stats_season_player", "ix_player_season_stats_season_team"):
+            conn.execute(text(f"DROP INDEX {name}"))
+    return engine
+
+
+def test_upgrade_schema_adds_missing_indexes():
+    engine = _old_database()
+    assert _plan(engine, HOT_QUERIES["games by season/week"][0]).startswith("SCAN game_results")
+
+    created = upgrade_schema(engine)
+    assert sorted(created) == ["ix_game_results_season_week", "ix_player_season_stats_season_player",
+                       "ix_player_season_stats_season_team", "uq_players_team_jersey"]
+    assert "ix_game_results_season_week" in _plan(engine, HOT_QUERIES["games by season/week"][0])
+    assert upgrade_schema(engine) == []
+
+
+def _player(team_id, jersey, last_name):
+    return Player(team_id=team_id, jersey=jersey, first_name="Pat", last_name=last_name,
+                  position="WR", age=25)
+
+
+def test_upgrade_schema_refuses_duplicate_jerseys():
+    engine = _old_database()
+    with sessionmaker(bind=engine, class_=Session)() as s:
+        team = Team(location_name="Dup", nickname="Dupes", conference="AFC", division="North")
+        s.add(team)
+        s.flush()
+        s.add_all([_player(team.id, 80, "One"), _player(team.id, 80, "Two"),
+                   _player(None, 11, "FreeA"), _player(None, 11, "FreeB")])
+        s.commit()
+
+    with pytest.raises(ValueError, match=r"uq_players_team_jersey.*\(1, 80\)"):
+        upgrade_schema(engine)
+
+
+def test_free_agents_may_share_a_jersey():
+    engine = _engine()
+    with sessionmaker(bind=engine, class_=Session)() as s:
+        s.add_all([_player(None, 11, "FreeA"), _player(None, 11, "FreeB")])
+        s.commit()
+        assert s.scalar(select(func.count()).select_from(Player)) == 2
@@ -11,3 +11,33 @@ def test_seed_default_config_smoke():
     r = SeededRNG()  # uses DEFAULT_SEED from settings
     n = r.randint(1, 10)
     assert 1 <= n <= 10
+
+def test_child_streams_ignore_consumption_order():
+    a, b = SeededRNG(seed=7), SeededRNG(seed=7)
+    a.randint(0, 100)                           # drawing from the parent...
+    a.uniform(1000)
+    b.child("team", 4).normal(10)               # ...or a sibling changes nothing
+    assert a.child("team", 3).randint(0, 10**9) == b.child("team", 3).randint(0, 10**9)
+    assert (a.child("team", 3).uniform(50) == b.child("team", 3).uniform(50)).all()
+    assert a.child("team", 3).key == a.child("team").child(3).key
+
+def test_child_streams_are_distinct():
+    r = SeededRNG(seed=7)
+    draws = {tuple(r.child(*path).uniform(4)) for path in [(), ("team",), ("team", 3), ("team", 4), (3,), ("game", 3)]}
+    assert len(draws) == 6
+    assert r.child("x").randint(0, 10**9) != SeededRNG(seed=8).child("x").randint(0, 10**9)
+
+def test_batched_draws():
+    r = SeededRNG(seed=11)
+    assert (r.uniform(1000, 2.0, 3.0) >= 2.0).all()
+    ints = r.integers([0, 10], [5, 20], size=(500, 2))
+    assert ints.shape == (500, 2) and ints[:, 0].max() < 5 and ints[:, 1].min() >= 10
+    assert abs(r.normal(20_000, loc=50, scale=5).mean() - 50) < 0.5
+    assert (SeededRNG(seed=11).uniform(1000, 2.0, 3.0) == SeededRNG(seed=11).uniform(1000, 2.0, 3.0)).all()
+
+def test_generator_blocks_jump_ahead():
+    r = SeededRNG(seed=3).child("plays")
+    block = r.generator(5).random(8)
+    assert (block == r.generator(5).random(8)).all()            # no need to draw blocks 0-4 first
+    assert not (block == r.generator(4).random(8)).any()
+    assert (r.generator(0).random(8) == SeededRNG(seed=3).child("plays").uniform(8)).all()
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event, text
+
+from app.models import database
+from app.models.database import create_db_and_tables, get_engine, schema_version
+from app.ui import api
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# Self time of our own modules (third-party imports excluded) when importing
+# the API; best of a few runs, override with IMPORT_BUDGET_MS on slow machines
+IMPORT_BUDGET_MS = float(os.environ.get("IMPORT_BUDGET_MS", 250))
+
+
+def _import_api(db_path: Path) -> subprocess.CompletedProcess:
+    code = ("import sys, app.ui.api\n"
+            "from app.models import database\n"
+            "print(sorted(m for m in ('sqlite3', 'aiosqlite') if m in sys.modules), len(database._engines))")
+    env = dict(os.environ, DATABASE_URL=f"sqlite:///{db_path}", PYTHONPATH=str(ROOT))
+    return subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=ROOT, env=env,
+                          capture_output=True, text=True, check=True)
+
+
+def _app_self_ms(importtime: str) -> float:
+    """Sum of self times (us -> ms) of app.* modules in -X importtime output."""
+    total = 0
+    for line in importtime.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        if name.strip().split(".")[0] == "app":
+            total += int(self_us)
+    return total / 1000
+
+
+def test_importing_the_api_touches_no_database(tmp_path):
+    db = tmp_path / "cold.db"
+    out = _import_api(db)
+    assert out.stdout.split() == ["[]", "0"]    # no driver imported, no engine built
+    assert not db.exists()
+
+
+def test_import_time_budget(tmp_path):
+    best = min(_app_self_ms(_import_api(tmp_path / "cold.db").stderr) for _ in range(3))
+    assert best < IMPORT_BUDGET_MS, f"app modules take {best:.0f} ms to import (budget {IMPORT_BUDGET_MS:.0f} ms)"
+
+
+def test_schema_marker_skips_repeat_bootstrap(tmp_path):
+    url = f"sqlite:///{tmp_path / 'marked.db'}"
+    assert create_db_and_tables(url) is True
+    engine = get_engine(url)
+    with engine.connect() as conn:
+        assert conn.execute(text("PRAGMA user_version")).scalar() == schema_version()
+
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *a: statements.append(a[2]))
+    assert create_db_and_tables(url) is False
+    assert statements == ["PRAGMA user_version"]
+
+    assert create_db_and_tables(url, force=True) is True
+    with engine.begin() as conn:
+        conn.execute(text("PRAGMA user_version = 0"))   # older (or unmarked) schema
+    assert create_db_and_tables(url) is True
+
+
+def test_lifespan_bootstraps_the_database(monkeypatch):
+    calls = []
+    monkeypatch.setattr(api, "create_db_and_tables", lambda: calls.append(1))
+    with TestClient(api.app) as client:
+        assert calls == [1]
+        assert client.get("/health").status_code == 200
+
+
+def test_bootstrap_failure_does_not_stop_startup(monkeypatch, caplog):
+    def boom():
+        raise RuntimeError("read-only filesystem")
+    monkeypatch.setattr(api, "create_db_and_tables", boom)
+    with TestClient(api.app) as client:
+        assert client.get("/health").status_code == 200
+    assert "database bootstrap failed" in caplog.text
+
+
+def test_engine_attribute_is_built_on_demand():
+    assert database.engine is get_engine()
+    assert database.SessionLocal.kw["bind"] is get_engine()